@@ -1,4 +1,14 @@
 from manim import *
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from liveMobjects import (
+    GrowingPath, RiemannSum, RefineRiemannSum,
+    LiveSegment, LivePolygon, LiveDot, LiveGraph, LiveSecantSlopeGroup,
+)
+from arcLength import point_from_proportion
+from curves import plot
 
 class SineCurveUnitCircle(Scene):
     # contributed by heejin_park, https://infograph.tistory.com/230
@@ -54,33 +64,24 @@ class SineCurveUnitCircle(Scene):
         def go_around_circle(mob, dt):
             self.t_offset += (dt * rate)
             # print(self.t_offset)
-            mob.move_to(orbit.point_from_proportion(self.t_offset % 1))
-
-        def get_line_to_circle():
-            return Line(origin_point, dot.get_center(), color=BLUE)
+            mob.move_to(point_from_proportion(orbit, self.t_offset % 1))
 
-        def get_line_to_curve():
+        def get_curve_point():
             x = self.curve_start[0] + self.t_offset * 4
             y = dot.get_center()[1]
-            return Line(dot.get_center(), np.array([x,y,0]), color=YELLOW_A, stroke_width=2 )
+            return np.array([x,y,0])
 
 
-        self.curve = VGroup()
-        self.curve.add(Line(self.curve_start,self.curve_start))
-        def get_curve():
-            last_line = self.curve[-1]
-            x = self.curve_start[0] + self.t_offset * 4
-            y = dot.get_center()[1]
-            new_line = Line(last_line.get_end(),np.array([x,y,0]), color=YELLOW_D)
-            self.curve.add(new_line)
-
-            return self.curve
+        # un solo path que crece, en vez de un Line nuevo por frame
+        self.curve = GrowingPath(self.curve_start, color=YELLOW_D)
+        def get_curve(curve):
+            curve.append_point(get_curve_point())
 
         dot.add_updater(go_around_circle)
 
-        origin_to_circle_line = always_redraw(get_line_to_circle)
-        dot_to_curve_line = always_redraw(get_line_to_curve)
-        sine_curve_line = always_redraw(get_curve)
+        origin_to_circle_line = LiveSegment(origin_point, dot, color=BLUE)
+        dot_to_curve_line = LiveSegment(dot, get_curve_point, color=YELLOW_A, stroke_width=2)
+        sine_curve_line = self.curve.add_updater(get_curve)
 
         self.add(dot)
         self.add(orbit, origin_to_circle_line, dot_to_curve_line, sine_curve_line)
@@ -105,28 +106,25 @@ class CalculusArea(Scene):
             x_range=[-5, 5], x_length=8, y_range=[-7, 7], y_length=7
         ).add_coordinates()
 
-        graph = axes.plot(
+        graph = plot(
+            axes,
             lambda x: 2*x**3, x_range=[-5, 5], color=YELLOW
         )
         self.add(axes, graph)
 
         dx_list = [1, 0.5, 0.3, 0.1, 0.05, 0.025, 0.01]
-        rectangles = VGroup(
-            *[
-                axes.get_riemann_rectangles(
-                    graph=graph,
-                    x_range=[-5, 5],
-                    stroke_width=0.1,
-                    stroke_color=WHITE,
-                    dx=dx, fill_opacity=0.7
-                )
-                for dx in dx_list
-            ]
+        # un solo mobject que recalcula los rectangulos para cada dx
+        area = RiemannSum(
+            axes,
+            graph,
+            x_range=[-5, 5],
+            stroke_width=0.1,
+            stroke_color=WHITE,
+            dx=dx_list[0], fill_opacity=0.7
         )
-        first_area = rectangles[0]
+        self.add(area)
         for k in range(1, len(dx_list)):
-            new_area = rectangles[k]
-            self.play(Transform(first_area, new_area), run_time=3)
+            self.play(RefineRiemannSum(area, dx_list[k]), run_time=3)
             self.wait(0.5)
 
         self.wait(3)
@@ -144,31 +142,28 @@ class CalculusArea(Scene):
         t = ValueTracker(5)
         k = 25
 
-        graph = ax.plot(
+        graph = plot(
+            ax,
             lambda x: k / x,
             color=YELLOW_D,
-            x_range=[k / 10, 10.0, 0.01],
+            x_range=[k / 10, 10.0],
+            # mas puntos donde la curva se dobla, sin elegir el paso a mano
+            adaptive=True,
             use_smoothing=False,
         )
 
         def get_rectangle():
-            polygon = Polygon(
-                *[
-                    ax.c2p(*i)
-                    for i in self.get_rectangle_corners(
-                        (0, 0), (t.get_value(), k / t.get_value())
-                    )
-                ]
-            )
-            polygon.stroke_width = 1
-            polygon.set_fill(BLUE, opacity=0.5)
-            polygon.set_stroke(YELLOW_B)
-            return polygon
+            return [
+                ax.c2p(*i)
+                for i in self.get_rectangle_corners(
+                    (0, 0), (t.get_value(), k / t.get_value())
+                )
+            ]
 
-        polygon = always_redraw(get_rectangle)
+        polygon = LivePolygon(get_rectangle, stroke_width=1, stroke_color=YELLOW_B)
+        polygon.set_fill(BLUE, opacity=0.5)
 
-        dot = Dot()
-        dot.add_updater(lambda x: x.move_to(ax.c2p(t.get_value(), k / t.get_value())))
+        dot = LiveDot(lambda: ax.c2p(t.get_value(), k / t.get_value()))
         dot.set_z_index(10)
 
         group = VGroup(ax, graph, dot, polygon)
@@ -186,7 +181,7 @@ class CalculusSlopes(Scene):
             x_range=[-3, 3], y_range=[-4, 14], y_length=7, x_length=6
         ).add_coordinates()
 
-        graph1 = plane.plot(lambda x: x ** 2, x_range=[-3, 3], color=RED)
+        graph1 = plot(plane, lambda x: x ** 2, x_range=[-3, 3], color=RED)
         graph1_lab = (
             MathTex("f(x)={x}^{2}")
             .next_to(graph1, UR, buff=0.2)
@@ -196,47 +191,38 @@ class CalculusSlopes(Scene):
 
         c = ValueTracker(-4)
 
-        graph2 = always_redraw(
-            lambda: plane.plot(
-                lambda x: x ** 2 + c.get_value(), x_range=[-3, 3], color=YELLOW
-            )
+        graph2 = LiveGraph(
+            plane, lambda x: x ** 2 + c.get_value(), x_range=[-3, 3], color=YELLOW
         )
 
-        graph2_lab = always_redraw(
-            lambda: MathTex("f(x)={x}^{2}")
+        graph2_lab = (
+            MathTex("f(x)={x}^{2}")
             .next_to(graph2, UR, buff=0.2)
             .set_color(YELLOW)
             .scale(0.8)
         )
+        graph2_lab.add_updater(lambda m: m.next_to(graph2, UR, buff=0.2))
 
         c_label = DecimalNumber(include_sign=True).set_color(YELLOW).scale(0.8)
         c_label.add_updater(lambda y: y.set_value(c.get_value()).next_to(graph2_lab, RIGHT))
 
 
         k = ValueTracker(-3)
-        dot1 = always_redraw(
-            lambda: Dot().move_to(
-                plane.coords_to_point(
-                    k.get_value(), graph1.underlying_function(k.get_value())
-                )
+        dot1 = LiveDot(
+            lambda: plane.coords_to_point(
+                k.get_value(), graph1.underlying_function(k.get_value())
             )
         )
-        slope1 = always_redraw(
-            lambda: plane.get_secant_slope_group(
-                x=k.get_value(), graph=graph1, dx=0.01, secant_line_length=5
-            )
+        slope1 = LiveSecantSlopeGroup(
+            plane, graph1, x=k, dx=0.01, secant_line_length=5
         )
 
-        slope2 = always_redraw(
-            lambda: plane.get_secant_slope_group(
-                x=k.get_value(), graph=graph2, dx=0.01, secant_line_length=5
-            )
+        slope2 = LiveSecantSlopeGroup(
+            plane, graph2, x=k, dx=0.01, secant_line_length=5
         )
-        dot2 = always_redraw(
-            lambda: Dot().move_to(
-                plane.coords_to_point(
-                    k.get_value(), graph2.underlying_function(k.get_value())
-                )
+        dot2 = LiveDot(
+            lambda: plane.coords_to_point(
+                k.get_value(), graph2.underlying_function(k.get_value())
             )
         )
 
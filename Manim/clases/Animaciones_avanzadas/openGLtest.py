@@ -1,6 +1,15 @@
 from manim import *
 from manim.opengl import *
 import numpy as np
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from latex2python import texFunction, newtonStep
+from imageCache import mipmap_path
+from assets import assets
+from surfaces import MeshSurface, MeshSphere, MeshTorus
+from curves import plot
 
 class OpenGLIntro(Scene):
     def construct(self):
@@ -24,7 +33,7 @@ class OpenGLIntro(Scene):
         self.play(Uncreate(cubo))  
         
         ax = ThreeDAxes()
-        esfera = Surface(
+        esfera = MeshSurface(
                 lambda u, v: np.array([
                 1.5 * np.cos(u) * np.cos(v),
                 1.5 * np.cos(u) * np.sin(v),
@@ -45,7 +54,7 @@ class OpenGLIntro(Scene):
             )
         )
         
-        surface = OpenGLSurface(
+        surface = MeshSurface(
             lambda u, v: (u, v, u*np.sin(v) + v*np.cos(u)),
             u_range=(-3, 3),
             v_range=(-3, 3), color=BLUE
@@ -71,17 +80,21 @@ class SurfaceExample(Scene):
 
     def construct(self):
 
-        torus1 = Torus(major_radius=1, minor_radius=1)
-        torus2 = Torus(major_radius=3, minor_radius=1)
-        sphere = Sphere(radius=3, resolution=torus1.resolution)
+        torus1 = MeshTorus(major_radius=1, minor_radius=1)
+        torus2 = MeshTorus(major_radius=3, minor_radius=1)
+        sphere = MeshSphere(radius=3, resolution=torus1.resolution)
         # You can texture a surface with up to two images, which will
         # be interpreted as the side towards the light, and away from
         # the light.  These can be either urls, or paths to a local file
         # in whatever you've set as the image directory in
         # the custom_config.yml file
 
-        day_texture = "C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\1280px-The_earth_at_night"
-        night_texture = "C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\1280px-The_earth_at_night.jpg"
+        day_texture = assets.path("1280px-The_earth_at_night")
+        night_texture = assets.path("1280px-The_earth_at_night")
+
+        # texturas desde el cache de mipmaps, al tamaño de la resolucion de salida
+        day_texture = mipmap_path(day_texture)
+        night_texture = mipmap_path(night_texture)
 
         surfaces = [
             OpenGLTexturedSurface(surface, day_texture, night_texture)
@@ -136,16 +149,19 @@ class SurfaceExample(Scene):
 class NewtonIteration(Scene):
     def construct(self):
         ax = Axes()
-        #f = lambda x: x**2 + 3*x**3
-        curve = ax.plot(lambda x: x**2 + 3*x**3, color=YELLOW)
+        self.axes = ax
+        self.f = texFunction(r"x^2 + 3x^3")
+        # x - f(x) / f'(x) con la derivada exacta, sin diferencias finitas
+        self.newton = newtonStep(r"x^2 + 3x^3")
+        curve = plot(ax, self.f, color=YELLOW)
         cursor_dot = OpenGLDot(color=RED)
+        self.cursor_dot = cursor_dot
         self.add(curve)
         self.play(Create(ax), FadeIn(cursor_dot))
         self.interactive_embed()  # not supported in online environment
 
     def on_key_press(self, symbol, modifiers):
         from pyglet.window import key as pyglet_key
-        from scipy.misc import derivative
         if symbol == pyglet_key.P:
             x, y = self.axes.point_to_coords(self.mouse_point.get_center())
             self.play(
@@ -155,7 +171,7 @@ class NewtonIteration(Scene):
         if symbol == pyglet_key.I:
             x, y = self.axes.point_to_coords(self.cursor_dot.get_center())
             # Newton iteration: x_new = x - f(x) / f'(x)
-            x_new = x - self.f(x) / derivative(self.f, x, dx=0.01)
+            x_new = float(self.newton(x))
             curve_point = self.cursor_dot.get_center()
             axes_point = self.axes.c2p(x_new, 0)
             tangent = Line(
@@ -1,4 +1,11 @@
 from manim import *
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from latex2python import texFunction
+from curves import plot
+
 
 class DifferentFunctions(Scene):
     def construct(self):
@@ -28,4 +35,30 @@ class DifferentFunctions(Scene):
         self.wait(2)
         self.play(ReplacementTransform(text2, text3))
         self.play(ReplacementTransform(expns, trigs))
-        self.wait(3)
\ No newline at end of file
+        self.wait(3)
+
+
+# La misma etiqueta MathTex define la funcion que se grafica
+class FunctionsFromLabels(Scene):
+    def construct(self):
+
+        ax = Axes(x_range=[-2, 2], y_range=[-10, 10, 2], x_length=8, y_length=6).add_coordinates()
+
+        labels = [
+            MathTex(r"y_0 = \frac{x^2 + 1}{x - 1}", color=GREEN),
+            MathTex(r"y_1 = \frac{x^5 + 7x}{5}", color=BLUE),
+            MathTex(r"y_2 = \frac{3x}{2} + e^x", color=RED),
+            MathTex(r"y_3 = \cos(x) - \sin(2x)", color=YELLOW),
+        ]
+
+        graphs = VGroup(*[
+            # adaptive: el polo en x = 1 corta la curva en el borde de los ejes
+            plot(ax, texFunction(label), x_range=[-2, 1.8], adaptive=True, color=label.get_color())
+            for label in labels
+        ])
+        VGroup(*labels).arrange(DOWN).scale(0.7).to_corner(UL)
+
+        self.play(Create(ax))
+        for label, graph in zip(labels, graphs):
+            self.play(Write(label), Create(graph))
+        self.wait(3)
@@ -1,4 +1,10 @@
 from manim import *
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from imageCache import ImagePrefetcher
+from assets import assets
 
 class colorFondo(Scene):
     def construct(self):
@@ -20,7 +26,16 @@ class colorFondo(Scene):
 class imgFondo(Scene):
     def construct(self):
 
-        background = ImageMobject('C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\carina-nebula-webb-1.png')
+        fondos = [
+            assets.path('carina-nebula-webb-1'),
+            assets.path('webb'),
+            assets.path('galaxias'),
+            assets.path('supernova'),
+        ]
+        # los cuatro fondos se decodifican en otros hilos mientras se animan los anteriores
+        prefetcher = ImagePrefetcher().prefetch(*fondos)
+
+        background = prefetcher.get(fondos[0])
 
         texto = Title("Una clase en el espacio")
 
@@ -33,7 +48,7 @@ class imgFondo(Scene):
 
         self.play(Uncreate(texto))
 
-        background2 = ImageMobject('C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\webb.png')
+        background2 = prefetcher.get(fondos[1])
         self.remove(background)
 
         self.add(background2)
@@ -41,7 +56,7 @@ class imgFondo(Scene):
 
         self.wait(2)
 
-        background3 = ImageMobject('C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\galaxias.png')
+        background3 = prefetcher.get(fondos[2])
         self.remove(background2)
 
         self.add(background3)
@@ -49,17 +64,20 @@ class imgFondo(Scene):
 
         self.wait(2)
 
-        background4 = ImageMobject('C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\supernova.png')
+        background4 = prefetcher.get(fondos[3])
         self.remove(background3)
 
         self.add(background4)
         self.bring_to_back(background4)
 
         self.wait(4)
+        prefetcher.shutdown()
 
 class testFondo(Scene):
     def construct(self):
 
-        background = 'C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\carina-nebula-webb-1.png'
+        background = assets.path('carina-nebula-webb-1')
       
+        # the Cairo camera crops its background image instead of scaling
+        # it, so it gets the full resolution file
         self.camera = Camera(background_image=background)
@@ -1,4 +1,9 @@
 from manim import *
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from assets import assets
 
 class baseScene(Scene):
     def construct(self):
@@ -65,7 +70,7 @@ class rocketCountdown(Scene):
 
         titulo = Title("Viaje a Marte")
 
-        audio = "C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Soundtracks\\Rocket_Countdown.mp3"
+        audio = assets.path("Rocket_Countdown")
 
         numero = DecimalNumber().set_color(ORANGE).scale(5)
         # Add an updater to keep the DecimalNumber centered as its value changes
@@ -92,7 +97,7 @@ class rocketCountdown(Scene):
                     Uncreate(titulo),
                     run_time=6)
 
-        background = ImageMobject('C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\martehd.png')
+        background = assets.image('martehd')
 
         self.clear()
 
@@ -1,4 +1,11 @@
 from manim import *
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from arcLength import MoveAlongArcLength
+from surfaces import LODSurface
+from curves import VectorParametricFunction, plot_parametric
 
 class surfearCurva(MovingCameraScene):
     def construct(self):
@@ -16,7 +23,7 @@ class surfearCurva(MovingCameraScene):
             t_range = np.array([0, 7]),
             fill_opacity=0).set_color(BLUE_B).scale(1.5)
  """
-        curva = ejes.plot_parametric_curve(lambda t: np.array([np.cos(t*5), np.sin(t)**3, 0]),
+        curva = plot_parametric(ejes, lambda t: np.array([np.cos(t*5), np.sin(t)**3, 0*t]),
             t_range = np.array([0, 7]),
             fill_opacity=0).set_color(BLUE_B).scale(2)
 
@@ -32,7 +39,7 @@ class surfearCurva(MovingCameraScene):
             mob.move_to(puntoAmover.get_center())
 
         self.camera.frame.add_updater(update_curva)
-        self.play(MoveAlongPath(puntoAmover, curva, rate_func=rate_functions.double_smooth), run_time=6)
+        self.play(MoveAlongArcLength(puntoAmover, curva, rate_func=rate_functions.double_smooth), run_time=6)
         self.play(puntoAmover.animate.set_color(RED))
         self.camera.frame.remove_updater(update_curva)
 
@@ -131,6 +138,7 @@ class ejemplos3D(ThreeDScene):
 
         titulo = Title("Escenas en 3D")
 
+        # resolucion de partida, LODSurface la ajusta al tamaño en pantalla
         resolution_fa = 24
         self.set_camera_orientation(phi=75 * DEGREES, theta=-30 * DEGREES)
 
@@ -138,12 +146,14 @@ class ejemplos3D(ThreeDScene):
             x = u
             y = v
             sigma, mu = 0.4, [0.0, 0.0]
-            d = np.linalg.norm(np.array([x - mu[0], y - mu[1]]))
+            # hypot en vez de norm: funciona con las grillas enteras de u y v
+            d = np.hypot(x - mu[0], y - mu[1])
             z = np.exp(-(d ** 2 / (2.0 * sigma ** 2)))
             return np.array([x, y, z])
 
-        gauss_plane = Surface(
+        gauss_plane = LODSurface(
             param_gauss,
+            camera=self.renderer.camera,
             resolution=(resolution_fa, resolution_fa),
             v_range=[-2, +2],
             u_range=[-2, +2]
@@ -166,13 +176,14 @@ class ejemplos3D(ThreeDScene):
         self.stop_ambient_camera_rotation()
         self.wait(2)
 
-        esfera = Surface(
+        esfera = LODSurface(
                 lambda u, v: np.array([
                 1.5 * np.cos(u) * np.cos(v),
                 1.5 * np.cos(u) * np.sin(v),
                 1.5 * np.sin(u)
             ]), v_range=[0, TAU], u_range=[-PI / 2, PI / 2],
-            checkerboard_colors=[RED_D, RED_E], resolution=(15, 32)
+            checkerboard_colors=[RED_D, RED_E], resolution=(15, 32),
+            camera=self.renderer.camera
 
         )
         self.play(Create(ThreeDAxes()), ReplacementTransform(gauss_plane, esfera), run_time=3)
@@ -182,7 +193,7 @@ class ejemplos3D(ThreeDScene):
         self.play(self.renderer.camera.light_source.animate.move_to(2*OUT), run_time=2)
         self.wait(2)
 
-        param = ParametricFunction(
+        param = VectorParametricFunction(
             lambda t: np.array([np.sin(7*t), -np.cos(t**2), np.cos(t)]),
             t_range = np.array([0, 4]),
             fill_opacity=0).set_color(PURPLE).scale(1.5)
@@ -0,0 +1,233 @@
+from manim import *
+import networkx as nx
+
+from neuralNetwork import EdgeBundle
+
+
+# Graph as (node list, (m, 2) edge index array) from a networkx graph or an edge list
+def graph_arrays(graph):
+    if not isinstance(graph, nx.Graph):
+        graph = nx.Graph(list(graph))
+    nodes = list(graph.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[a], index[b]) for a, b in graph.edges if a != b], dtype=int)
+    return nodes, edges.reshape(-1, 2)
+
+
+# Exact repulsion k^2 / d between every pair of nodes, O(n^2)
+def pairwise_repulsion(positions, k=1.0):
+    delta = positions[:, None, :] - positions[None, :, :]
+    dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-9)
+    np.fill_diagonal(dist2, np.inf)
+    return k ** 2 * (delta / dist2[..., None]).sum(axis=1)
+
+
+# Barnes-Hut style repulsion on a quadtree stored as one sparse grid per
+# level. At every level each node feels the centroids of the cells that are
+# not its neighbours but whose parents are (the usual interaction list), so
+# the far field costs 27 cells per level. A node stops going down once its
+# 3x3 neighbourhood holds at most near_size nodes, and those are added
+# exactly, so dense clusters are split deeper instead of widening the near
+# field. At max_levels cells fuller than near_size keep near_size nodes
+# exact and the rest count as their centroid.
+def grid_repulsion(positions, k=1.0, near_size=32, max_levels=20):
+    n = len(positions)
+    low = positions.min(axis=0)
+    side = max((positions.max(axis=0) - low).max(), 1e-9) * (1 + 1e-6)
+    unit = (positions - low) / side
+
+    # children of the parent's 3x3 neighbourhood, relative to 2 * parent
+    offsets = np.stack(np.meshgrid(np.arange(-2, 4), np.arange(-2, 4), indexing="ij"), axis=-1).reshape(-1, 2)
+    near = np.stack(np.meshgrid(np.arange(-1, 2), np.arange(-1, 2), indexing="ij"), axis=-1).reshape(-1, 2)
+
+    forces = np.zeros_like(positions)
+    active = np.arange(n)
+    for level in range(2, max_levels + 1):
+        size = 2 ** level
+        cells = np.minimum((unit * size).astype(np.int64), size - 1)
+        ids = cells[:, 0] * size + cells[:, 1]
+        # occupied cells only, looked up by id with searchsorted
+        occupied, cell_of, counts = np.unique(ids, return_inverse=True, return_counts=True)
+        centroids = np.stack([np.bincount(cell_of, positions[:, d]) for d in range(2)], axis=1) / counts[:, None]
+
+        def lookup(grid):
+            inside = ((grid >= 0) & (grid < size)).all(axis=-1)
+            wanted = np.where(inside, grid[..., 0] * size + grid[..., 1], -1)
+            found = np.minimum(np.searchsorted(occupied, wanted), len(occupied) - 1)
+            return found, inside & (occupied[found] == wanted)
+
+        candidates = (cells[active] // 2 * 2)[:, None, :] + offsets[None]
+        found, present = lookup(candidates)
+        present &= np.abs(candidates - cells[active][:, None, :]).max(axis=2) > 1
+        delta = positions[active][:, None, :] - centroids[found]
+        dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-9)
+        weight = np.where(present, counts[found], 0) / dist2
+        forces[active] += k ** 2 * (delta * weight[..., None]).sum(axis=1)
+
+        neighbours, inside = lookup(cells[active][:, None, :] + near[None])
+        crowded = np.where(inside, counts[neighbours], 0).sum(axis=1) > near_size
+        if level < max_levels and crowded.any():
+            done = ~crowded
+        else:
+            done = np.ones(len(active), dtype=bool)
+
+        # near field of the finished nodes: every node of the 3x3 leaf
+        # neighbourhood, at most near_size per cell
+        nodes, neighbours, inside = active[done], neighbours[done], inside[done]
+        order = np.argsort(cell_of, kind="stable")
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        taken = np.where(inside, np.minimum(counts[neighbours], near_size), 0)
+        slot = np.arange(taken.max() if taken.size else 0)
+        valid = slot < taken[..., None]
+        others = order[np.minimum(starts[neighbours][..., None] + slot, n - 1)]
+        valid &= others != nodes[:, None, None]
+        delta = positions[nodes][:, None, None, :] - positions[others]
+        dist2 = np.maximum((delta ** 2).sum(axis=3), 1e-9)
+        forces[nodes] += k ** 2 * (delta * (valid / dist2)[..., None]).sum(axis=(1, 2))
+
+        overflow = np.where(inside, counts[neighbours] - taken, 0)
+        if overflow.any():
+            # centroid of the nodes past the first near_size of each cell
+            running = np.concatenate([np.zeros((1, 2)), np.cumsum(positions[order], axis=0)])
+            first = running[starts + np.minimum(counts, near_size)] - running[starts]
+            rest = (centroids * counts[:, None] - first) / np.maximum(counts - near_size, 1)[:, None]
+            delta = positions[nodes][:, None, :] - rest[neighbours]
+            dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-9)
+            forces[nodes] += k ** 2 * (delta * (overflow / dist2)[..., None]).sum(axis=1)
+
+        active = active[~done]
+        if len(active) == 0:
+            break
+    return forces
+
+
+# Spring attraction d^2 / k along every edge
+def edge_attraction(positions, edges, k=1.0):
+    delta = positions[edges[:, 0]] - positions[edges[:, 1]]
+    pull = delta * np.linalg.norm(delta, axis=1, keepdims=True) / k
+    forces = np.zeros_like(positions)
+    for d in range(positions.shape[1]):
+        forces[:, d] = np.bincount(edges[:, 1], pull[:, d], len(positions)) - np.bincount(edges[:, 0], pull[:, d], len(positions))
+    return forces
+
+
+# Fruchterman-Reingold iterations, yields the positions after every step.
+# Layout units have one node per unit of area, so k = 1.
+def force_layout(positions, edges, iterations=100, gravity=0.02, temperature=None, exact_below=300):
+    positions = np.array(positions, dtype=float)
+    n = len(positions)
+    repulsion = pairwise_repulsion if n < exact_below else grid_repulsion
+    if temperature is None:
+        temperature = 0.1 * np.sqrt(n)
+    for step in range(iterations):
+        forces = repulsion(positions) + edge_attraction(positions, edges)
+        forces -= gravity * np.sqrt(n) * (positions - positions.mean(axis=0))
+        length = np.linalg.norm(forces, axis=1, keepdims=True)
+        cool = temperature * (1 - step / iterations)
+        positions += forces / np.maximum(length, 1e-9) * np.minimum(length, cool)
+        yield positions.copy()
+
+
+# Graph with thousands of nodes: every node is one subpath of a single
+# VMobject and every edge lives in one EdgeBundle, both rewritten from a
+# (n, 2) layout array, so moving the nodes never creates new mobjects
+class LargeGraph(VGroup):
+    def __init__(
+        self,
+        graph,
+        layout_iterations=100,
+        layout_config={},
+        width=12,
+        height=7,
+        node_radius=0.04,
+        node_color=BLUE,
+        edge_color=LIGHT_GREY,
+        edge_stroke_width=1,
+        edge_stroke_opacity=0.5,
+        seed=0,
+        **kwargs,
+    ):
+        VGroup.__init__(self, **kwargs)
+        self.nodes_list, self.edge_index = graph_arrays(graph)
+        self.layout_config = layout_config
+        self.fit_width = width
+        self.fit_height = height
+
+        n = len(self.nodes_list)
+        rng = np.random.default_rng(seed)
+        layout = rng.uniform(-0.5, 0.5, (n, 2)) * np.sqrt(n)
+        for layout in force_layout(layout, self.edge_index, layout_iterations, **layout_config):
+            pass
+        self.layout = layout
+
+        self.node_template = Circle(radius=node_radius).points
+        self.node_dots = VMobject(fill_color=node_color, fill_opacity=1, stroke_width=0)
+        points = self.get_node_positions()
+        self.edges = EdgeBundle(
+            points[self.edge_index[:, 0]],
+            points[self.edge_index[:, 1]],
+            stroke_color=edge_color,
+            stroke_width=edge_stroke_width,
+            stroke_opacity=edge_stroke_opacity,
+        )
+        self.add(self.edges, self.node_dots)
+        self.set_layout(self.layout)
+
+    def __len__(self):
+        return len(self.nodes_list)
+
+    def get_node_positions(self, layout=None):
+        # layout units -> scene points, centered and scaled to fit width x height
+        layout = self.layout if layout is None else layout
+        low, high = layout.min(axis=0), layout.max(axis=0)
+        span = np.maximum(high - low, 1e-9)
+        scale = min(self.fit_width / span[0], self.fit_height / span[1])
+        points = np.zeros((len(layout), 3))
+        points[:, :2] = (layout - (low + high) / 2) * scale
+        return points
+
+    def set_layout(self, layout):
+        self.layout = np.asarray(layout, dtype=float)
+        center = self.get_center() if self.node_dots.has_points() else ORIGIN
+        points = self.get_node_positions() + center
+        self.node_dots.set_points((points[:, None, :] + self.node_template[None]).reshape(-1, 3))
+        self.edges.put_start_and_end_points(points[self.edge_index[:, 0]], points[self.edge_index[:, 1]])
+        return self
+
+    def get_node(self, node):
+        return self.get_node_positions()[self.nodes_list.index(node)] + self.get_center()
+
+    def layout_history(self, iterations=100, **kwargs):
+        config = dict(self.layout_config, **kwargs)
+        return np.array([self.layout] + list(force_layout(self.layout, self.edge_index, iterations, **config)))
+
+
+# Animates the layout iterations. They are computed once in begin(), then
+# every frame interpolates between two stored steps and rewrites the points
+class ForceLayout(Animation):
+    def __init__(self, graph, iterations=100, run_time=4, rate_func=smooth, **kwargs):
+        self.iterations = iterations
+        self.layout_kwargs = {
+            key: kwargs.pop(key) for key in ("gravity", "temperature", "exact_below") if key in kwargs
+        }
+        super().__init__(graph, run_time=run_time, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self.history = self.mobject.layout_history(self.iterations, **self.layout_kwargs)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha) * (len(self.history) - 1)
+        i = min(int(t), len(self.history) - 2)
+        self.mobject.set_layout(interpolate(self.history[i], self.history[i + 1], t - i))
+
+
+class myLargeGraph(Scene):
+    def construct(self):
+        grafo = nx.powerlaw_cluster_graph(2000, 2, 0.3, seed=1)
+        red = LargeGraph(grafo, layout_iterations=0)
+
+        texto = Text("Grafo de 2000 nodos", font_size=26).to_corner(UL)
+        self.play(Write(texto), FadeIn(red))
+        self.play(ForceLayout(red, iterations=120), run_time=8)
+        self.wait(2)
@@ -1,7 +1,227 @@
-import itertools as it
 from manim import *
 from numpy.lib.function_base import iterable
 
+
+# All the edges between two layers as a single mobject.
+# Each edge is one subpath; edges sharing the same stroke style are drawn
+# together in one VMobject, so a layer pair costs one path per style
+# instead of one Line per pair of neurons.
+class EdgeBundle(VMobject):
+    def __init__(
+        self,
+        starts,
+        ends,
+        buff=0,
+        tip_length=None,
+        stroke_color=LIGHT_GREY,
+        stroke_width=2,
+        stroke_opacity=1,
+        **kwargs,
+    ):
+        # VMobject.__init__ sets the stroke through set_edge_style, so the
+        # style arrays have to exist first; there are no buckets to regroup
+        # until rebuild runs (edge_slots is None)
+        self.buff = buff
+        self.tip_length = tip_length
+        n_edges = len(starts)
+        self.edge_rgbas = np.tile(color_to_rgba(stroke_color, stroke_opacity), (n_edges, 1))
+        self.edge_widths = np.full(n_edges, float(stroke_width))
+        self.edge_slots = None
+        self.styles_changed = False
+        VMobject.__init__(
+            self, stroke_color=stroke_color, stroke_width=stroke_width, stroke_opacity=stroke_opacity, **kwargs
+        )
+        self.rebuild(*self.edge_geometry(starts, ends))
+
+    def edge_geometry(self, starts, ends):
+        # bezier points of every line (and tip) from the raw start/end points
+        starts = np.asarray(starts, dtype=float)
+        ends = np.asarray(ends, dtype=float)
+        n_edges = len(starts)
+
+        vectors = ends - starts
+        lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+        units = vectors / np.where(lengths == 0, 1, lengths)
+        starts = starts + units * self.buff
+        ends = ends - units * self.buff
+
+        tips = None
+        if self.tip_length is not None:
+            tip_points = ends
+            ends = ends - units * self.tip_length
+            normals = np.stack([-units[:, 1], units[:, 0], np.zeros(n_edges)], axis=1)
+            corners = np.stack([
+                tip_points,
+                ends + normals * self.tip_length / 2,
+                ends - normals * self.tip_length / 2,
+                tip_points,
+            ], axis=1)
+            tips = self.corners_to_curves(corners)
+        return self.corners_to_curves(np.stack([starts, ends], axis=1)), tips
+
+    @staticmethod
+    def corners_to_curves(corners):
+        # (n, k, 3) corners -> (n, 4 * (k - 1), 3) cubic bezier points, as in Line
+        a, b = corners[:, :-1], corners[:, 1:]
+        curves = np.stack([a, a + (b - a) / 3, a + 2 * (b - a) / 3, b], axis=2)
+        return curves.reshape(len(corners), -1, 3)
+
+    def __len__(self):
+        return len(self.edge_widths)
+
+    def get_edge_points(self):
+        # current geometry lives in the buckets, so shift/scale/rotate keep working
+        lines = np.empty((len(self), 4, 3))
+        tips = np.empty((len(self), 12, 3)) if self.tip_length is not None else None
+        for bucket, slots in zip(self.submobjects, self.edge_slots):
+            lines[slots] = bucket.points.reshape(len(slots), 4, 3)
+            if tips is not None:
+                tips[slots] = bucket.submobjects[0].points.reshape(len(slots), 12, 3)
+        return lines, tips
+
+    def rebuild(self, lines=None, tips=None):
+        if lines is None:
+            lines, tips = self.get_edge_points()
+        # one integer per style: 8 bits per rgba channel, width in hundredths
+        channels = np.round(self.edge_rgbas * 255).astype(np.int64)
+        keys = (channels << np.array([0, 8, 16, 24])).sum(axis=1)
+        keys += np.round(self.edge_widths * 100).astype(np.int64) << 32
+        styles, inverse = np.unique(keys, return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind="stable")
+        self.edge_slots = np.split(order, np.cumsum(np.bincount(inverse, minlength=len(styles)))[:-1])
+
+        buckets = self.submobjects[:len(styles)]
+        while len(buckets) < len(styles):
+            bucket = VMobject(fill_opacity=0)
+            if self.tip_length is not None:
+                bucket.add(VMobject(stroke_width=0))
+            buckets.append(bucket)
+        self.submobjects = buckets
+
+        for bucket, slots in zip(buckets, self.edge_slots):
+            rgba = self.edge_rgbas[slots[0]]
+            color = rgb_to_color(rgba[:3])
+            bucket.set_points(lines[slots].reshape(-1, 3))
+            bucket.set_stroke(color, self.edge_widths[slots[0]], rgba[3], family=False)
+            if tips is not None:
+                tip = bucket.submobjects[0]
+                tip.set_points(tips[slots].reshape(-1, 3))
+                tip.set_fill(color, opacity=rgba[3])
+        self.styles_changed = False
+        return self
+
+    def apply_edge_styles(self):
+        # regroups the buckets once after any number of set_edge_style(apply=False) calls
+        if self.styles_changed and self.edge_slots is not None:
+            self.rebuild()
+        return self
+
+    def put_start_and_end_points(self, starts, ends):
+        # moves every edge keeping the style buckets, cheap enough to call every frame
+        lines, tips = self.edge_geometry(starts, ends)
+        for bucket, slots in zip(self.submobjects, self.edge_slots):
+            bucket.set_points(lines[slots].reshape(-1, 3))
+            if tips is not None:
+                bucket.submobjects[0].set_points(tips[slots].reshape(-1, 3))
+        return self
+
+    def set_edge_style(self, index=slice(None), color=None, width=None, opacity=None, apply=True):
+        # color can be one color or one per indexed edge, opacity/width scalars or arrays.
+        # With apply=False only the style arrays are written, so many calls
+        # can be followed by a single apply_edge_styles
+        if color is not None:
+            if isinstance(color, (list, tuple)) and not isinstance(color[0], (int, float)):
+                rgbs = np.array([color_to_rgba(c)[:3] for c in color])
+            elif isinstance(color, np.ndarray):
+                rgbs = color[..., :3]
+            else:
+                rgbs = color_to_rgba(color)[:3]
+            self.edge_rgbas[index, :3] = rgbs
+        if opacity is not None:
+            self.edge_rgbas[index, 3] = opacity
+        if width is not None:
+            self.edge_widths[index] = width
+        self.styles_changed = True
+        if apply:
+            self.apply_edge_styles()
+        return self
+
+    def set_stroke(self, color=None, width=None, opacity=None, background=False, family=True):
+        if background or not family:
+            return VMobject.set_stroke(self, color, width, opacity, background, family)
+        return self.set_edge_style(color=color, width=width, opacity=opacity)
+
+    def get_edges(self, index=slice(None)):
+        return EdgeSet(self, index)
+
+
+# A view over some edges of an EdgeBundle, used for neuron.edges_in / edges_out
+class EdgeSet:
+    def __init__(self, bundle, index):
+        self.bundle = bundle
+        self.index = np.arange(len(bundle))[index]
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, key):
+        return EdgeSet(self.bundle, self.index[key])
+
+    def __iter__(self):
+        return (EdgeSet(self.bundle, self.index[i:i + 1]) for i in range(len(self.index)))
+
+    def set_stroke(self, color=None, width=None, opacity=None):
+        self.bundle.set_edge_style(self.index, color, width, opacity)
+        return self
+
+    def set_color(self, color):
+        return self.set_stroke(color=color)
+
+    def set_opacity(self, opacity):
+        return self.set_stroke(opacity=opacity)
+
+    def get_colors(self):
+        return [rgb_to_color(rgba[:3]) for rgba in self.bundle.edge_rgbas[self.index]]
+
+    def get_starts(self):
+        return self.bundle.get_edge_points()[0][self.index, 0]
+
+    def get_ends(self):
+        return self.bundle.get_edge_points()[0][self.index, -1]
+
+    def get_lines(self):
+        # stand-alone copy of these edges, e.g. for ShowPassingFlash
+        lines = VMobject(fill_opacity=0)
+        lines.set_points(self.bundle.get_edge_points()[0][self.index].reshape(-1, 3))
+        rgba = self.bundle.edge_rgbas[self.index[0]]
+        lines.set_stroke(rgb_to_color(rgba[:3]), self.bundle.edge_widths[self.index[0]], rgba[3])
+        return lines
+
+
+# Compiles all the strings in one LaTeX job and returns one VGroup of glyphs
+# per string. The strings are typeset side by side with wide gaps between
+# them, so the largest horizontal gaps between glyphs tell them apart.
+def batch_math_tex(tex_strings, separator=r"\hspace{4em}", **kwargs):
+    groups = [VGroup() for _ in tex_strings]
+    filled = [i for i, tex in enumerate(tex_strings) if tex.strip()]
+    if not filled:
+        return groups
+
+    tex = SingleStringMathTex(separator.join("{" + tex_strings[i] + "}" for i in filled), **kwargs)
+    glyphs = tex.family_members_with_points()
+    lefts = np.array([glyph.get_left()[0] for glyph in glyphs])
+    rights = np.array([glyph.get_right()[0] for glyph in glyphs])
+    order = np.argsort(lefts, kind="stable")
+    gaps = lefts[order][1:] - np.maximum.accumulate(rights[order])[:-1]
+    if len(gaps) < len(filled) - 1:
+        raise ValueError("some labels produced no glyphs")
+    cuts = np.sort(np.argsort(gaps)[len(gaps) - (len(filled) - 1):]) + 1
+    for i, part in zip(filled, np.split(order, cuts)):
+        groups[i].add(*[glyphs[j] for j in part])
+    return groups
+
+
 # A customizable Sequential Neural Network
 
 
@@ -78,7 +298,7 @@ class NeuralNetworkMobject(VGroup):
         self.average_shown_activation_of_large_layer = average_shown_activation_of_large_layer
         self.include_output_labels = include_output_labels
         self.arrow = arrow
-        self.arrow_tip_size = arrow_tip_size,
+        self.arrow_tip_size = arrow_tip_size
         self.left_size = left_size
         self.neuron_fill_opacity = neuron_fill_opacity
 
@@ -130,6 +350,9 @@ class NeuralNetworkMobject(VGroup):
             neuron.edges_in = VGroup()
             neuron.edges_out = VGroup()
         layer.neurons = neurons
+        # index in the full layer of each drawn neuron
+        half = n_neurons // 2
+        layer.shown_indices = np.r_[0:half, size - (n_neurons - half):size]
         layer.add(neurons)
 
         if size > n_neurons:
@@ -156,88 +379,250 @@ class NeuralNetworkMobject(VGroup):
     def add_edges(self):
         self.edge_groups = VGroup()
         for l1, l2 in zip(self.layers[:-1], self.layers[1:]):
-            edge_group = VGroup()
-            for n1, n2 in it.product(l1.neurons, l2.neurons):
-                edge = self.get_edge(n1, n2)
-                edge_group.add(edge)
-                n1.edges_out.add(edge)
-                n2.edges_in.add(edge)
-            self.edge_groups.add(edge_group)
-        self.add_to_back(self.edge_groups)
-    # Helper method for constructor
-
-    def get_edge(self, neuron1, neuron2):
-        if self.arrow:
-            return Arrow(
-                neuron1.get_center(),
-                neuron2.get_center(),
+            centers1 = np.array([n.get_center() for n in l1.neurons])
+            centers2 = np.array([n.get_center() for n in l2.neurons])
+            n2 = len(centers2)
+            # same order as it.product(l1.neurons, l2.neurons)
+            edge_group = EdgeBundle(
+                np.repeat(centers1, n2, axis=0),
+                np.tile(centers2, (len(centers1), 1)),
                 buff=self.neuron_radius,
+                tip_length=self.arrow_tip_size if self.arrow else None,
                 stroke_color=self.edge_color,
                 stroke_width=self.edge_stroke_width,
-                tip_length=self.arrow_tip_size
             )
-        return Line(
-            neuron1.get_center(),
-            neuron2.get_center(),
-            buff=self.neuron_radius,
-            stroke_color=self.edge_color,
-            stroke_width=self.edge_stroke_width,
-        )
+            for i, n1 in enumerate(l1.neurons):
+                n1.edges_out = edge_group.get_edges(slice(i * n2, (i + 1) * n2))
+            for j, neuron in enumerate(l2.neurons):
+                neuron.edges_in = edge_group.get_edges(slice(j, None, n2))
+            self.edge_groups.add(edge_group)
+        self.add_to_back(self.edge_groups)
 
-    # Labels each input neuron with a char l or a LaTeX character
-    def label_inputs(self, l):
-        self.output_labels = VGroup()
-        for n, neuron in enumerate(self.layers[0].neurons):
-            label = MathTex(f"{l}_"+"{"+f"{n + 1}"+"}")
-            label.height = (0.3 * neuron.height)
+    # Places labels given as (neuron, tex string, height relative to the neuron, beside the neuron)
+    # All of them are compiled in a single LaTeX job
+    def place_labels(self, specs):
+        labels = batch_math_tex([tex for _, tex, _, _ in specs])
+        for (neuron, _, ratio, beside), label in zip(specs, labels):
+            if not label.submobjects:
+                continue
+            label.height = (ratio * neuron.height)
             label.move_to(neuron)
-            self.output_labels.add(label)
+            if beside:
+                label.shift((neuron.width + label.width/2)*RIGHT)
+        self.output_labels = VGroup(*labels)
         self.add(self.output_labels)
+        return self.output_labels
+
+    def input_label_specs(self, l):
+        return [
+            (neuron, f"{l}_"+"{"+f"{n + 1}"+"}", 0.3, False)
+            for n, neuron in enumerate(self.layers[0].neurons)
+        ]
+
+    def output_label_specs(self, l):
+        return [
+            (neuron, f"{l}_"+"{"+f"{n + 1}"+"}", 0.4, False)
+            for n, neuron in enumerate(self.layers[-1].neurons)
+        ]
+
+    def output_text_specs(self, outputs):
+        return [
+            (neuron, outputs[n], 0.75, True)
+            for n, neuron in enumerate(self.layers[-1].neurons)
+        ]
+
+    def hidden_label_specs(self, l):
+        return [
+            (neuron, f"{l}_{n + 1}", 0.4, False)
+            for layer in self.layers[1:-1]
+            for n, neuron in enumerate(layer.neurons)
+        ]
+
+    # Labels each input neuron with a char l or a LaTeX character
+    def label_inputs(self, l):
+        return self.place_labels(self.input_label_specs(l))
 
     # Labels each output neuron with a char l or a LaTeX character
     def label_outputs(self, l):
-        self.output_labels = VGroup()
-        for n, neuron in enumerate(self.layers[-1].neurons):
-            label = MathTex(f"{l}_"+"{"+f"{n + 1}"+"}")
-            label.height = (0.4 * neuron.height)
-            label.move_to(neuron)
-            self.output_labels.add(label)
-        self.add(self.output_labels)
+        return self.place_labels(self.output_label_specs(l))
 
     # Labels each neuron in the output layer with text according to an output list
     def label_outputs_text(self, outputs):
-        self.output_labels = VGroup()
-        for n, neuron in enumerate(self.layers[-1].neurons):
-            label = MathTex(outputs[n])
-            label.height = (0.75*neuron.height)
-            label.move_to(neuron)
-            label.shift((neuron.width + label.width/2)*RIGHT)
-            self.output_labels.add(label)
-        self.add(self.output_labels)
+        return self.place_labels(self.output_text_specs(outputs))
 
     # Labels the hidden layers with a char l or a LaTeX character
     def label_hidden_layers(self, l):
-        self.output_labels = VGroup()
-        for layer in self.layers[1:-1]:
-            for n, neuron in enumerate(layer.neurons):
-                label = MathTex(f"{l}_{n + 1}")
-                label.height = (0.4 * neuron.height)
-                label.move_to(neuron)
-                self.output_labels.add(label)
-        self.add(self.output_labels)
+        return self.place_labels(self.hidden_label_specs(l))
 
+    # Every kind of label at once, still with a single LaTeX compile
+    def add_labels(self, inputs=None, outputs=None, hidden=None, outputs_text=None):
+        specs = []
+        if inputs is not None:
+            specs += self.input_label_specs(inputs)
+        if outputs is not None:
+            specs += self.output_label_specs(outputs)
+        if hidden is not None:
+            specs += self.hidden_label_specs(hidden)
+        if outputs_text is not None:
+            specs += self.output_text_specs(outputs_text)
+        return self.place_labels(specs)
+
+
+# Runs a forward pass with real weights and shows it layer by layer:
+# edges light up with |activation * weight| and neurons fill with their
+# activation. Every frame rewrites the edge style arrays of each bundle
+# at once; flows are quantized to `levels` steps so a bundle never needs
+# more than `levels` paths. Neuron fills are quantized the same way and a
+# layer is only refilled when its levels change, one set_fill per level.
+class ForwardPropagation(Animation):
+    def __init__(
+        self,
+        network,
+        weights,
+        inputs,
+        biases=None,
+        activation=sigmoid,
+        levels=16,
+        dim_opacity=0.15,
+        run_time=None,
+        rate_func=linear,
+        **kwargs,
+    ):
+        sizes = network.layer_sizes
+        if len(weights) != len(sizes) - 1:
+            raise ValueError(f"expected {len(sizes) - 1} weight matrices, got {len(weights)}")
+        weights = [np.asarray(w, dtype=float) for w in weights]
+        for k, w in enumerate(weights):
+            if w.shape != (sizes[k], sizes[k + 1]):
+                raise ValueError(f"weights[{k}] has shape {w.shape}, expected {(sizes[k], sizes[k + 1])}")
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=float))
+        if biases is None:
+            biases = [np.zeros(n) for n in sizes[1:]]
+
+        # forward pass for the whole batch: activations[k] has shape (batch, sizes[k])
+        activations = [inputs]
+        for w, b in zip(weights, biases):
+            activations.append(activation(activations[-1] @ w + b))
+
+        self.network = network
+        self.levels = levels
+        self.dim_opacity = dim_opacity
+        self.batch_size = len(inputs)
+        self.n_steps = len(weights)
+
+        layers = network.layers
+        shown = [layer.shown_indices for layer in layers]
+        # neuron fill strength per sample, normalized per layer
+        self.neuron_levels = [
+            np.abs(a[:, idx]) / max(np.abs(a).max(), 1e-12)
+            for a, idx in zip(activations, shown)
+        ]
+        # edge flows per sample in the bundle order (i * n2 + j), normalized per layer pair
+        self.edge_flows = []
+        for k, w in enumerate(weights):
+            flow = np.abs(activations[k][:, shown[k], None] * w[np.ix_(shown[k], shown[k + 1])])
+            flow /= max(flow.max(), 1e-12)
+            self.edge_flows.append(np.round(flow.reshape(self.batch_size, -1) * (levels - 1)) / (levels - 1))
+
+        if run_time is None:
+            run_time = network.edge_propogation_time * self.n_steps * self.batch_size
+        super().__init__(network, run_time=run_time, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self.bundles = list(self.network.edge_groups)
+        self.base_rgbas = [bundle.edge_rgbas.copy() for bundle in self.bundles]
+        self.prop_rgb = color_to_rgba(self.network.edge_propogation_color)[:3]
+        self.last_weights = [0.0] * len(self.bundles)
+        self.neuron_colors = [
+            color_to_rgba(self.network.get_nn_fill_color(k))[:3]
+            for k in range(len(self.network.layers))
+        ]
+        self.start_fills = [
+            [(rgb_to_hex(color_to_rgb(neuron.get_fill_color())), neuron.get_fill_opacity()) for neuron in layer.neurons]
+            for layer in self.network.layers
+        ]
+        self.last_strengths = [None] * len(self.network.layers)
+        super().begin()
+
+    @staticmethod
+    def fill_groups(neurons, fills):
+        # one set_fill for all the neurons that share a (hex color, opacity) fill
+        groups = {}
+        for neuron, fill in zip(neurons, fills):
+            groups.setdefault(fill, []).append(neuron)
+        if len(groups) == 1:
+            (color, opacity), = groups
+            neurons.set_fill(color, opacity=opacity)
+            return
+        for (color, opacity), members in groups.items():
+            VGroup(*members).set_fill(color, opacity=opacity)
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha) * self.batch_size
+        sample = min(int(t), self.batch_size - 1)
+        progress = (t - sample) * self.n_steps
+
+        for k, bundle in enumerate(self.bundles):
+            p = np.clip(progress - k, 0, 1)
+            w = there_and_back(p)
+            w = np.round(w * (self.levels - 1)) / (self.levels - 1)
+            if w == 0 and self.last_weights[k] == 0:
+                continue
+            self.last_weights[k] = w
+            flow = self.edge_flows[k][sample]
+            base = self.base_rgbas[k]
+            mix = (flow * w)[:, None]
+            colors = base[:, :3] + (self.prop_rgb - base[:, :3]) * mix
+            opacities = base[:, 3] * (1 - (1 - self.dim_opacity) * (1 - flow) * w)
+            bundle.set_edge_style(color=colors, opacity=opacities)
+
+        for k, layer in enumerate(self.network.layers):
+            # a layer fills in while the flow into it rises
+            reached = 1 if k == 0 else np.clip(2 * (progress - k + 1), 0, 1)
+            strength = np.round(self.neuron_levels[k][sample] * reached * (self.levels - 1)) / (self.levels - 1)
+            if self.last_strengths[k] is not None and np.array_equal(strength, self.last_strengths[k]):
+                continue
+            self.last_strengths[k] = strength
+            opacity = self.network.neuron_fill_opacity
+            self.fill_groups(layer.neurons, [(rgb_to_hex(self.neuron_colors[k] * s), opacity) for s in strength])
+
+    def finish(self):
+        super().finish()
+        for layer, fills in zip(self.network.layers, self.start_fills):
+            self.fill_groups(layer.neurons, fills)
+        for bundle, rgbas in zip(self.bundles, self.base_rgbas):
+            bundle.edge_rgbas[:] = rgbas
+            bundle.rebuild()
 
 
 class myNeuralNetwork(Scene):
     def construct(self):
         myNetwork = NeuralNetworkMobject([15, 8, 6, 4, 2])
 
-        myNetwork.label_inputs('x')
-        myNetwork.label_outputs('\hat{y}')
-        myNetwork.label_hidden_layers('a')
-        myNetwork.label_outputs_text(['Clase 1', 'Clase 2'])
+        # todas las etiquetas en una sola compilacion de LaTeX
+        myNetwork.add_labels(
+            inputs='x',
+            outputs=r'\hat{y}',
+            hidden='a',
+            outputs_text=['Clase 1', 'Clase 2'],
+        )
 
         texto = MarkupText("Red Neuronal \n Clasificacion Múltiple", font_size=26).to_corner(UL)
         self.play(Write(texto), Write(myNetwork.shift(RIGHT)), run_time=12)
         self.play(Circumscribe(texto))
         self.wait(5)
+
+
+class myForwardPropagation(Scene):
+    def construct(self):
+        sizes = [8, 12, 12, 4]
+        myNetwork = NeuralNetworkMobject(sizes, edge_stroke_width=1.5)
+
+        rng = np.random.default_rng(0)
+        weights = [rng.normal(0, 1, (a, b)) for a, b in zip(sizes[:-1], sizes[1:])]
+        inputs = rng.uniform(-1, 1, (3, sizes[0]))
+
+        texto = Text("Propagacion hacia adelante", font_size=26).to_corner(UL)
+        self.play(Write(texto), Create(myNetwork), run_time=3)
+        self.play(ForwardPropagation(myNetwork, weights, inputs))
+        self.wait(2)
@@ -1,4 +1,12 @@
 from manim import *
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from latex2python import tangentLines
+from timelines import TrackerTimeline, graph_points
+from gradientDescent import simulate, TrajectoryCloud, RunDescent
+from curves import plot
 
 class BasesEjes(Scene):
     def construct(self):
@@ -61,9 +69,9 @@ class BasesEjes(Scene):
         title1 = Title(r"Curvas de Indiferencia", include_underline=False, font_size=40)
 
         curves = VGroup()
-        curves += ax1.plot(lambda x: 15 / x, color=WHITE)
-        curves += ax1.plot(lambda x: 10 / x, color=WHITE)
-        curves += ax1.plot(lambda x: 5 / x, color=WHITE)
+        curves += plot(ax1, lambda x: 15 / x, color=WHITE)
+        curves += plot(ax1, lambda x: 10 / x, color=WHITE)
+        curves += plot(ax1, lambda x: 5 / x, color=WHITE)
 
         label_1 = ax1.get_graph_label(curves[0], MathTex(r"\frac{15}{x}", font_size=25), x_val=4, direction=UP)
         label_2 = ax1.get_graph_label(curves[1], MathTex(r"\frac{10}{x}", font_size=25), x_val=3, direction=DOWN)
@@ -101,20 +109,23 @@ class BasesEjes(Scene):
         def func(x):
             return 8 * (x - 5)**2 + 10
 
-        graph = ax2.plot(func, color=WHITE)
+        graph = plot(ax2, func, color=WHITE)
 
         line_1 = ax2.get_vertical_line(ax2.input_to_graph_point(6, graph), color=YELLOW)
         line_2 = ax2.get_vertical_line(ax2.input_to_graph_point(4, graph), color=YELLOW)
 
+        # rectas tangentes exactas en x = 6 y x = 4
+        slopes, intercepts = tangentLines(r"8 \cdot ( x - 5)^{ 2 } + 10", [6, 4])
+
         def linear(x):
-            return 16*x - 78
+            return slopes[0]*x + intercepts[0]
 
     
         def linear2(x):
-            return -16*x + 82
+            return slopes[1]*x + intercepts[1]
     
-        linear_graph = ax2.plot(linear, color=BLUE)
-        linear_graph2 = ax2.plot(linear2, color=BLUE)
+        linear_graph = plot(ax2, linear, color=BLUE)
+        linear_graph2 = plot(ax2, linear2, color=BLUE)
 
 
         initial_point = [ax2.coords_to_point(t.get_value(), func(t.get_value()))]
@@ -127,9 +138,8 @@ class BasesEjes(Scene):
             mobject.next_to(dot, UP)
 
 
-        dot.add_updater(lambda x: x.move_to(ax2.c2p(t.get_value(), func(t.get_value()))))
         dotLabel = DecimalNumber(font_size=24)
-        dotLabel.add_updater(lambda l: l.set_value(t.get_value()+0.02).next_to(dot, UP))
+        dotLabel.add_updater(lambda l: l.next_to(dot, UP))
         #lambda l: l.set_value(dot.get_x)
 
         x_space = np.linspace(*ax2.x_range[:2], 200)
@@ -139,24 +149,78 @@ class BasesEjes(Scene):
                         linear_graph, linear_graph2, line_1, line_2).scale(0.6)
 
         self.play(ReplacementTransform(texto0, texto1), ReplacementTransform(grupo2, grupo3))
-        self.add(dotLabel)
+        self.add(dotLabel.set_value(t.get_value()+0.02).next_to(dot, UP))
+
+        # keyframes de t conocidos de antemano: posiciones del punto y valores
+        # de la etiqueta se calculan en una sola pasada
+        minimum = x_space[minimum_index]
+        timeline = TrackerTimeline(t)
+        timeline.bind_position(dot, lambda x: graph_points(ax2, func, x))
+        timeline.bind_value(dotLabel, lambda x: x + 0.02)
+        for value in [minimum + 3, minimum - 3, minimum + 2.2, minimum - 2.2, minimum + 1,
+                      minimum, minimum - 1, minimum]:
+            timeline.to(value)
+        steps = timeline.compile()
 
-        self.play(t.animate.set_value(x_space[minimum_index] + 3))
-        self.play(t.animate.set_value(x_space[minimum_index] - 3))
-        self.play(t.animate.set_value(x_space[minimum_index] + 2.2))
-        self.play(t.animate.set_value(x_space[minimum_index] - 2.2))
-        self.play(t.animate.set_value(x_space[minimum_index] + 1))
+        for step in steps[:5]:
+            self.play(step)
 
 
         self.play(Create(line_1, run_time=1))
         self.play(Create(linear_graph, run_time=1))
-        self.play(t.animate.set_value(x_space[minimum_index]), run_time=1)
+        self.play(steps[5], run_time=1)
 
 
-        self.play(t.animate.set_value(x_space[minimum_index] - 1))
+        self.play(steps[6])
         self.play(Create(line_2))
         self.play(Create(linear_graph2))
-        self.play(t.animate.set_value(x_space[minimum_index]))
+        self.play(steps[7])
+
+
+        self.wait(5)
 
+class DescensoGradienteMasivo(Scene):
+    def construct(self):
+        rng = np.random.default_rng(0)
+
+        ## 1D: la misma funcion de perdida, 2000 puntos iniciales a la vez
+        ax = Axes(
+            x_range=[2, 8], y_range=[0, 100, 10], axis_config={"include_tip": False}
+        ).add_coordinates().scale(0.8)
+
+        def func(x):
+            return 8 * (x - 5)**2 + 10
 
-        self.wait(5)
\ No newline at end of file
+        graph = plot(ax, func, color=WHITE)
+        title = Title(r"2000 descensos de gradiente en paralelo", include_underline=False, font_size=40)
+
+        trajectories = simulate(func, rng.uniform(2.2, 7.8, 2000), "gd", lr=0.01, steps=120)
+        cloud = TrajectoryCloud(ax, trajectories, func, color=RED)
+
+        self.play(Create(ax), Create(graph), Write(title))
+        self.play(FadeIn(cloud))
+        self.play(RunDescent(cloud), run_time=5)
+        self.wait(2)
+        self.play(FadeOut(VGroup(ax, graph, title)), FadeOut(cloud))
+
+        ## 2D: Rosenbrock, GD vs Momentum vs Adam vistos desde arriba
+        plane = NumberPlane(x_range=[-2, 2], y_range=[-1, 3], x_length=6, y_length=6)
+
+        def rosenbrock(p):
+            x, y = p[:, 0], p[:, 1]
+            return (1 - x)**2 + 100 * (y - x**2)**2
+
+        starts = rng.uniform([-2, -1], [2, 3], (3000, 2))
+        clouds = VGroup()
+        names = VGroup()
+        for optimizer, lr, color in [("gd", 2e-4, RED), ("momentum", 2e-4, YELLOW), ("adam", 0.02, BLUE)]:
+            path = simulate(rosenbrock, starts, optimizer, lr=lr, steps=300, clip=100)
+            clouds.add(TrajectoryCloud(plane, path, color=color, stroke_width=2))
+            names.add(Text(optimizer, font_size=24, color=color))
+        names.arrange(DOWN, aligned_edge=LEFT).to_corner(UR)
+        minimum = Dot(plane.c2p(1, 1), color=WHITE)
+
+        self.play(Create(plane), FadeIn(names), FadeIn(minimum))
+        self.add(clouds)
+        self.play(*[RunDescent(cloud) for cloud in clouds], run_time=8)
+        self.wait(2)
@@ -1,5 +1,12 @@
 from manim import * 
-import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from curves import AdaptiveParametricFunction, plot
+from datasets import dataset
+from barChartRace import BarChartRace, RunRace
+from implicitCurves import QuadtreeImplicitFunction
 
 # Data en PBI por pais:
 # https://databank.worldbank.org/reports.aspx?source=2&series=NY.GDP.MKTP.CD&country=#
@@ -8,10 +15,11 @@ import pandas as pd
 class funcProb(Scene):
    
     def func(self, t):
-        return np.array([np.sin(10*t), np.sin(8*t), 0])
+        # 0*t en vez de 0: asi acepta un array de t entero
+        return np.array([np.sin(10*t), np.sin(8*t), 0*t])
 
     def construct(self):
-        func = ParametricFunction(self.func, t_range = np.array([0, 10]),
+        func = AdaptiveParametricFunction(self.func, t_range = np.array([0, 10]),
                  fill_opacity=0).set_color(RED).scale(1.5)
         # cambiar por self.play(Create(func))
         self.add(func)
@@ -25,8 +33,9 @@ class funcProb2(Scene):
         titulo1 = Title("Funciones Paramétricas")
         self.add(titulo1)
 
-        func = ParametricFunction(
-                 lambda t: np.array([np.sin(10*t), np.sin(8*t), 0]),
+        # Lissajous: los puntos se concentran en las vueltas cerradas
+        func = AdaptiveParametricFunction(
+                 lambda t: np.array([np.sin(10*t), np.sin(8*t), 0*t]),
                  t_range = np.array([0, 10]),
                  fill_opacity=0).set_color(RED).scale(1.5)
 
@@ -35,8 +44,8 @@ class funcProb2(Scene):
         self.play(Create(func), Write(funcText), run_time=6)
         self.wait(2)
 
-        astroid = ParametricFunction(
-                    lambda t: np.array([np.cos(t*5), np.sin(t)**3, 0]),
+        astroid = AdaptiveParametricFunction(
+                    lambda t: np.array([np.cos(t*5), np.sin(t)**3, 0*t]),
                     t_range = np.array([0, 7]),
                     fill_opacity=0).set_color(BLUE_B).scale(1.5)
 
@@ -64,7 +73,8 @@ class funcProb2(Scene):
             tips=False,
         ).scale(0.7)
 
-        corazon = ImplicitFunction(
+        # quadtree: se refina solo cerca de la curva, con las cuspides bien marcadas
+        corazon = QuadtreeImplicitFunction(
             lambda x,y: (x**2 + y**2 - 1)**3 - x**2 * y**3,
             color=RED
         )
@@ -85,8 +95,8 @@ class funcProb2(Scene):
         # Sin Cos
 
         axes_labels = axes.get_axis_labels()
-        sin_graph = axes.plot(lambda x: np.sin(x), color=BLUE)
-        cos_graph = axes.plot(lambda x: np.cos(x), color=RED)
+        sin_graph = plot(axes, lambda x: np.sin(x), color=BLUE)
+        cos_graph = plot(axes, lambda x: np.cos(x), color=RED)
 
         sin_label = axes.get_graph_label(
             sin_graph, "\\sin(x)", x_val=-10, direction=UP / 2
@@ -100,11 +110,11 @@ class funcProb2(Scene):
             cos_graph, "x=2\pi", x_val=TAU, direction=UR, color=WHITE
         )
 
-        plot = VGroup(axes, sin_graph, cos_graph, vert_line)
+        grafico = VGroup(axes, sin_graph, cos_graph, vert_line)
         labels = VGroup(axes_labels, sin_label, cos_label, line_label)
 
         self.play(Uncreate(corGroup))
-        self.play(Create(plot), FadeIn(labels), run_time=5)
+        self.play(Create(grafico), FadeIn(labels), run_time=5)
 
         self.wait(2)
 
@@ -134,13 +144,14 @@ class funcProb2(Scene):
 
         # BarChart con data real
 
-        data = pd.read_csv("gdp_per_country.csv")
+        # el CSV se parsea una vez, despues se leen solo estas columnas y filas
+        data = dataset(os.path.join(os.path.dirname(os.path.abspath(__file__)), "gdp_per_country.csv"))
 
         paises = ["Argentina", "Chile", "Uruguay", "Brazil", "Finland", "France", "Germany", "Spain"]
 
-        cleanedData = data.query("`Country Name` in @paises")
+        cleanedData = data.select(["2020", "2021"], where={"Country Name": paises})
 
-        cambioGDP = round((cleanedData["2021"].astype(float) - cleanedData["2020"].astype(float)) / 1000000, 2)
+        cambioGDP = round((cleanedData["2021"] - cleanedData["2020"]) / 1000000, 2)
 
         chart2 = BarChart(
             cambioGDP,
@@ -160,4 +171,32 @@ class funcProb2(Scene):
 
         self.play(FadeOut(chart2.get_bar_labels(font_size=24)))
 
-        self.wait(5)
\ No newline at end of file
+        self.wait(5)
+
+
+# Carrera de barras con todos los anios de la tabla y todos los paises
+class carreraPBI(Scene):
+
+    def construct(self):
+
+        data = dataset(os.path.join(os.path.dirname(os.path.abspath(__file__)), "gdp_per_country.csv"))
+
+        anios = [c for c in data.columns if c.isdigit()]
+        tabla = data.select(["Country Name"] + anios)
+        # despues de Zimbabwe vienen los agregados (regiones, "World", ...)
+        paises = tabla.loc[:tabla.index[tabla["Country Name"] == "Zimbabwe"][0]]
+
+        race = BarChartRace(
+            paises["Country Name"],
+            [int(a) for a in anios],
+            paises[anios].to_numpy().T,
+            top_n=10,
+            value_format=lambda v: f"{v / 1e9:,.0f}B",
+        )
+
+        titulo = Title("PBI por país (u$d)")
+
+        self.add(titulo)
+        self.play(FadeIn(race))
+        self.play(RunRace(race), run_time=len(anios) * 2)
+        self.wait(2)
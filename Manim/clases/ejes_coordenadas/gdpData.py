@@ -1,12 +1,15 @@
-import pandas as pd
-import numpy as np
+import os
+import sys
 
-data = pd.read_csv('C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\ejes_coordenadas\\gdp_per_country.csv')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from datasets import dataset
+
+data = dataset(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gdp_per_country.csv'))
 
 paises = ['Argentina', 'Chile', 'Uruguay', 'Brazil', 'Finland', 'France', 'Germany', 'Spain']
 
-cleanedData = data.query('`Country Name` in @paises')
+cleanedData = data.select(['Country Name', '2020', '2021'], where={'Country Name': paises})
 
-cambioGDP = (cleanedData['2021'].astype(float) - cleanedData['2020'].astype(float))
+cambioGDP = cleanedData['2021'] - cleanedData['2020']
 
-print(cambioGDP)
\ No newline at end of file
+print(cambioGDP)
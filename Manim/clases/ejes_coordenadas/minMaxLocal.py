@@ -1,11 +1,16 @@
 from manim import *
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "extra"))
+from curves import plot
         
 class LocalMinMax(Scene):
     def construct(self):
 
         ax = Axes().add_coordinates()
 
-        func = ax.plot(lambda x: (x-2)**2 + 1, color=WHITE)
+        func = plot(ax, lambda x: (x-2)**2 + 1, color=WHITE)
         dot = Dot(ax.coords_to_point(2, 1), color=RED)
         lines = ax.get_lines_to_point(ax.c2p(2,1))
 
@@ -24,7 +29,7 @@ class LocalMinMax(Scene):
 
         ax2 = Axes().add_coordinates()
 
-        func2 = ax2.plot(lambda x: -( (x-2)**2 ) + 1, color=WHITE)
+        func2 = plot(ax2, lambda x: -( (x-2)**2 ) + 1, color=WHITE)
         dot2 = Dot(ax2.coords_to_point(2, 1), color=RED)
         lines2 = ax2.get_lines_to_point(ax2.c2p(2,1))
 
@@ -0,0 +1,69 @@
+from manim import *
+
+## Tablas de longitud de arco para point_from_proportion y MoveAlongPath
+## La tabla se construye una vez por curva y se guarda en el mobject, se
+## rehace solo si cambian sus puntos. Cada consulta es una busqueda binaria
+## mas una interpolacion, y acepta arrays de proporciones
+
+
+# Cubic Bernstein basis at t, shape (..., 4)
+def bernstein(t):
+    t = np.asarray(t, dtype=float)[..., None]
+    return np.concatenate([(1 - t) ** 3, 3 * t * (1 - t) ** 2, 3 * t ** 2 * (1 - t), t ** 3], axis=-1)
+
+
+# Cumulative length of a VMobject's cubic curves, sampled samples_per_curve
+# times per curve, all curves at once
+class ArcLengthTable:
+    def __init__(self, points, samples_per_curve=16):
+        self.points = np.array(points, dtype=float)
+        self.samples_per_curve = samples_per_curve
+        self.curves = self.points[:len(self.points) // 4 * 4].reshape(-1, 4, 3)
+        samples = np.einsum("kj,cjd->ckd", bernstein(np.linspace(0, 1, samples_per_curve + 1)), self.curves)
+        steps = np.linalg.norm(np.diff(samples, axis=1), axis=2).ravel()
+        self.lengths = np.concatenate([[0], np.cumsum(steps)])
+
+    def matches(self, points):
+        return points.shape == self.points.shape and np.array_equal(points, self.points)
+
+    def get_length(self):
+        return self.lengths[-1]
+
+    def curve_parameters(self, alpha):
+        # proportion of the total length -> (curve index, bezier t)
+        target = np.clip(np.asarray(alpha, dtype=float), 0, 1) * self.get_length()
+        j = np.clip(np.searchsorted(self.lengths, target, side="right") - 1, 0, len(self.lengths) - 2)
+        width = self.lengths[j + 1] - self.lengths[j]
+        w = np.where(width > 0, (target - self.lengths[j]) / np.where(width > 0, width, 1), 0)
+        k = self.samples_per_curve
+        return j // k, (j % k + w) / k
+
+    def point_from_proportion(self, alpha):
+        if len(self.curves) == 0:
+            return np.zeros(np.shape(alpha) + (3,))
+        curve, t = self.curve_parameters(alpha)
+        return np.einsum("...j,...jd->...d", bernstein(t), self.curves[curve])
+
+
+# Table of a mobject, rebuilt only when its points changed since last time
+def arc_length_table(mobject, samples_per_curve=16):
+    table = getattr(mobject, "arc_length_table", None)
+    if table is None or table.samples_per_curve != samples_per_curve or not table.matches(mobject.points):
+        table = ArcLengthTable(mobject.points, samples_per_curve)
+        mobject.arc_length_table = table
+    return table
+
+
+# Same as mobject.point_from_proportion, alpha may be a number or an array
+def point_from_proportion(mobject, alpha):
+    return arc_length_table(mobject).point_from_proportion(alpha)
+
+
+# MoveAlongPath that reads the path's cached table every frame
+class MoveAlongArcLength(Animation):
+    def __init__(self, mobject, path, suspend_mobject_updating=False, **kwargs):
+        self.path = path
+        super().__init__(mobject, suspend_mobject_updating=suspend_mobject_updating, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.move_to(point_from_proportion(self.path, self.rate_func(alpha)))
@@ -0,0 +1,119 @@
+import os
+import sys
+import json
+
+from imageCache import CachedImageMobject, display_height, load_level
+
+## Registro de los archivos en Manim/Assets
+## Los assets se piden por nombre (el nombre del archivo sin extension), el
+## manifest.json dice donde esta cada uno. Pedir un asset no lee nada: la
+## imagen se decodifica la primera vez que se usa y queda compartida en el
+## proceso, asi un render de una sola escena carga solo lo que esa escena usa.
+##
+##   penguin = assets["penguin"]                # handle, sin leer el archivo
+##   self.add(penguin.image().scale(0.7))       # se decodifica aca
+##   self.add_sound(assets.path("Rocket_Countdown"))
+##
+## Para regenerar el manifest despues de agregar archivos:
+##   python assets.py
+
+ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Assets"))
+MANIFEST = os.path.join(ASSETS_DIR, "manifest.json")
+
+kinds = {
+    "image": (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff"),
+    "sound": (".mp3", ".wav", ".ogg"),
+}
+
+
+def scan_assets(root=ASSETS_DIR):
+    manifest = {}
+    for folder, _, files in sorted(os.walk(root)):
+        for file in sorted(files):
+            stem, ext = os.path.splitext(file)
+            kind = next((k for k, exts in kinds.items() if ext.lower() in exts), None)
+            if kind is None:
+                continue
+            if stem in manifest:
+                raise ValueError(f"two assets named {stem!r}: {manifest[stem]['path']} and {file}")
+            manifest[stem] = {
+                "path": os.path.relpath(os.path.join(folder, file), root).replace(os.sep, "/"),
+                "kind": kind,
+            }
+    return manifest
+
+
+def write_manifest(path=MANIFEST):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(scan_assets(os.path.dirname(path)), f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+# Lazy handle of one asset, nothing is read until image()/pixels() is called
+class Asset:
+    def __init__(self, registry, name, path, kind):
+        self.registry = registry
+        self.name = name
+        self.path = path
+        self.kind = kind
+
+    def __repr__(self):
+        return f"Asset({self.name!r}, {self.path!r})"
+
+    def pixels(self, height=None):
+        return self.registry.pixels(self.path, height)
+
+    # a new mobject each time, the decoded pixels are shared
+    def image(self, height=None, **kwargs):
+        return CachedImageMobject(self.path, height=height, pixels=self.pixels(height), **kwargs)
+
+
+class AssetRegistry:
+    def __init__(self, root=ASSETS_DIR, manifest=None):
+        self.root = root
+        self.manifest_path = manifest or os.path.join(root, "manifest.json")
+        self.entries = None
+        self.decoded = {}
+
+    def load_manifest(self):
+        if self.entries is None:
+            if os.path.exists(self.manifest_path):
+                with open(self.manifest_path, encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            else:
+                self.entries = scan_assets(self.root)
+        return self.entries
+
+    def names(self):
+        return sorted(self.load_manifest())
+
+    def __contains__(self, name):
+        return name in self.load_manifest()
+
+    def __getitem__(self, name):
+        entries = self.load_manifest()
+        if name not in entries:
+            raise KeyError(f"unknown asset {name!r}, see {self.manifest_path}")
+        entry = entries[name]
+        return Asset(self, name, os.path.join(self.root, *entry["path"].split("/")), entry["kind"])
+
+    def path(self, name):
+        return self[name].path
+
+    def image(self, name, height=None, **kwargs):
+        return self[name].image(height, **kwargs)
+
+    # decoded once per process and output resolution
+    def pixels(self, path, height=None):
+        height, target_pixel_height = display_height(path, height)
+        key = (path, round(target_pixel_height))
+        if key not in self.decoded:
+            self.decoded[key] = load_level(path, target_pixel_height)
+        return self.decoded[key]
+
+
+assets = AssetRegistry()
+
+
+if __name__ == "__main__":
+    write_manifest(sys.argv[1] if len(sys.argv) > 1 else MANIFEST)
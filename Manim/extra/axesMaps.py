@@ -0,0 +1,47 @@
+from manim import *
+
+## Coordenadas de unos ejes -> puntos de la escena para muchos puntos a la vez
+## Si los ejes son lineales el mapa es afin (un origen y un vector por eje)
+## y todo se pasa con una multiplicacion de matrices; con ejes en escala
+## logaritmica (o cualquier otra) se usa c2p punto por punto.
+##
+##   puntos = coords_to_points(ax, np.stack([xs, f(xs)], axis=-1))
+##   a_escena = axes_map(ax)      # para usar el mismo mapa muchas veces
+
+
+# Affine map of the first dim axes as (origin, units), units[i] being the
+# scene vector of one unit along axis i. None when the map does not give
+# c2p at the corners of the axes' ranges (log scaled axes, for example,
+# where c2p of 0 is not even defined).
+def axes_affine(axes, dim=2):
+    try:
+        with np.errstate(all="ignore"):
+            origin = np.array(axes.c2p(*np.zeros(dim)), dtype=float)
+            units = np.array([np.array(axes.c2p(*np.eye(dim)[i]), dtype=float) - origin for i in range(dim)])
+            ranges = [axis.x_range[:2] for axis in axes.get_axes()[:dim]]
+            corners = np.array(np.meshgrid(*ranges)).reshape(dim, -1).T
+            for coords in corners:
+                if not np.allclose(axes.c2p(*coords), origin + coords @ units):
+                    return None
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return None
+    return origin, units
+
+
+# coords (..., dim) -> scene points (..., 3) for these axes: one matrix
+# product when axes_affine finds them linear, c2p per point otherwise
+def axes_map(axes, dim=2):
+    frame = axes_affine(axes, dim)
+    if frame is None:
+        def to_scene(coords):
+            coords = np.asarray(coords, dtype=float)
+            points = [axes.c2p(*row) for row in coords.reshape(-1, dim)]
+            return np.array(points, dtype=float).reshape(coords.shape[:-1] + (3,))
+        return to_scene
+    origin, units = frame
+    return lambda coords: origin + np.asarray(coords, dtype=float) @ units
+
+
+def coords_to_points(axes, coords):
+    coords = np.asarray(coords, dtype=float)
+    return axes_map(axes, coords.shape[-1])(coords)
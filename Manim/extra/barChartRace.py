@@ -0,0 +1,180 @@
+from manim import *
+
+from liveMobjects import RunParameter, polyline_points
+
+## Carrera de barras sobre una serie de tiempo completa
+## Valores, rankings y posiciones de todos los paises se interpolan como
+## arrays en cada frame; solo existen los mobjects de las top_n barras que
+## se ven (mas dos que entran o salen). Las letras no se vuelven a crear:
+## cada nombre se convierte en contornos una sola vez y los numeros se
+## arman copiando los contornos de sus digitos.
+##
+##   race = BarChartRace(paises, anios, valores)     # valores: (anios, paises)
+##   self.add(race)
+##   self.play(RunRace(race), run_time=20)
+
+
+# Glyph outlines cut once from Text and reused: whole strings for names,
+# and a fixed set of characters that numbers are put together from
+class GlyphCache:
+    characters = "0123456789.,-+$%BMKT"
+
+    def __init__(self, font_size=24, **text_kwargs):
+        self.font_size = font_size
+        self.text_kwargs = text_kwargs
+        self.strings = {}
+        # one Text for every character, so they all share its baseline
+        template = Text(self.characters, font_size=font_size, **text_kwargs)
+        middle = template.get_center()[1]
+        self.chars = {
+            char: (glyph.points - np.array([glyph.get_left()[0], middle, 0]), glyph.width)
+            for char, glyph in zip(self.characters, template.submobjects)
+        }
+        self.gap = 0.15 * self.chars["0"][1]
+
+    # outline of a string, right end at x = 0 and vertically centered
+    def text(self, string):
+        if string not in self.strings:
+            text = Text(string, font_size=self.font_size, **self.text_kwargs)
+            points = [m.points for m in text.family_members_with_points()]
+            offset = np.array([text.get_right()[0], text.get_center()[1], 0])
+            self.strings[string] = (np.concatenate(points) if points else np.zeros((0, 3))) - offset
+        return self.strings[string]
+
+    # outline of a number written with self.characters, left end at x = 0
+    def number(self, string):
+        pieces = []
+        x = 0
+        for char in string:
+            if char not in self.chars:
+                raise KeyError(f"{char!r} is not one of the number characters {self.characters!r}")
+            points, width = self.chars[char]
+            pieces.append(points + np.array([x, 0, 0]))
+            x += width + self.gap
+        return np.concatenate(pieces) if pieces else np.zeros((0, 3))
+
+
+# values is (len(times), len(names)); missing values (NaN) keep the last
+# known value. set_time takes fractional times: values and rank positions
+# are interpolated between the two surrounding keyframes.
+class BarChartRace(VGroup):
+    def __init__(
+        self,
+        names,
+        times,
+        values,
+        top_n=10,
+        row_height=0.5,
+        bar_length=7,
+        name_width=2.5,
+        colors=None,
+        font_size=20,
+        value_format=lambda v: f"{v:,.0f}",
+        time_format=lambda t: f"{t:.0f}",
+        **kwargs,
+    ):
+        VGroup.__init__(self, **kwargs)
+        self.names = list(names)
+        self.times = np.asarray(times, dtype=float)
+        self.values = np.array(values, dtype=float).reshape(len(self.times), len(self.names))
+        for t in range(1, len(self.times)):
+            missing = np.isnan(self.values[t])
+            self.values[t, missing] = self.values[t - 1, missing]
+        self.values = np.nan_to_num(self.values, nan=0.0)
+
+        # rank of every name at every keyframe, 0 is the largest
+        order = np.argsort(-self.values, axis=1, kind="stable")
+        self.ranks = np.empty_like(order)
+        np.put_along_axis(self.ranks, order, np.arange(len(self.names))[None].repeat(len(self.times), axis=0), axis=1)
+
+        self.top_n = top_n
+        self.row_height = row_height
+        self.bar_length = bar_length
+        self.name_width = name_width
+        self.gap = 0.2
+        colors = colors or [BLUE, TEAL, GREEN, YELLOW, GOLD, RED, MAROON, PURPLE, PINK, ORANGE]
+        self.colors = [colors[i % len(colors)] for i in range(len(self.names))]
+        self.value_format = value_format
+        self.time_format = time_format
+        self.glyphs = GlyphCache(font_size)
+        self.time_glyphs = GlyphCache(2 * font_size)
+
+        # one unit right and one unit up from the chart's top left corner, it
+        # moves with the group so set_time draws wherever the chart was put
+        self.reference = VMobject(stroke_opacity=0, fill_opacity=0)
+        self.reference.set_points(np.array([ORIGIN, RIGHT, UP, ORIGIN]))
+        slots = min(top_n + 2, len(self.names))
+        self.bars = VGroup(*[VMobject(stroke_width=0, fill_opacity=1) for _ in range(slots)])
+        self.labels = VGroup(*[VMobject(stroke_width=0, fill_color=WHITE, fill_opacity=1) for _ in range(slots)])
+        self.numbers = VGroup(*[VMobject(stroke_width=0, fill_color=WHITE, fill_opacity=1) for _ in range(slots)])
+        self.time_label = VMobject(stroke_width=0, fill_color=GREY_B, fill_opacity=1)
+        self.add(self.reference, self.bars, self.labels, self.numbers, self.time_label)
+        self.slot_names = [None] * slots
+        self.slot_opacities = [None] * slots
+
+        self.time = 0
+        self.set_time(0)
+        self.center()
+
+    def get_num_times(self):
+        return len(self.times)
+
+    def to_scene(self, local):
+        origin, right, up = self.reference.points[:3]
+        return origin + local[..., :1] * (right - origin) + local[..., 1:2] * (up - origin)
+
+    def set_time(self, time):
+        last = len(self.times) - 1
+        self.time = np.clip(time, 0, last)
+        i = min(int(self.time), max(last - 1, 0))
+        w = self.time - i if last else 0
+        j = min(i + 1, last)
+        values = (1 - w) * self.values[i] + w * self.values[j]
+        ranks = (1 - w) * self.ranks[i] + w * self.ranks[j]
+
+        shown = np.argsort(ranks, kind="stable")[:len(self.bars)]
+        # full opacity down to rank top_n - 1, fading to 0 at rank top_n
+        opacities = np.clip(self.top_n - ranks[shown], 0, 1)
+        visible = values[shown][opacities > 0]
+        top = visible.max() if len(visible) and visible.max() > 0 else 1
+        lengths = self.bar_length * np.clip(values[shown], 0, None) / top
+        ys = -(ranks[shown] + 0.5) * self.row_height
+
+        x0 = self.name_width + self.gap
+        h = 0.4 * self.row_height
+        corners = np.zeros((len(shown), 5, 3))
+        corners[:, :, 0] = x0 + np.outer(lengths, [0, 1, 1, 0, 0])
+        corners[:, :, 1] = ys[:, None] + np.array([h, h, -h, -h, h])
+        bar_points = self.to_scene(polyline_points(corners))
+
+        for k, n in enumerate(shown):
+            bar, label, number = self.bars[k], self.labels[k], self.numbers[k]
+            bar.set_points(bar_points[k])
+            if self.slot_names[k] != n:
+                self.slot_names[k] = n
+                bar.set_fill(self.colors[n])
+            label.set_points(self.to_scene(self.glyphs.text(self.names[n]) + np.array([self.name_width, ys[k], 0])))
+            number.set_points(self.to_scene(
+                self.glyphs.number(self.value_format(values[n])) + np.array([x0 + lengths[k] + self.gap, ys[k], 0])
+            ))
+            if self.slot_opacities[k] != opacities[k]:
+                self.slot_opacities[k] = opacities[k]
+                for mob in (bar, label, number):
+                    mob.set_fill(opacity=opacities[k])
+
+        label = self.time_glyphs.number(self.time_format(self.times[int(round(self.time))]))
+        right = x0 + self.bar_length - (label[:, 0].max() if len(label) else 0)
+        self.time_label.set_points(self.to_scene(label + np.array([right, -(self.top_n - 0.5) * self.row_height, 0])))
+        return self
+
+
+# Plays the race from its current time to `to` (the last keyframe by default)
+class RunRace(RunParameter):
+    def last_value(self, race):
+        return race.get_num_times() - 1
+
+    def get_value(self):
+        return self.mobject.time
+
+    def set_value(self, time):
+        self.mobject.set_time(time)
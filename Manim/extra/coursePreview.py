@@ -1,11 +1,18 @@
 from manim import *
 from manim_fonts import *
+from latex2python import tangentLines
+from liveMobjects import GrowingPath, LiveSegment
+from timelines import TrackerTimeline, graph_points
+from arcLength import point_from_proportion, MoveAlongArcLength
+from assets import assets
+from curves import plot
 
 ## Split into various scenes for rapid testing and compiling
 ## Merge clips with editor once finished
 
-penguin = ImageMobject("C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\penguin.png").shift(DOWN*3.5 + LEFT*4.5).scale(0.7)
-penguin2 = ImageMobject("C:\\Users\\Bonoc\\Documents\\GitHub\\Animation_Python\\Manim\\Assets\\Images\\penguin2.png").shift(DOWN*3 + LEFT*5.2).scale(0.7)
+# handles, las imagenes se decodifican recien cuando una escena las usa
+penguin = assets["penguin"]
+penguin2 = assets["penguin2"]
 
 
 class StarWars(ThreeDScene):
@@ -24,10 +31,11 @@ class StarWars(ThreeDScene):
             self.wait(1)
             self.play(text.animate.shift(14*UP), run_time=9)
 
-        self.play(GrowFromPoint(penguin, [-4, -2, 0]))
-        saludo = Text("Hola! Soy Dr. Gus").next_to(penguin, UP).scale(0.5)
+        gus = penguin.image().shift(DOWN*3.5 + LEFT*4.5).scale(0.7)
+        self.play(GrowFromPoint(gus, [-4, -2, 0]))
+        saludo = Text("Hola! Soy Dr. Gus").next_to(gus, UP).scale(0.5)
         self.play(Write(saludo))
-        self.play(ApplyWave(penguin), Circumscribe(saludo, time_width=3), run_time=2)
+        self.play(ApplyWave(gus), Circumscribe(saludo, time_width=3), run_time=2)
         self.wait(1)
 
         self.clear()
@@ -36,7 +44,7 @@ class StarWars(ThreeDScene):
         texto1 = Text("Permitanme demostrarles algunas de las \nmaravillosas cosas que podemos crear", font_size=30)
         texto2 = Text("Ups, mejor ajustemos la camara", font_size=30).shift(DOWN*2.5)
 
-        self.add(penguin2, texto1)
+        self.add(penguin2.image().shift(DOWN*3 + LEFT*5.2).scale(0.7), texto1)
         self.wait(2)
         self.play(FadeIn(texto2))
 
@@ -213,20 +221,23 @@ class GradientDescent(Scene):
         def func(x):
             return 8 * (x - 5)**2 + 10
 
-        graph = ax.plot(func, color=WHITE)
+        graph = plot(ax, func, color=WHITE)
 
         line_1 = ax.get_vertical_line(ax.input_to_graph_point(6.5, graph), color=YELLOW)
         line_2 = ax.get_vertical_line(ax.input_to_graph_point(3.5, graph), color=YELLOW)
 
+        # rectas tangentes exactas en x = 6.5 y x = 3.5
+        slopes, intercepts = tangentLines(r"8 \cdot ( x - 5)^{ 2 } + 10", [6.5, 3.5])
+
         def linear(x):
-            return 25*x - 135
+            return slopes[0]*x + intercepts[0]
 
     
         def linear2(x):
-            return -25*x + 115
+            return slopes[1]*x + intercepts[1]
     
-        linear_graph = ax.plot(linear, color=BLUE)
-        linear_graph2 = ax.plot(linear2, color=BLUE)
+        linear_graph = plot(ax, linear, color=BLUE)
+        linear_graph2 = plot(ax, linear2, color=BLUE)
 
 
         initial_point = [ax.coords_to_point(t.get_value(), func(t.get_value()))]
@@ -235,7 +246,6 @@ class GradientDescent(Scene):
         dot2 = Dot(point=point_2)
 
 
-        dot.add_updater(lambda x: x.move_to(ax.c2p(t.get_value(), func(t.get_value()))))
         x_space = np.linspace(*ax.x_range[:2],200)
         minimum_index = func(x_space).argmin()
         
@@ -244,22 +254,29 @@ class GradientDescent(Scene):
         self.play(Create(graph))
         self.add(dot)
 
-        self.play(t.animate.set_value(x_space[minimum_index] + 3.5))
-        self.play(t.animate.set_value(x_space[minimum_index] - 3.5))
-        self.play(t.animate.set_value(x_space[minimum_index] + 2.5))
-        self.play(t.animate.set_value(x_space[minimum_index] - 2.5))
-        self.play(t.animate.set_value(x_space[minimum_index] + 1.5))
+        # todos los keyframes de t se conocen de antemano, las posiciones del
+        # punto se calculan de una vez y cada frame solo las lee
+        minimum = x_space[minimum_index]
+        timeline = TrackerTimeline(t)
+        timeline.bind_position(dot, lambda x: graph_points(ax, func, x))
+        for value in [minimum + 3.5, minimum - 3.5, minimum + 2.5, minimum - 2.5, minimum + 1.5,
+                      minimum, minimum - 1.5, minimum]:
+            timeline.to(value)
+        steps = timeline.compile()
+
+        for step in steps[:5]:
+            self.play(step)
 
 
         self.play(Create(line_1, run_time=1))
         self.play(Create(linear_graph, run_time=1))
-        self.play(t.animate.set_value(x_space[minimum_index]), run_time=1)
+        self.play(steps[5], run_time=1)
 
 
-        self.play(t.animate.set_value(x_space[minimum_index] - 1.5))
+        self.play(steps[6])
         self.play(Create(line_2))
         self.play(Create(linear_graph2))
-        self.play(t.animate.set_value(x_space[minimum_index]))
+        self.play(steps[7])
         self.wait(2)
 
 
@@ -271,7 +288,7 @@ class Calculus(MovingCameraScene):
 
         # create the axes and the curve
         ax = Axes(x_range=[-1, 10], y_range=[-1, 10])
-        graph = ax.plot(lambda x: np.sin(x), color=BLUE, x_range=[0, 3 * PI])
+        graph = plot(ax, lambda x: np.sin(x), color=BLUE, x_range=[0, 3 * PI])
 
         # create dots based on the graph
         moving_dot = Dot(ax.i2gp(graph.t_min, graph), color=ORANGE)
@@ -285,7 +302,7 @@ class Calculus(MovingCameraScene):
             mob.move_to(moving_dot.get_center())
 
         self.camera.frame.add_updater(update_curve)
-        self.play(MoveAlongPath(moving_dot, graph, rate_func=linear))
+        self.play(MoveAlongArcLength(moving_dot, graph, rate_func=linear))
         self.camera.frame.remove_updater(update_curve)
 
         self.play(Restore(self.camera.frame))
@@ -344,33 +361,24 @@ class SineCurveUnitCircle(Scene):
         def go_around_circle(mob, dt):
             self.t_offset += (dt * rate)
             # print(self.t_offset)
-            mob.move_to(orbit.point_from_proportion(self.t_offset % 1))
-
-        def get_line_to_circle():
-            return Line(origin_point, dot.get_center(), color=BLUE)
+            mob.move_to(point_from_proportion(orbit, self.t_offset % 1))
 
-        def get_line_to_curve():
+        def get_curve_point():
             x = self.curve_start[0] + self.t_offset * 4
             y = dot.get_center()[1]
-            return Line(dot.get_center(), np.array([x,y,0]), color=YELLOW_A, stroke_width=2 )
+            return np.array([x,y,0])
 
 
-        self.curve = VGroup()
-        self.curve.add(Line(self.curve_start,self.curve_start))
-        def get_curve():
-            last_line = self.curve[-1]
-            x = self.curve_start[0] + self.t_offset * 4
-            y = dot.get_center()[1]
-            new_line = Line(last_line.get_end(),np.array([x,y,0]), color=YELLOW_D)
-            self.curve.add(new_line)
-
-            return self.curve
+        # un solo path que crece, en vez de un Line nuevo por frame
+        self.curve = GrowingPath(self.curve_start, color=YELLOW_D)
+        def get_curve(curve):
+            curve.append_point(get_curve_point())
 
         dot.add_updater(go_around_circle)
 
-        origin_to_circle_line = always_redraw(get_line_to_circle)
-        dot_to_curve_line = always_redraw(get_line_to_curve)
-        sine_curve_line = always_redraw(get_curve)
+        origin_to_circle_line = LiveSegment(origin_point, dot, color=BLUE)
+        dot_to_curve_line = LiveSegment(dot, get_curve_point, color=YELLOW_A, stroke_width=2)
+        sine_curve_line = self.curve.add_updater(get_curve)
 
         self.add(dot)
         self.add(orbit, origin_to_circle_line, dot_to_curve_line, sine_curve_line)
@@ -0,0 +1,233 @@
+from manim import *
+import warnings
+
+from axesMaps import axes_map
+
+## Curvas evaluadas con una sola llamada a la funcion
+## ParametricFunction y ax.plot llaman a la funcion una vez por muestra, con
+## un float de Python. Aca la funcion se llama una vez con el array de todos
+## los t; si no acepta arrays (o da otro resultado que punto por punto) se
+## vuelve a una llamada por muestra. Lo que se detecta queda guardado en la
+## funcion, y se puede decir de antemano con @vectorized.
+##
+##   curva = VectorParametricFunction(lambda t: np.array([np.sin(10*t), np.sin(8*t), 0*t]), t_range=[0, 10])
+##   seno = plot(ax, lambda x: np.sin(x), color=BLUE)    # en vez de ax.plot(...)
+##   curva = plot_parametric(ejes, f, t_range=[0, 7])    # en vez de ejes.plot_parametric_curve(f, ...)
+##
+## Con muestreo adaptivo se agregan puntos solo donde la curva se dobla, y
+## se corta en los polos y saltos (sin tener que elegir el paso a mano):
+##
+##   grafico = plot(ax, lambda x: 25 / x, x_range=[2.5, 10], adaptive=True)
+##   curva = AdaptiveParametricFunction(f, t_range=[0, 10], tolerance=0.002)
+
+
+# Marks a function as taking arrays (True) or scalars only (False)
+def vectorized(function, value=True):
+    getattr(function, "__func__", function).vectorized = value
+    return function
+
+
+def remember(function, value):
+    try:
+        vectorized(function, value)
+    except AttributeError:
+        pass
+
+
+def per_sample(function, ts):
+    return np.array([np.asarray(function(t), dtype=float) for t in ts])
+
+
+# np.array([x(t), y(t), 0]) with an array t is an object array in numpy
+# < 1.24 (newer versions raise, write 0*t): the components are stacked
+# after broadcasting, so constant ones become a full row
+def stack_components(values, n):
+    if isinstance(values, (list, tuple)) or getattr(values, "dtype", None) == object:
+        return np.stack([np.broadcast_to(np.asarray(c, dtype=float), (n,)) for c in values], axis=-1)
+    values = np.asarray(values, dtype=float)
+    if values.shape == (n,):
+        return values
+    if values.ndim == 2 and values.shape[1] == n:
+        return values.T
+    raise ValueError("not one sample per t")
+
+
+# function on every t -> (len(ts),) or (len(ts), d). A few samples are
+# compared with scalar calls before trusting the array result.
+def evaluate_samples(function, ts, vectorized=None):
+    ts = np.asarray(ts, dtype=float)
+    if vectorized is None:
+        vectorized = getattr(function, "vectorized", None)
+    if vectorized is False or len(ts) <= 3:
+        return per_sample(function, ts)
+    try:
+        with warnings.catch_warnings(), np.errstate(all="ignore"):
+            # ragged np.array([...]) warns in numpy < 1.24 and raises after
+            warnings.simplefilter("ignore")
+            samples = stack_components(function(ts), len(ts))
+        if vectorized is None:
+            for i in np.unique(np.linspace(0, len(ts) - 1, 3).astype(int)):
+                if not np.allclose(samples[i], function(ts[i]), equal_nan=True):
+                    raise ValueError("vectorized evaluation differs")
+            remember(function, True)
+        return samples
+    except (TypeError, ValueError, IndexError):
+        if vectorized:
+            raise
+        remember(function, False)
+        return per_sample(function, ts)
+
+
+# ParametricFunction whose points come from one evaluate_samples call over
+# the t values of every piece (pieces are split at the discontinuities)
+class VectorParametricFunction(ParametricFunction):
+    def __init__(self, function, *args, vectorized=None, **kwargs):
+        self.vectorized = vectorized
+        super().__init__(function, *args, **kwargs)
+
+    def boundary_times(self):
+        if self.discontinuities is not None:
+            discontinuities = np.array([t for t in self.discontinuities if self.t_min <= t <= self.t_max])
+            boundary_times = np.sort(np.array([
+                self.t_min, self.t_max, *(discontinuities - self.dt), *(discontinuities + self.dt),
+            ]))
+        else:
+            boundary_times = [self.t_min, self.t_max]
+        return list(zip(boundary_times[0::2], boundary_times[1::2]))
+
+    def sample_points(self, ts):
+        return evaluate_samples(self.function, self.scaling.function(ts), self.vectorized)
+
+    def add_pieces(self, pieces):
+        for piece in pieces:
+            self.start_new_path(piece[0])
+            self.add_points_as_corners(piece[1:])
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+    def generate_points(self):
+        pieces = [np.append(np.arange(t1, t2, self.t_step), t2) for t1, t2 in self.boundary_times()]
+        points = self.sample_points(np.concatenate(pieces))
+        return self.add_pieces(np.split(points, np.cumsum([len(p) for p in pieces])[:-1]))
+
+    init_points = generate_points
+
+
+# Points of a curve on [t_min, t_max], refined where it bends. evaluate(ts)
+# gives one point per t (non-finite where the curve is undefined). Starting
+# from a coarse grid, every interval whose midpoint is farther than
+# tolerance from its chord is halved, all intervals of a level in one
+# evaluate call; flat stretches keep the coarse spacing. The curve is cut
+# where it is undefined and where an interval still jumps after max_depth
+# halvings (poles, jump discontinuities). Returns the list of pieces.
+def adaptive_samples(evaluate, t_min, t_max, initial_samples=64, tolerance=3e-3, max_depth=12):
+    ts = np.linspace(t_min, t_max, initial_samples + 1)
+    points = evaluate(ts).reshape(len(ts), -1)
+    active = np.ones(len(ts) - 1, dtype=bool)
+    for _ in range(max_depth):
+        intervals = np.flatnonzero(active)
+        if len(intervals) == 0:
+            break
+        mid_ts = (ts[intervals] + ts[intervals + 1]) / 2
+        mids = evaluate(mid_ts).reshape(len(mid_ts), -1)
+        a, b = points[intervals], points[intervals + 1]
+        finite_a, finite_b, finite_mid = (np.isfinite(p).all(axis=1) for p in (a, b, mids))
+        with np.errstate(all="ignore"):
+            error = np.linalg.norm(mids - (a + b) / 2, axis=1)
+        # where both ends are undefined only look further if the midpoint is not
+        refine = np.where(finite_a & finite_b, ~(error <= tolerance), finite_a | finite_b | finite_mid)
+
+        chosen = intervals[refine]
+        ts = np.insert(ts, chosen + 1, mid_ts[refine])
+        points = np.insert(points, chosen + 1, mids[refine], axis=0)
+        left = chosen + np.arange(len(chosen))
+        active = np.zeros(len(ts) - 1, dtype=bool)
+        active[left] = active[left + 1] = True
+
+    finite = np.isfinite(points).all(axis=1)
+    broken = ~(finite[:-1] & finite[1:])
+    with np.errstate(all="ignore"):
+        broken |= active & (np.linalg.norm(np.diff(points, axis=0), axis=1) > 10 * tolerance)
+    pieces = np.split(points, np.flatnonzero(broken) + 1)
+    return [piece for piece in pieces if len(piece) > 1 and np.isfinite(piece).all()]
+
+
+# VectorParametricFunction with adaptive_samples instead of a fixed t_step
+# (t_step is ignored). tolerance is in scene units, before any scaling.
+class AdaptiveParametricFunction(VectorParametricFunction):
+    def __init__(self, function, *args, tolerance=3e-3, initial_samples=64, max_depth=12, **kwargs):
+        self.tolerance = tolerance
+        self.initial_samples = initial_samples
+        self.max_depth = max_depth
+        super().__init__(function, *args, **kwargs)
+
+    def generate_points(self):
+        pieces = []
+        for t1, t2 in self.boundary_times():
+            pieces += adaptive_samples(
+                self.sample_points, t1, t2,
+                self.initial_samples, self.tolerance, self.max_depth,
+            )
+        return self.add_pieces(pieces)
+
+    init_points = generate_points
+
+
+# Curve of the coordinates returned by coords(t) (one row per t), mapped
+# as the axes are when the curve is made
+def axes_curve(axes, coords, dim):
+    to_scene = axes_map(axes, dim)
+
+    def curve(t):
+        ts = np.atleast_1d(np.asarray(t, dtype=float))
+        points = to_scene(coords(ts))
+        return points.T if np.ndim(t) else points[0]
+
+    return vectorized(curve)
+
+
+# Same as axes.plot(function, x_range, **kwargs). With adaptive=True the
+# samples come from adaptive_samples, and values outside y_range (the
+# axes' range plus a 5% margin by default) are left out, so poles end at
+# the edge of the axes instead of going off to huge coordinates.
+def plot(axes, function, x_range=None, vectorized=None, adaptive=False, y_range=None, **kwargs):
+    t_range = np.array(axes.x_range, dtype=float)
+    if x_range is not None:
+        t_range[: len(x_range)] = x_range
+    if x_range is None or len(x_range) < 3:
+        # the step of axes.x_range is the tick spacing, not the sample spacing
+        t_range[2] /= axes.num_sampled_graph_points_per_tick
+
+    if adaptive:
+        if y_range is None:
+            y_min, y_max = axes.y_range[:2]
+            y_range = (y_min - 0.05 * (y_max - y_min), y_max + 0.05 * (y_max - y_min))
+        def coords(ts):
+            ys = evaluate_samples(function, ts, vectorized)
+            return np.stack([ts, np.where((ys >= y_range[0]) & (ys <= y_range[1]), ys, np.nan)], axis=-1)
+        curve_class = AdaptiveParametricFunction
+    else:
+        coords = lambda ts: np.stack([ts, evaluate_samples(function, ts, vectorized)], axis=-1)
+        curve_class = VectorParametricFunction
+
+    graph = curve_class(
+        axes_curve(axes, coords, 2),
+        t_range=t_range,
+        scaling=axes.x_axis.scaling,
+        **kwargs,
+    )
+    graph.underlying_function = function
+    return graph
+
+
+# Same as axes.plot_parametric_curve(function, **kwargs)
+def plot_parametric(axes, function, vectorized=None, adaptive=False, **kwargs):
+    dim = axes.dimension
+    curve_class = AdaptiveParametricFunction if adaptive else VectorParametricFunction
+    graph = curve_class(
+        axes_curve(axes, lambda ts: np.reshape(evaluate_samples(function, ts, vectorized), (len(ts), -1))[:, :dim], dim),
+        **kwargs,
+    )
+    graph.underlying_function = function
+    return graph
@@ -0,0 +1,125 @@
+from manim import *
+import os
+import json
+import shutil
+import hashlib
+import pandas as pd
+
+from diskCache import cache_dir, file_hash, save_json, temp_path
+
+## Tablas del World Bank (y CSVs parecidos) leidas una sola vez
+## La primera vez se parsea el CSV: '..' pasa a NaN, las columnas numericas
+## quedan como float y las de texto como strings. Cada columna se guarda en
+## un .npy propio dentro de una carpeta con el hash del archivo, asi las
+## corridas siguientes mapean en memoria solo las columnas que se piden, y
+## si el CSV cambia se vuelve a parsear.
+##
+##   gdp = dataset("gdp_per_country.csv")
+##   datos = gdp.select(["Country Name", "2020", "2021"], where={"Country Name": paises})
+##   datos["2021"] - datos["2020"]
+
+MISSING = [".."]
+
+
+def dataset_cache():
+    return cache_dir("dataset_cache", env="MANIM_DATASET_CACHE")
+
+
+# file_hash of the CSV, recomputed only when its size or mtime changed
+# since the hash was stored in the cache's index.json. An unreadable index
+# is treated as empty.
+def source_hash(path):
+    stat = os.stat(path)
+    index_path = os.path.join(dataset_cache(), "index.json")
+    index = {}
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except ValueError:
+            index = {}
+    key = os.path.abspath(path)
+    entry = index.get(key)
+    if entry is None or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime_ns:
+        entry = index[key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "hash": file_hash(path)}
+        save_json(index_path, index)
+    return entry["hash"]
+
+
+# The whole CSV as typed columns. Footer lines ("Data from database: ...",
+# empty rows) have at most one filled cell and are dropped.
+def parse_csv(path, missing=MISSING):
+    data = pd.read_csv(path, encoding="utf-8-sig", na_values=list(missing) + [""], keep_default_na=False, dtype=str)
+    data = data.dropna(thresh=2).reset_index(drop=True)
+    columns = {}
+    for name in data.columns:
+        values = pd.to_numeric(data[name], errors="coerce")
+        if values.notna().sum() == data[name].notna().sum():
+            columns[name] = values.to_numpy(dtype=float)
+        else:
+            columns[name] = data[name].fillna("").to_numpy(dtype=str)
+    return columns
+
+
+# The whole folder is filled under temp_path(target) and then renamed
+def write_cache(columns, target):
+    tmp = temp_path(target)
+    os.makedirs(tmp, exist_ok=True)
+    names = list(columns)
+    for i, name in enumerate(names):
+        np.save(os.path.join(tmp, f"{i}.npy"), columns[name])
+    with open(os.path.join(tmp, "columns.json"), "w", encoding="utf-8") as f:
+        json.dump(names, f)
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        # another process wrote the same cache first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+# Columns of one cached CSV, each opened (memory-mapped) the first time it is used
+class Dataset:
+    def __init__(self, folder):
+        self.folder = folder
+        with open(os.path.join(folder, "columns.json"), encoding="utf-8") as f:
+            self.columns = json.load(f)
+        self.loaded = {}
+
+    def __repr__(self):
+        return f"Dataset({len(self)} rows, {self.columns})"
+
+    def __len__(self):
+        return len(self.column(self.columns[0])) if self.columns else 0
+
+    def __getitem__(self, name):
+        return self.column(name)
+
+    def column(self, name):
+        if name not in self.loaded:
+            if name not in self.columns:
+                raise KeyError(f"no column {name!r}, the columns are {self.columns}")
+            path = os.path.join(self.folder, f"{self.columns.index(name)}.npy")
+            self.loaded[name] = np.load(path, mmap_mode="r")
+        return self.loaded[name]
+
+    # Positions of the rows whose values are in where[column] for every
+    # column of where (all rows if where is empty), in file order
+    def rows(self, where=None):
+        mask = np.ones(len(self), dtype=bool)
+        for name, values in (where or {}).items():
+            mask &= np.isin(self.column(name), list(values))
+        return np.flatnonzero(mask)
+
+    # DataFrame with only the requested columns and rows
+    def select(self, columns=None, where=None):
+        rows = self.rows(where)
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame({name: np.asarray(self.column(name)[rows]) for name in columns}, index=rows)
+
+
+def dataset(path, missing=MISSING):
+    key = hashlib.blake2b((source_hash(path) + repr(list(missing))).encode(), digest_size=16).hexdigest()
+    folder = os.path.join(dataset_cache(), key)
+    if not os.path.exists(os.path.join(folder, "columns.json")):
+        write_cache(parse_csv(path, missing), folder)
+    return Dataset(folder)
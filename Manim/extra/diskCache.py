@@ -0,0 +1,121 @@
+from manim import *
+import os
+import json
+import types
+import hashlib
+import inspect
+import threading
+
+## Piezas comunes de los caches en disco (imagenes, tablas, superficies y
+## curvas implicitas): la carpeta de cada cache, el hash del contenido de
+## un archivo, escrituras que nunca dejan un archivo a medio escribir, y la
+## clave de lo que calcula una funcion. Si la funcion lee algo que no se
+## puede describir igual en otra corrida (un objeto cualquiera, un
+## ValueTracker), function_key da None y el resultado no se guarda.
+##
+##   carpeta = cache_dir("image_cache", env="MANIM_IMAGE_CACHE")
+##   save_array(os.path.join(carpeta, f"{file_hash(ruta)}.npy"), pixeles)
+
+
+# media/<name>, or the folder in the environment variable env when it is set
+def cache_dir(name, env=None):
+    path = (env and os.environ.get(env)) or os.path.join(config.media_dir, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+# blake2b of the file bytes, read in 1 MB chunks
+def file_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Everything is written next to its target under a name of its own (per
+# process and thread) and renamed over it, so a half written file is never
+# read, and an interrupted render leaves at most a stray .tmp behind
+def temp_path(target):
+    return f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def save_array(target, array):
+    tmp = temp_path(target) + ".npy"
+    np.save(tmp, array)
+    os.replace(tmp, target)
+
+
+def save_json(target, data):
+    tmp = temp_path(target)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, target)
+
+
+class NotCacheable(ValueError):
+    pass
+
+
+# Values a result may depend on, written the same way in every run.
+# Functions are described by their source, the globals they read, their
+# closure and their defaults; other objects are not describable.
+def describe(value, seen):
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        return repr(value)
+    if isinstance(value, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16).hexdigest()
+        return f"array({value.dtype}, {value.shape}, {digest})"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = sorted(describe(v, seen) for v in value) if isinstance(value, (set, frozenset)) else [describe(v, seen) for v in value]
+        return type(value).__name__ + "(" + ", ".join(items) + ")"
+    if isinstance(value, dict):
+        return "{" + ", ".join(sorted(f"{describe(k, seen)}: {describe(v, seen)}" for k, v in value.items())) + "}"
+    if isinstance(value, types.ModuleType):
+        return "module " + value.__name__
+    if isinstance(value, types.MethodType):
+        return describe(value.__self__, seen) + "." + describe(value.__func__, seen)
+    if isinstance(value, types.FunctionType):
+        return describe_function(value, seen)
+    if isinstance(value, (type, types.BuiltinFunctionType, np.ufunc)):
+        return f"{getattr(value, '__module__', None)}.{getattr(value, '__qualname__', value.__name__)}"
+    raise NotCacheable(f"{type(value).__name__} has no description that is the same in every run")
+
+
+def describe_function(func, seen):
+    code = func.__code__
+    if code in seen:
+        return "recursive " + func.__qualname__
+    if os.sep + "site-packages" + os.sep in code.co_filename or os.sep + "dist-packages" + os.sep in code.co_filename:
+        # installed libraries (manim, numpy, ...) change with their version, not per render
+        return f"{func.__module__}.{func.__qualname__}"
+    seen = seen | {code}
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = repr(code.co_code) + repr(code.co_consts)
+    # names read by the function and by the functions and lambdas defined in it
+    names, codes = set(), [code]
+    while codes:
+        c = codes.pop()
+        names.update(c.co_names)
+        codes += [const for const in c.co_consts if isinstance(const, types.CodeType)]
+    builtins = func.__globals__.get("__builtins__", {})
+    read = {
+        name: describe(func.__globals__[name], seen)
+        for name in sorted(names)
+        if name in func.__globals__ and func.__globals__[name] is not builtins
+    }
+    closure = [describe(cell.cell_contents, seen) for cell in func.__closure__ or []]
+    defaults = describe(func.__defaults__, seen) + describe(func.__kwdefaults__, seen)
+    return source + repr(read) + repr(closure) + defaults
+
+
+# Hash of what func computes, or None when it depends on a value that
+# can't be written the same way in another run
+def function_key(func):
+    try:
+        text = describe(func, frozenset())
+    except NotCacheable:
+        return None
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
@@ -0,0 +1,118 @@
+from manim import *
+
+from axesMaps import coords_to_points
+from liveMobjects import RunParameter
+
+## Descenso de gradiente para miles de puntos iniciales a la vez
+## Cada paso del optimizador es una operacion sobre arrays (n, d), se guardan
+## todas las trayectorias y se animan como una sola nube de puntos
+##
+##   trajectories = simulate(loss, starts, optimizer="adam", lr=0.05, steps=200)
+##   cloud = TrajectoryCloud(ax, trajectories, loss)
+##   self.play(RunDescent(cloud), run_time=6)
+
+
+# Central differences of a loss that takes (n, d) points and returns (n,)
+def numerical_gradient(loss, h=1e-5):
+    def gradient(points):
+        grads = np.empty_like(points)
+        for d in range(points.shape[1]):
+            step = np.zeros(points.shape[1])
+            step[d] = h
+            grads[:, d] = (loss(points + step) - loss(points - step)) / (2 * h)
+        return grads
+    return gradient
+
+
+def gd_step(points, grads, state, lr, **kwargs):
+    return points - lr * grads
+
+
+def momentum_step(points, grads, state, lr, momentum=0.9, **kwargs):
+    velocity = state.get("velocity", np.zeros_like(points))
+    state["velocity"] = momentum * velocity - lr * grads
+    return points + state["velocity"]
+
+
+def adam_step(points, grads, state, lr, beta1=0.9, beta2=0.999, eps=1e-8, **kwargs):
+    t = state.get("t", 0) + 1
+    m = beta1 * state.get("m", np.zeros_like(points)) + (1 - beta1) * grads
+    v = beta2 * state.get("v", np.zeros_like(points)) + (1 - beta2) * grads ** 2
+    state.update(t=t, m=m, v=v)
+    m_hat = m / (1 - beta1 ** t)
+    v_hat = v / (1 - beta2 ** t)
+    return points - lr * m_hat / (np.sqrt(v_hat) + eps)
+
+
+optimizers = {
+    "gd": gd_step,
+    "momentum": momentum_step,
+    "adam": adam_step,
+}
+
+
+# Runs the optimizer from every row of starts, returns (steps + 1, n, d).
+# loss works on (n, d) arrays; 1D losses may also take and return (n,).
+def simulate(loss, starts, optimizer="gd", lr=0.01, steps=100, gradient=None, clip=None, **hyperparameters):
+    starts = np.asarray(starts, dtype=float)
+    flat = starts.ndim == 1
+    points = starts.reshape(len(starts), -1)
+    loss_nd = (lambda p: loss(p[:, 0])) if flat else loss
+    if gradient is None:
+        gradient = numerical_gradient(loss_nd)
+    elif flat:
+        gradient = (lambda g: lambda p: np.asarray(g(p[:, 0])).reshape(-1, 1))(gradient)
+    step = optimizers[optimizer] if isinstance(optimizer, str) else optimizer
+
+    trajectories = np.empty((steps + 1,) + points.shape)
+    trajectories[0] = points
+    state = {}
+    for i in range(steps):
+        grads = gradient(points)
+        if clip is not None:
+            grads = np.clip(grads, -clip, clip)
+        points = step(points, grads, state, lr, **hyperparameters)
+        trajectories[i + 1] = points
+    return trajectories
+
+
+# All particles of a simulation as one point cloud. 1D problems are drawn
+# as (x, loss(x)) on 2D axes, 2D problems as (x, y) on 2D axes or as
+# (x, y, loss) on ThreeDAxes. The scene coordinates of every step are
+# computed once; set_step only interpolates two of them.
+class TrajectoryCloud(PMobject):
+    def __init__(self, axes, trajectories, loss=None, color=RED, stroke_width=4, **kwargs):
+        PMobject.__init__(self, stroke_width=stroke_width, **kwargs)
+        trajectories = np.asarray(trajectories, dtype=float)
+        steps, n, d = trajectories.shape
+        coords = trajectories
+        if loss is not None and (d == 1 or isinstance(axes, ThreeDAxes)):
+            values = loss(trajectories.reshape(-1, d)[:, 0] if d == 1 else trajectories.reshape(-1, d))
+            coords = np.concatenate([trajectories, np.reshape(values, (steps, n, 1))], axis=2)
+        self.scene_points = coords_to_points(axes, coords)
+        self.step = 0
+        self.add_points(self.scene_points[0].copy(), color=color)
+
+    def get_num_steps(self):
+        return len(self.scene_points) - 1
+
+    def set_step(self, step):
+        last = self.get_num_steps()
+        self.step = np.clip(step, 0, last)
+        if last:
+            i = min(int(self.step), last - 1)
+            w = self.step - i
+            self.points[:] = (1 - w) * self.scene_points[i] + w * self.scene_points[i + 1]
+        return self
+
+
+# Plays the recorded steps from the current one to `to` (the last by default)
+class RunDescent(RunParameter):
+    def last_value(self, cloud):
+        return cloud.get_num_steps()
+
+    def get_value(self):
+        return self.mobject.step
+
+    def set_value(self, step):
+        self.mobject.set_step(step)
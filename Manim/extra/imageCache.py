@@ -0,0 +1,152 @@
+from manim import *
+import os
+import ast
+import inspect
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from diskCache import cache_dir, file_hash, save_array, temp_path
+
+## Cache en disco de imagenes en varias resoluciones (mipmaps)
+## Cada imagen se identifica por el hash de su contenido. La primera vez se
+## guarda una piramide de niveles, cada uno la mitad del anterior, como .npy
+## sin comprimir. Despues se carga solo el nivel mas chico que alcance para
+## la resolucion de salida (480p15 carga mucho menos que 2160p60).
+##
+##   background = CachedImageMobject(ruta)   # mismo tamaño que ImageMobject(ruta)
+
+MIN_LEVEL_SIZE = 64
+
+hashes = {}
+
+
+# file_hash remembered per (path, size, mtime) within a run
+def content_hash(path):
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key not in hashes:
+        hashes[key] = file_hash(path)
+    return hashes[key]
+
+
+def level_sizes(width, height):
+    sizes = [(width, height)]
+    while max(sizes[-1]) // 2 >= MIN_LEVEL_SIZE:
+        w, h = sizes[-1]
+        sizes.append((max(w // 2, 1), max(h // 2, 1)))
+    return sizes
+
+
+def level_path(digest, level, ext="npy"):
+    return os.path.join(cache_dir("image_cache", env="MANIM_IMAGE_CACHE"), f"{digest}_{level}.{ext}")
+
+
+def build_pyramid(path, digest):
+    image = Image.open(path).convert("RGBA")
+    for level, size in enumerate(level_sizes(*image.size)):
+        if level:
+            image = image.resize(size, Image.LANCZOS)
+        target = level_path(digest, level)
+        if not os.path.exists(target):
+            save_array(target, np.asarray(image))
+
+
+# Smallest level whose height still covers target_pixel_height
+def pick_level(width, height, target_pixel_height):
+    sizes = level_sizes(width, height)
+    level = 0
+    while level + 1 < len(sizes) and sizes[level + 1][1] >= target_pixel_height:
+        level += 1
+    return level
+
+
+def load_level(path, target_pixel_height):
+    digest = content_hash(path)
+    with Image.open(path) as image:
+        width, height = image.size
+    level = pick_level(width, height, target_pixel_height)
+    cached = level_path(digest, level)
+    if not os.path.exists(cached):
+        build_pyramid(path, digest)
+    return np.load(cached)
+
+
+# For consumers that need a file (e.g. OpenGL textures): the chosen level as PNG
+def mipmap_path(path, target_pixel_height=None):
+    target_pixel_height = target_pixel_height or config.pixel_height
+    digest = content_hash(path)
+    with Image.open(path) as image:
+        width, height = image.size
+    level = pick_level(width, height, target_pixel_height)
+    png = level_path(digest, level, "png")
+    if not os.path.exists(png):
+        pixels = load_level(path, target_pixel_height)
+        tmp = temp_path(png)
+        Image.fromarray(pixels).save(tmp, format="PNG")
+        os.replace(tmp, png)
+    return png
+
+
+# Height in scene units (the full image's by default) and the pixel
+# height it covers at the current render quality
+def display_height(path, height=None, scale_to_resolution=QUALITIES[DEFAULT_QUALITY]["pixel_height"]):
+    if height is None:
+        with Image.open(path) as image:
+            height = image.size[1] / scale_to_resolution * config.frame_height
+    return height, height / config.frame_height * config.pixel_height
+
+
+# ImageMobject that loads the cached level matching the output resolution.
+# It keeps the size the full image would have had, so only sharpness at
+# preview qualities changes. pixels may come already loaded (ImagePrefetcher).
+class CachedImageMobject(ImageMobject):
+    def __init__(self, path, height=None, scale_to_resolution=QUALITIES[DEFAULT_QUALITY]["pixel_height"], pixels=None, **kwargs):
+        height, target_pixel_height = display_height(path, height, scale_to_resolution)
+        if pixels is None:
+            pixels = load_level(path, target_pixel_height)
+        ImageMobject.__init__(self, pixels, scale_to_resolution=scale_to_resolution, **kwargs)
+        self.path = path
+        self.height = height
+
+
+# Decodes images in a thread pool while earlier animations render, so
+# get() only builds the mobject from pixels that are already in memory
+class ImagePrefetcher:
+    extensions = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff")
+
+    def __init__(self, max_workers=2):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self.pending = {}
+
+    def key(self, path, height):
+        return os.path.abspath(path), height
+
+    def prefetch(self, *paths, height=None):
+        for path in paths:
+            key = self.key(path, height)
+            if key not in self.pending:
+                self.pending[key] = self.pool.submit(
+                    lambda path=path: load_level(path, display_height(path, height)[1])
+                )
+        return self
+
+    # every image path written as a literal in a function (e.g. construct)
+    def scan(self, function, height=None):
+        tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+        paths = [
+            node.value for node in ast.walk(tree)
+            if isinstance(node, ast.Constant) and isinstance(node.value, str)
+            and node.value.lower().endswith(self.extensions) and os.path.exists(node.value)
+        ]
+        return self.prefetch(*paths, height=height)
+
+    def get(self, path, height=None, **kwargs):
+        future = self.pending.pop(self.key(path, height), None)
+        pixels = future.result() if future is not None else None
+        return CachedImageMobject(path, height=height, pixels=pixels, **kwargs)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False)
+        self.pending.clear()
@@ -0,0 +1,243 @@
+from manim import *
+import os
+import hashlib
+
+from diskCache import cache_dir, function_key, save_array
+
+## Curvas implicitas f(x, y) = 0 con marching squares sobre un quadtree
+## La funcion se evalua con arrays sobre una grilla gruesa; solo las celdas
+## que la curva cruza se dividen en cuatro, y una celda deja de dividirse
+## cuando la curva adentro es casi recta (o se llega a max_depth, como en
+## las puntas y cuspides). Los cortes con los bordes se buscan por
+## biseccion, asi celdas vecinas de distinto tamaño dan el mismo punto y la
+## curva queda cerrada. El contorno se guarda por (funcion, rangos,
+## tolerancia) en memoria y en media/implicit_cache, salvo que la funcion
+## lea algo sin clave estable (ver diskCache.function_key).
+##
+##   corazon = QuadtreeImplicitFunction(lambda x, y: (x**2 + y**2 - 1)**3 - x**2 * y**3, color=RED)
+
+contours = {}
+
+
+# func on arrays of x and y (same shape), with a few points checked against
+# scalar calls and one call per point when arrays are not supported
+def evaluate_field(func, xs, ys):
+    try:
+        with np.errstate(all="ignore"):
+            values = np.asarray(func(xs, ys), dtype=float)
+        if values.shape != xs.shape:
+            raise ValueError("not one value per point")
+        flat_x, flat_y, flat_v = xs.ravel(), ys.ravel(), values.ravel()
+        for i in np.unique(np.linspace(0, flat_x.size - 1, 3).astype(int)):
+            if not np.allclose(flat_v[i], func(flat_x[i], flat_y[i]), equal_nan=True):
+                raise ValueError("vectorized evaluation differs")
+        return values
+    except (TypeError, ValueError, IndexError):
+        return np.array([func(x, y) for x, y in zip(xs.ravel(), ys.ravel())], dtype=float).reshape(xs.shape)
+
+
+def crosses(corners):
+    positive = corners > 0
+    return positive.any(axis=1) & ~positive.all(axis=1)
+
+
+# (x, y) offsets, in cell sizes, of the corners (bl, br, tr, tl) and of the
+# five points added by a split (bottom, right, top and left mids, center)
+corner_offsets = np.array([(0, 0), (1, 0), (1, 1), (0, 1)])
+split_offsets = np.array([(0.5, 0), (1, 0.5), (0.5, 1), (0, 0.5), (0.5, 0.5)])
+# the 3x3 lattice of a split cell as indices into corners + split points,
+# and the corners of each child in that lattice
+lattice = np.array([[0, 4, 1], [7, 8, 5], [3, 6, 2]])
+child_corners = np.array([
+    [lattice[r][c], lattice[r][c + 1], lattice[r + 1][c + 1], lattice[r + 1][c]]
+    for r in range(2) for c in range(2)
+])
+child_offsets = np.array([(c / 2, r / 2) for r in range(2) for c in range(2)])
+
+
+# Cells the curve goes through, refined until the curve is straight within
+# tolerance inside them. Returns (lower left corners, sizes, corner values).
+def quadtree_leaves(func, x_range, y_range, resolution, tolerance, max_depth):
+    nx, ny = resolution
+    xs = np.linspace(*x_range, nx + 1)
+    ys = np.linspace(*y_range, ny + 1)
+    X, Y = np.meshgrid(xs, ys)
+    V = evaluate_field(func, X, Y)
+    corners = np.stack([V[:-1, :-1], V[:-1, 1:], V[1:, 1:], V[1:, :-1]], axis=-1).reshape(-1, 4)
+    origins = np.stack([X[:-1, :-1], Y[:-1, :-1]], axis=-1).reshape(-1, 2)
+    keep = crosses(corners)
+    origins, corners = origins[keep], corners[keep]
+    size = np.array([xs[1] - xs[0], ys[1] - ys[0]])
+
+    leaves = []
+    for depth in range(max_depth + 1):
+        if len(origins) == 0:
+            break
+        if depth == max_depth:
+            leaves.append((origins, np.broadcast_to(size, origins.shape), corners))
+            break
+        points = origins[:, None] + split_offsets * size
+        split = evaluate_field(func, points[..., 0], points[..., 1])
+        # distance from the bilinear guess, turned into a distance in the
+        # plane with the cell's value spread over its size
+        guess = np.stack([
+            corners[:, [0, 1]].mean(axis=1), corners[:, [1, 2]].mean(axis=1),
+            corners[:, [2, 3]].mean(axis=1), corners[:, [3, 0]].mean(axis=1),
+            corners.mean(axis=1),
+        ], axis=1)
+        spread = corners.max(axis=1) - corners.min(axis=1)
+        with np.errstate(all="ignore"):
+            error = np.abs(split - guess).max(axis=1) / spread * size.max()
+        flat = error <= tolerance
+        leaves.append((origins[flat], np.broadcast_to(size, origins[flat].shape), corners[flat]))
+
+        values = np.concatenate([corners, split], axis=1)[~flat]
+        origins = (origins[~flat][:, None] + child_offsets * size).reshape(-1, 2)
+        corners = values[:, child_corners].reshape(-1, 4)
+        size = size / 2
+        keep = crosses(corners)
+        origins, corners = origins[keep], corners[keep]
+
+    return tuple(np.concatenate(parts) for parts in zip(*leaves)) if leaves else (np.zeros((0, 2)),) * 2 + (np.zeros((0, 4)),)
+
+
+# Edge pairs joined inside a cell for each sign case (bit k: corner k > 0);
+# edges are bottom 0, right 1, top 2, left 3. Saddles (5, 10) have two
+# options, picked with the mean of the corners.
+segment_table = {
+    1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)], 6: [(0, 2)], 7: [(3, 2)],
+    8: [(2, 3)], 9: [(0, 2)], 11: [(1, 2)], 12: [(3, 1)], 13: [(0, 1)], 14: [(3, 0)],
+}
+saddles = {
+    (5, True): [(0, 1), (2, 3)], (5, False): [(3, 0), (1, 2)],
+    (10, True): [(3, 0), (1, 2)], (10, False): [(0, 1), (2, 3)],
+}
+edge_corners = np.array([(0, 1), (1, 2), (2, 3), (3, 0)])
+
+
+# Zero of func on the segments a -> b (one per row, with a sign change), by
+# bisection, so the same edge seen from two cells gives the same point
+def edge_roots(func, a, b, fa, iterations=40):
+    for _ in range(iterations):
+        m = (a + b) / 2
+        fm = evaluate_field(func, m[:, 0], m[:, 1])
+        same = (fm > 0) == (fa > 0)
+        a = np.where(same[:, None], m, a)
+        fa = np.where(same, fm, fa)
+        b = np.where(same[:, None], b, m)
+    return (a + b) / 2
+
+
+def marching_segments(func, origins, sizes, corners):
+    cases = ((corners > 0) * (1 << np.arange(4))).sum(axis=1)
+    centers = corners.mean(axis=1) > 0
+    cells, edges = [], []
+    for k, (case, center) in enumerate(zip(cases, centers)):
+        for pair in segment_table.get(case) or saddles.get((case, center), []):
+            cells.append(k)
+            edges.append(pair)
+    if not cells:
+        return np.zeros((0, 2, 2))
+    cells = np.repeat(np.array(cells), 2)
+    edges = np.array(edges).ravel()
+    ends = edge_corners[edges]
+    a = origins[cells] + corner_offsets[ends[:, 0]] * sizes[cells]
+    b = origins[cells] + corner_offsets[ends[:, 1]] * sizes[cells]
+    fa = corners[cells, ends[:, 0]]
+    return edge_roots(func, a, b, fa).reshape(-1, 2, 2)
+
+
+# Segments joined end to end into polylines (closed ones end at their start)
+def stitch(segments, scale):
+    keys = [tuple(k) for k in np.round(segments.reshape(-1, 2) / scale).astype(np.int64)]
+    at = {}
+    for i, key in enumerate(keys):
+        at.setdefault(key, []).append(i)
+    used = np.zeros(len(segments), dtype=bool)
+
+    def walk(end):
+        # follow the chain from endpoint index `end` until it stops or closes
+        chain = []
+        while True:
+            nxt = [i for i in at[keys[end]] if i != end and not used[i // 2]]
+            if not nxt:
+                return chain
+            used[nxt[0] // 2] = True
+            end = nxt[0] ^ 1
+            chain.append(end)
+
+    polylines = []
+    for s in range(len(segments)):
+        if used[s]:
+            continue
+        used[s] = True
+        forward = walk(2 * s + 1)
+        backward = walk(2 * s)
+        order = backward[::-1] + [2 * s, 2 * s + 1] + forward
+        polylines.append(segments.reshape(-1, 2)[order])
+    return polylines
+
+
+# None when func has no stable function_key
+def contour_key(func, *params):
+    key = function_key(func)
+    if key is None:
+        return None
+    return hashlib.blake2b((key + repr(params)).encode(), digest_size=16).hexdigest()
+
+
+# The polylines as one array, with a NaN row after each of them
+def contour_array(func, x_range, y_range, resolution, tolerance, max_depth):
+    leaves = quadtree_leaves(func, x_range, y_range, resolution, tolerance, max_depth)
+    scale = 1e-9 * max(x_range[1] - x_range[0], y_range[1] - y_range[0])
+    polylines = stitch(marching_segments(func, *leaves), scale)
+    return np.concatenate([np.vstack([p, [[np.nan, np.nan]]]) for p in polylines]) if polylines else np.zeros((0, 2))
+
+
+# Polylines of f(x, y) = 0, cached in memory and on disk
+def implicit_contour(func, x_range, y_range, resolution=(32, 32), tolerance=1e-3, max_depth=10):
+    x_range, y_range = tuple(map(float, x_range[:2])), tuple(map(float, y_range[:2]))
+    params = (x_range, y_range, tuple(resolution), tolerance, max_depth)
+    key = contour_key(func, *params)
+    if key in contours:
+        return contours[key]
+    if key is None:
+        flat = contour_array(func, *params)
+    else:
+        path = os.path.join(cache_dir("implicit_cache"), key + ".npy")
+        if os.path.exists(path):
+            flat = np.load(path)
+        else:
+            flat = contour_array(func, *params)
+            save_array(path, flat)
+    pieces = np.split(flat, np.flatnonzero(np.isnan(flat[:, 0])))
+    pieces = [piece[~np.isnan(piece[:, 0])] for piece in pieces]
+    pieces = [piece for piece in pieces if len(piece) > 1]
+    if key is not None:
+        contours[key] = pieces
+    return pieces
+
+
+# ImplicitFunction drawn from implicit_contour. resolution is the coarse
+# grid, tolerance how far (in scene units) a leaf's straight piece may be
+# from the curve, and max_depth how many times a cell may be split.
+class QuadtreeImplicitFunction(ImplicitFunction):
+    def __init__(self, func, *args, resolution=(32, 32), tolerance=1e-3, max_depth=10, **kwargs):
+        self.resolution = resolution
+        self.tolerance = tolerance
+        self.max_depth = max_depth
+        super().__init__(func, *args, **kwargs)
+
+    def generate_points(self):
+        for curve in implicit_contour(
+            self.function, self.x_range, self.y_range,
+            self.resolution, self.tolerance, self.max_depth,
+        ):
+            curve = np.pad(curve, [(0, 0), (0, 1)])
+            self.start_new_path(curve[0])
+            self.add_points_as_corners(curve[1:])
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+    init_points = generate_points
@@ -1,5 +1,14 @@
+import os
 import re
+import sys
+import json
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
 
 
 symbols = {
@@ -152,32 +161,794 @@ def remBrackets(s):
     return s            
         
             
-def main():
-    
+def legacyConvert(s):
+    # Pipeline original basado en regex, se mantiene como referencia
+    for k, v in symbols.items():
+        s = re.sub(k, v, s)
+
+    for k, v in consts.items():
+        s = re.sub(k, v, s)
+
+    for f in funs:
+        s = repFunctions(f, s)
+
+    for k, v in ops.items():
+        s = re.sub(k, v, s)
+
+    s = insMultiply(s)
+
+    s = remBrackets(s)
+
+    return s
+
+
+## Tokenizer + parser recursivo
+## Construye el arbol una sola vez y genera el codigo NumPy en tiempo lineal
+
+texFuncs = {k[1:]: v for k, v in ops.items()}
+texConsts = {k[1:]: v for k, v in consts.items()}
+texOps = {r'\cdot': '*', r'\times': '*', r'\div': '/'}
+texNames = set(texFuncs) | set(texConsts) | {r'\frac'}
+texNamesByLength = sorted(texNames, key=len, reverse=True)
+
+tokenRe = re.compile(r"""
+    (?P<skip>\s+|\\[ ,;:!]|\\q?quad(?![a-zA-Z]))
+  | (?P<num>\d+(?:\.\d*)?|\.\d+)
+  | (?P<absopen>\\left\s*\|)
+  | (?P<absclose>\\right\s*\|)
+  | (?P<open>(?:\\left\s*)?[({])
+  | (?P<close>(?:\\right\s*)?[)}])
+  | (?P<cmd>\\[a-zA-Z]+)
+  | (?P<var>[a-zA-Z])
+  | (?P<op>\*\*|[-+*/^_])
+""", re.VERBOSE)
+
+# caracteres que, antes de un parentesis, permiten quitarlo (ver remBrackets)
+brOps = set('+-/*)(_')
+
+
+class Node:
+    __slots__ = ('kind', 'value', 'args')
+
+    def __init__(self, kind, value=None, args=()):
+        self.kind = kind
+        self.value = value
+        self.args = args
+
+    def __repr__(self):
+        if self.args:
+            return f"Node({self.kind!r}, {self.value!r}, {list(self.args)!r})"
+        return f"Node({self.kind!r}, {self.value!r})"
+
+
+def tokenize(s):
+    tokens = []
+    pos = 0
+    for m in tokenRe.finditer(s):
+        if m.start() != pos:
+            break
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == 'skip':
+            continue
+        text = m.group()
+        if kind == 'cmd' and text in texOps:
+            kind, text = 'op', texOps[text]
+        elif kind == 'cmd' and text not in texNames:
+            # \pix -> \pi x, igual que el reemplazo por regex original
+            for name in texNamesByLength:
+                if text.startswith(name):
+                    tokens.append(('cmd', name, m.start()))
+                    for k, c in enumerate(text[len(name):], m.start() + len(name)):
+                        tokens.append(('var', c, k))
+                    break
+            else:
+                tokens.append((kind, text, m.start()))
+            continue
+        elif kind == 'op' and text == '**':
+            text = '^'
+        tokens.append((kind, text, m.start()))
+    if pos != len(s):
+        raise ValueError(f"unexpected character {s[pos]!r} at position {pos}")
+    tokens.append(('end', '', len(s)))
+    return tokens
+
+
+class Parser:
+    # Gramatica (misma precedencia que Python sobre el codigo generado):
+    #   expr    := term (('+' | '-') term)*
+    #   term    := factor (('*' | '/') factor | factor)*   (yuxtaposicion = '*')
+    #   factor  := ('-' | '+') factor | power
+    #   power   := primary ('^' factor)?
+    #   primary := num | var | const | group | func | frac | logb
+
+    def __init__(self, s):
+        self.tokens = tokenize(s)
+        self.i = 0
+
+    def peek(self):
+        return self.tokens[self.i]
+
+    def next(self):
+        tok = self.tokens[self.i]
+        self.i += 1
+        return tok
+
+    def error(self, msg, tok=None):
+        tok = tok or self.peek()
+        where = "end of input" if tok[0] == 'end' else f"{tok[1]!r} at position {tok[2]}"
+        raise ValueError(f"{msg}, found {where}")
+
+    def expect(self, kind, msg):
+        if self.peek()[0] != kind:
+            self.error(msg)
+        return self.next()
+
+    def parse(self):
+        node = self.expr()
+        if self.peek()[0] != 'end':
+            self.error("unexpected token")
+        return node
+
+    def expr(self):
+        terms = [self.term()]
+        signs = []
+        while self.peek()[0] == 'op' and self.peek()[1] in '+-':
+            signs.append(self.next()[1])
+            terms.append(self.term())
+        if len(terms) == 1:
+            return terms[0]
+        return Node('sum', tuple(signs), tuple(terms))
+
+    def startsFactor(self, tok):
+        return tok[0] in ('num', 'var', 'cmd', 'open', 'absopen')
+
+    def term(self):
+        factors = [self.factor()]
+        signs = []
+        while True:
+            tok = self.peek()
+            if tok[0] == 'op' and tok[1] in '*/':
+                self.next()
+                signs.append(tok[1])
+                factors.append(self.factor())
+            elif self.startsFactor(tok):
+                signs.append('*')
+                factors.append(self.factor())
+            else:
+                break
+        if len(factors) == 1:
+            return factors[0]
+        return Node('prod', tuple(signs), tuple(factors))
+
+    def factor(self):
+        tok = self.peek()
+        if tok[0] == 'op' and tok[1] in '+-':
+            self.next()
+            return Node('neg', tok[1], (self.factor(),))
+        return self.power()
+
+    def power(self):
+        base = self.primary()
+        if self.peek()[:2] == ('op', '^'):
+            self.next()
+            return Node('pow', None, (base, self.factor()))
+        return base
+
+    def group(self):
+        self.next()
+        if self.peek()[0] == 'close':
+            self.error("empty brackets")
+        inner = self.expr()
+        self.expect('close', "missing closing bracket")
+        return Node('group', None, (inner,))
+
+    def absGroup(self):
+        self.next()
+        inner = self.expr()
+        if self.peek()[0] not in ('absclose', 'close'):
+            self.error("missing \\right|")
+        self.next()
+        return Node('call', texFuncs[r'\abs'], (Node('group', None, (inner,)),))
+
+    def subscript(self, name):
+        if self.peek()[:2] != ('op', '_'):
+            return name
+        self.next()
+        tok = self.peek()
+        if tok[0] in ('num', 'var'):
+            self.next()
+            return name + '_' + tok[1]
+        if tok[0] == 'open':
+            self.next()
+            parts = []
+            while self.peek()[0] in ('num', 'var'):
+                parts.append(self.next()[1])
+            if not parts:
+                self.error("unsupported subscript")
+            self.expect('close', "unsupported subscript")
+            return name + '_' + ''.join(parts)
+        self.error("unsupported subscript")
+
+    def funcArg(self):
+        if self.peek()[0] == 'open':
+            return self.group()
+        return self.factor()
+
+    def fracArg(self):
+        tok = self.peek()
+        if tok[0] == 'open':
+            return self.group()
+        if tok[0] == 'num' and len(tok[1]) > 1:
+            # \frac12 -> un solo caracter por argumento, como en LaTeX
+            self.tokens[self.i] = ('num', tok[1][1:], tok[2] + 1)
+            return Node('num', tok[1][0])
+        return self.primary()
+
+    def primary(self):
+        tok = self.peek()
+        kind, text = tok[0], tok[1]
+        if kind == 'num':
+            self.next()
+            return Node('num', text)
+        if kind == 'var':
+            self.next()
+            return Node('var', self.subscript(text))
+        if kind == 'open':
+            return self.group()
+        if kind == 'absopen':
+            return self.absGroup()
+        if kind != 'cmd':
+            self.error("expected an operand")
+        self.next()
+        if text in texConsts:
+            return Node('const', texConsts[text])
+        if text == r'\frac':
+            num = self.fracArg()
+            return Node('frac', None, (num, self.fracArg()))
+        if text == r'\log' and self.peek()[:2] == ('op', '_'):
+            self.next()
+            tok = self.peek()
+            if tok[0] == 'open':
+                base = self.group()
+            elif tok[0] in ('num', 'var'):
+                base = self.primary()
+            else:
+                self.error("expected a logarithm base")
+            return Node('logb', None, (base, self.funcArg()))
+        if text in texFuncs:
+            exponent = None
+            if self.peek()[:2] == ('op', '^'):
+                # \sin^2(x) -> np.sin(x)**2
+                self.next()
+                exponent = self.power()
+            node = Node('call', texFuncs[text], (self.funcArg(),))
+            if exponent is not None:
+                node = Node('pow', None, (node, exponent))
+            return node
+        return Node('var', self.subscript(text[1:]))
+
+
+def parse(s):
+    try:
+        return Parser(s).parse()
+    except RecursionError:
+        raise ValueError("expression is nested too deeply") from None
+
+
+# precedencia de cada nodo en el codigo generado
+prec = {'sum': 1, 'prod': 2, 'neg': 3, 'pow': 4}
+
+
+def isAtom(node):
+    # el texto generado no contiene ninguno de los caracteres de brOps
+    if node.kind == 'var':
+        return '_' not in node.value
+    return node.kind in ('num', 'const')
+
+
+def isWrapped(node):
+    # el texto generado esta completamente entre un par de parentesis
+    return node.kind in ('group', 'frac', 'logb')
+
+
+def lastChar(node):
+    while node.kind in ('sum', 'prod', 'neg', 'pow'):
+        node = node.args[-1]
+    if node.kind in ('num', 'var', 'const'):
+        return node.value[-1]
+    return ')'
+
+
+def toNumpy(node):
+    out = []
+    last = lastChar(node)
+
+    def put(text):
+        nonlocal last
+        out.append(text)
+        last = text[-1]
+
+    def bracket(text, drop):
+        # los parentesis quitados siguen contando como caracter previo
+        nonlocal last
+        if not drop:
+            out.append(text)
+        last = text
+
+    def wrap(child, parens):
+        if parens:
+            put('(')
+            emit(child)
+            put(')')
+        else:
+            emit(child)
+
+    def emit(node, drop=False):
+        kind = node.kind
+        if kind in ('num', 'var', 'const'):
+            put(node.value)
+
+        elif kind == 'group':
+            inner = node.args[0]
+            markInner = False
+            if last in brOps:
+                if isAtom(inner):
+                    drop = True
+                elif isWrapped(inner):
+                    markInner = True
+            bracket('(', drop)
+            emit(inner, markInner)
+            bracket(')', drop)
+
+        elif kind == 'call':
+            put(node.value)
+            arg = node.args[0]
+            if arg.kind == 'group':
+                put('(')
+                emit(arg.args[0])
+                put(')')
+            else:
+                put('(')
+                emit(arg)
+                put(')')
+
+        elif kind == 'frac':
+            bracket('(', drop)
+            emit(node.args[0])
+            put('/')
+            emit(node.args[1])
+            bracket(')', drop)
+
+        elif kind == 'logb':
+            base, arg = node.args
+            bracket('(', drop)
+            put('np.log(')
+            emit(arg)
+            put(')/np.log(')
+            emit(base)
+            put(')')
+            bracket(')', drop)
+
+        elif kind == 'sum' or kind == 'prod':
+            p = prec[kind]
+            first = node.args[0]
+            wrap(first, prec.get(first.kind, 5) < p)
+            for sign, child in zip(node.value, node.args[1:]):
+                put(sign)
+                cp = prec.get(child.kind, 5)
+                wrap(child, cp < p or (cp == p and child.kind == kind))
+
+        elif kind == 'neg':
+            put(node.value)
+            child = node.args[0]
+            wrap(child, prec.get(child.kind, 5) < prec['neg'])
+
+        elif kind == 'pow':
+            base, exponent = node.args
+            wrap(base, prec.get(base.kind, 5) <= prec['pow'])
+            put('**')
+            wrap(exponent, prec.get(exponent.kind, 5) < prec['neg'])
+
+        else:
+            raise ValueError(f"unknown node {kind!r}")
+
+    try:
+        emit(node)
+    except RecursionError:
+        raise ValueError("expression is nested too deeply") from None
+    return ''.join(out)
+
+
+def convert(s):
+    return toNumpy(parse(s))
+
+
+## Funciones compiladas y vectorizadas a partir de LaTeX
+
+def normalize(s):
+    # acepta etiquetas completas como MathTex(r"f(x) = {x}^{2}")
+    s = getattr(s, 'tex_string', s)
+    s = s.split('=')[-1].replace('&', '')
+    s = re.sub(r'\s+', ' ', s).strip()
+    return re.sub(r' (?=[^a-zA-Z])|(?<=[^a-zA-Z]) ', '', s)
+
+
+def freeVars(node):
+    names = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.kind == 'var':
+            names.add(node.value)
+        stack.extend(node.args)
+    return names
+
+
+def compileNode(node, variables=('x',), params=()):
+    params = dict(params)
+    names = freeVars(node)
+    if 'e' in names and 'e' not in variables and 'e' not in params:
+        params['e'] = np.e
+    missing = names - set(variables) - set(params)
+    if missing:
+        raise ValueError(f"unbound symbols {sorted(missing)}, pass them as variables or params")
+
+    args = ', '.join(variables)
+    lines = [f"def f({args}):"]
+    lines += [f"    {v} = np.asarray({v}, dtype=float)" for v in variables]
+    lines.append(f"    return {toNumpy(node)}")
+    namespace = {'np': np, **params}
+    try:
+        exec(compile('\n'.join(lines), '<latex2python>', 'exec'), namespace)
+    except SyntaxError as e:
+        raise ValueError(f"cannot compile expression: {e.msg}") from None
+    f = namespace['f']
+
+    if names >= set(variables):
+        return f
+
+    # expresiones que no usan todas las variables igual devuelven un array
+    def g(*xs):
+        return np.broadcast_to(f(*xs), np.broadcast(*xs).shape)
+    return g
+
+
+@lru_cache(maxsize=256)
+def cachedFunction(key, variables, params):
+    return compileNode(parse(key), variables, params)
+
+
+def texFunction(s, variables=('x',), **params):
+    # f = texFunction(r"\frac{k}{x}", k=25); ax.plot(f) o f(np.linspace(1, 10, 100))
+    if isinstance(variables, str):
+        variables = (variables,)
+    return cachedFunction(normalize(s), tuple(variables), tuple(sorted(params.items())))
+
+
+## Derivadas simbolicas sobre el arbol
+
+def numNode(v):
+    if v < 0:
+        return Node('neg', '-', (numNode(-v),))
+    v = float(v)
+    return Node('num', str(int(v)) if v.is_integer() else repr(v))
+
+
+def numValue(node):
+    while node.kind == 'group':
+        node = node.args[0]
+    if node.kind == 'num':
+        return float(node.value)
+    if node.kind == 'neg':
+        v = numValue(node.args[0])
+        if v is not None and node.value == '-':
+            return -v
+        return v
+    return None
+
+
+def isNum(node, v):
+    return numValue(node) == v
+
+
+def addNodes(a, b, sign='+'):
+    if isNum(b, 0):
+        return a
+    if isNum(a, 0):
+        return b if sign == '+' else negNode(b)
+    if numValue(a) is not None and numValue(b) is not None:
+        return numNode(numValue(a) + numValue(b) if sign == '+' else numValue(a) - numValue(b))
+    return Node('sum', (sign,), (a, b))
+
+
+def negNode(a):
+    if numValue(a) is not None:
+        return numNode(-numValue(a))
+    if a.kind == 'neg':
+        return a.args[0] if a.value == '-' else negNode(a.args[0])
+    return Node('neg', '-', (a,))
+
+
+def mulNodes(a, b):
+    if isNum(a, 0) or isNum(b, 0):
+        return numNode(0)
+    if isNum(a, 1):
+        return b
+    if isNum(b, 1):
+        return a
+    if numValue(a) is not None and numValue(b) is not None:
+        return numNode(numValue(a) * numValue(b))
+    if isNum(a, -1):
+        return negNode(b)
+    if a.kind == 'neg' and a.value == '-':
+        return negNode(mulNodes(a.args[0], b))
+    if b.kind == 'neg' and b.value == '-':
+        return negNode(mulNodes(a, b.args[0]))
+    return Node('prod', ('*',), (a, b))
+
+
+def divNodes(a, b):
+    if isNum(b, 1):
+        return a
+    if isNum(a, 0):
+        return numNode(0)
+    if a.kind == 'neg' and a.value == '-':
+        return negNode(divNodes(a.args[0], b))
+    return Node('prod', ('/',), (a, b))
+
+
+def powNodes(b, e):
+    if isNum(e, 1):
+        return b
+    if isNum(e, 0):
+        return numNode(1)
+    return Node('pow', None, (b, e))
+
+
+def callNode(fn, arg):
+    return Node('call', fn, (arg,))
+
+
+# derivada de cada funcion respecto de su argumento u
+derivatives = {
+    'np.sin': lambda u: callNode('np.cos', u),
+    'np.cos': lambda u: negNode(callNode('np.sin', u)),
+    'np.tan': lambda u: divNodes(numNode(1), powNodes(callNode('np.cos', u), numNode(2))),
+    'np.arcsin': lambda u: divNodes(numNode(1), callNode('np.sqrt', addNodes(numNode(1), powNodes(u, numNode(2)), '-'))),
+    'np.arccos': lambda u: negNode(divNodes(numNode(1), callNode('np.sqrt', addNodes(numNode(1), powNodes(u, numNode(2)), '-')))),
+    'np.arctan': lambda u: divNodes(numNode(1), addNodes(numNode(1), powNodes(u, numNode(2)))),
+    'np.sinh': lambda u: callNode('np.cosh', u),
+    'np.cosh': lambda u: callNode('np.sinh', u),
+    'np.tanh': lambda u: divNodes(numNode(1), powNodes(callNode('np.cosh', u), numNode(2))),
+    'np.sqrt': lambda u: divNodes(numNode(1), mulNodes(numNode(2), callNode('np.sqrt', u))),
+    'np.exp': lambda u: callNode('np.exp', u),
+    'np.log': lambda u: divNodes(numNode(1), u),
+    'np.log10': lambda u: divNodes(numNode(1), mulNodes(u, callNode('np.log', numNode(10)))),
+    'np.abs': lambda u: callNode('np.sign', u),
+}
+
+
+def callArg(node):
+    arg = node.args[0]
+    return arg.args[0] if arg.kind == 'group' else arg
+
+
+def diff(node, var='x'):
+    # derivada de node respecto de var, con simplificaciones de 0 y 1
+    kind = node.kind
+    if var not in freeVars(node):
+        return numNode(0)
+
+    if kind == 'var':
+        return numNode(1)
+
+    if kind == 'group':
+        return diff(node.args[0], var)
+
+    if kind == 'neg':
+        d = diff(node.args[0], var)
+        return negNode(d) if node.value == '-' else d
+
+    if kind == 'sum':
+        d = diff(node.args[0], var)
+        for sign, child in zip(node.value, node.args[1:]):
+            d = addNodes(d, diff(child, var), sign)
+        return d
+
+    if kind == 'prod':
+        # se recorre a*b/c... de izquierda a derecha con regla del producto/cociente
+        left = node.args[0]
+        dLeft = diff(left, var)
+        for sign, child in zip(node.value, node.args[1:]):
+            dChild = diff(child, var)
+            if sign == '*':
+                dLeft = addNodes(mulNodes(dLeft, child), mulNodes(left, dChild))
+                left = mulNodes(left, child)
+            else:
+                dLeft = addNodes(divNodes(dLeft, child),
+                                 divNodes(mulNodes(left, dChild), powNodes(child, numNode(2))), '-')
+                left = divNodes(left, child)
+        return dLeft
+
+    if kind == 'frac':
+        a, b = node.args
+        da, db = diff(a, var), diff(b, var)
+        if isNum(db, 0):
+            return divNodes(da, b)
+        return divNodes(addNodes(mulNodes(da, b), mulNodes(a, db), '-'), powNodes(b, numNode(2)))
+
+    if kind == 'logb':
+        base, arg = node.args
+        u = callArg(Node('call', None, (arg,)))
+        if var not in freeVars(base):
+            return divNodes(diff(u, var), mulNodes(u, callNode('np.log', base)))
+        quotient = Node('frac', None, (callNode('np.log', u), callNode('np.log', base)))
+        return diff(quotient, var)
+
+    if kind == 'call':
+        if node.value not in derivatives:
+            raise ValueError(f"no derivative rule for {node.value}")
+        u = callArg(node)
+        return mulNodes(derivatives[node.value](u), diff(u, var))
+
+    if kind == 'pow':
+        b, e = node.args
+        if var not in freeVars(e):
+            # (b^e)' = e b^(e-1) b'
+            eMinus1 = addNodes(e, numNode(1), '-')
+            return mulNodes(mulNodes(e, powNodes(b, eMinus1)), diff(b, var))
+        if var not in freeVars(b):
+            return mulNodes(mulNodes(node, callNode('np.log', b)), diff(e, var))
+        # caso general: (b^e)' = b^e (e' ln b + e b'/b)
+        inner = addNodes(mulNodes(diff(e, var), callNode('np.log', b)),
+                         divNodes(mulNodes(e, diff(b, var)), b))
+        return mulNodes(node, inner)
+
+    raise ValueError(f"unknown node {kind!r}")
+
+
+@lru_cache(maxsize=256)
+def cachedDerivative(key, variables, wrt, order, params):
+    node = parse(key)
+    for _ in range(order):
+        node = diff(node, wrt)
+    return compileNode(node, variables, params)
+
+
+def texDerivative(s, variables=('x',), wrt=None, order=1, **params):
+    # df = texDerivative(r"x^2 + 3x^3"); df(np.linspace(-1, 1, 50))
+    if isinstance(variables, str):
+        variables = (variables,)
+    wrt = wrt or variables[0]
+    return cachedDerivative(normalize(s), tuple(variables), wrt, order, tuple(sorted(params.items())))
+
+
+def texDerivativeCode(s, wrt='x'):
+    return toNumpy(diff(parse(normalize(s)), wrt))
+
+
+def tangentLines(s, x0, wrt='x', **params):
+    # pendientes y ordenadas de las rectas tangentes en cada x0
+    x0 = np.asarray(x0, dtype=float)
+    f = texFunction(s, (wrt,), **params)
+    df = texDerivative(s, (wrt,), **params)
+    slope = df(x0)
+    return slope, f(x0) - slope * x0
+
+
+@lru_cache(maxsize=256)
+def cachedNewton(key, wrt, params):
+    node = parse(key)
+    step = addNodes(Node('var', wrt), divNodes(node, diff(node, wrt)), '-')
+    return compileNode(step, (wrt,), params)
+
+
+def newtonStep(s, wrt='x', **params):
+    # x_nuevo = x - f(x) / f'(x), para muchos x a la vez
+    return cachedNewton(normalize(s), wrt, tuple(sorted(params.items())))
+
+
+## Modo batch: convierte archivos o stdin en paralelo manteniendo el orden
+
+def convertLine(line, fmt):
+    line = line.rstrip('\r\n')
+    if fmt == 'lines':
+        if not line.strip():
+            return ''
+        try:
+            return convert(line)
+        except Exception as e:
+            return f"error: {e}"
+
+    if not line.strip():
+        return ''
+    try:
+        item = json.loads(line)
+        expr = item if isinstance(item, str) else item['expr']
+    except Exception as e:
+        return json.dumps({'input': line, 'error': f"invalid input: {e}"})
+    try:
+        return json.dumps({'expr': expr, 'result': convert(expr)})
+    except Exception as e:
+        return json.dumps({'expr': expr, 'error': str(e)})
+
+
+def convertChunk(lines, fmt):
+    return [convertLine(line, fmt) for line in lines]
+
+
+def convertBatch(lines, fmt='lines', workers=None, chunksize=256):
+    # genera una salida por linea de entrada, en el mismo orden;
+    # como mucho 2 bloques por proceso quedan pendientes en memoria
+    lines = iter(lines)
+    chunks = iter(lambda: list(islice(lines, chunksize)), [])
+    if workers == 1:
+        for chunk in chunks:
+            yield from convertChunk(chunk, fmt)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        maxPending = 2 * workers
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(convertChunk, chunk, fmt))
+            if len(pending) >= maxPending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def runBatch(args):
+    fmt = args.format
+    if fmt == 'auto':
+        fmt = 'jsonl' if args.input.endswith('.jsonl') else 'lines'
+
+    src = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    dst = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for n, result in enumerate(convertBatch(src, fmt, args.workers, args.chunksize), 1):
+            dst.write(result + '\n')
+            if n % args.chunksize == 0:
+                dst.flush()
+    finally:
+        dst.flush()
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+
+def interactive():
+
     while True:
-        
+
         s = input("Paste your expression: ")
-        
-        for k, v in symbols.items():
-            s = re.sub(k, v, s)            
-            
-        for k, v in consts.items():
-            s = re.sub(k, v, s)
-            
-        for f in funs:
-            s = repFunctions(f, s)  
 
-        for k, v in ops.items():
-            s = re.sub(k, v, s)
-            
+        try:
+            print("result : " + convert(s))
+        except ValueError as e:
+            print("error : " + str(e))
 
-            
-        s = insMultiply(s)
-        
-        s = remBrackets(s)
-            
-        print("result : " + s)
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert LaTeX expressions into NumPy code.")
+    parser.add_argument('input', nargs='?',
+                        help="file with one expression per line (JSON lines if it ends in .jsonl), "
+                             "'-' for stdin; without it the converter runs interactively")
+    parser.add_argument('-o', '--output', default='-', help="output file, stdout by default")
+    parser.add_argument('-f', '--format', choices=['auto', 'lines', 'jsonl'], default='auto')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="worker processes, all cores by default; 1 converts in this process")
+    parser.add_argument('--chunksize', type=int, default=256, help="expressions sent to a worker at a time")
+    args = parser.parse_args()
+
+    if args.input is None:
+        interactive()
+    else:
+        runBatch(args)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,158 @@
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+
+import latex2python as L
+
+## Benchmark de latex2python
+## Genera expresiones sinteticas cada vez mas largas / mas anidadas,
+## mide cada etapa por separado y guarda los resultados en JSON
+##
+##   python latex2pythonBench.py -o bench.json
+##   python latex2pythonBench.py --sizes 10 100 --depths 4 16 --repeat 3
+
+terms = [
+    r'\frac{x^2 + 1}{x - 1}',
+    r'\log_{2}(x + 3)',
+    r'\left| x - 1 \right|',
+    r'3x^4',
+    r'\sin(\pi x)',
+    r'\sqrt{x^2 + 1}',
+    r'8 \cdot ( x - 5)^{ 2 }',
+    r'e^{-x^2}',
+]
+
+
+def sizedExpression(n, seed=0):
+    # n terminos sumados, con profundidad de anidamiento baja
+    rnd = random.Random(seed)
+    return ' + '.join(rnd.choice(terms) for _ in range(n))
+
+
+def nestedExpression(depth):
+    # \frac, \log_ y \left|...\right| anidados alternadamente
+    s = 'x + 1'
+    for d in range(depth):
+        k = d % 3
+        if k == 0:
+            s = r'\frac{' + s + '}{x - ' + str(d + 2) + '}'
+        elif k == 1:
+            s = r'\log_{' + str(d + 2) + '}(' + s + ')'
+        else:
+            s = r'\left|' + s + r' - 2x\right|'
+    return s
+
+
+def legacyStages(s):
+    # etapas del pipeline por regex, cada una con la salida de la anterior
+    def subAll(table):
+        def run(s):
+            for k, v in table.items():
+                s = re.sub(k, v, s)
+            return s
+        return run
+
+    stages = [
+        ('symbols', subAll(L.symbols)),
+        ('consts', subAll(L.consts)),
+        ('repFunctions(\\frac)', lambda s: L.repFunctions(r'\\frac', s)),
+        ('repFunctions(\\log_)', lambda s: L.repFunctions(r'\\log_', s)),
+        ('ops', subAll(L.ops)),
+        ('insMultiply', L.insMultiply),
+        ('remBrackets', L.remBrackets),
+    ]
+    for name, fn in stages:
+        yield name, fn, s
+        if name == 'remBrackets':
+            # getCloseBr recorre todo el string cuando empieza con '('
+            yield 'getCloseBr', L.getCloseBr, '(' + s + ')'
+        s = fn(s)
+
+
+def parserStages(s):
+    tokens = L.tokenize(s)
+    node = L.parse(s)
+
+    def parseTokens(tokens):
+        p = L.Parser.__new__(L.Parser)
+        p.tokens = list(tokens)
+        p.i = 0
+        return p.parse()
+
+    yield 'tokenize', L.tokenize, s
+    yield 'parse', parseTokens, tokens
+    yield 'toNumpy', L.toNumpy, node
+    yield 'convert', L.convert, s
+
+
+def timeStage(fn, arg, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - t0)
+    return min(times), statistics.median(times)
+
+
+def runCase(series, param, s, args):
+    rows = []
+    engines = [('parser', parserStages)]
+    if len(s) <= args.max_legacy_chars:
+        engines.insert(0, ('legacy', legacyStages))
+    for engine, stages in engines:
+        for stage, fn, arg in stages(s):
+            best, median = timeStage(fn, arg, args.repeat)
+            rows.append({
+                'series': series, 'param': param, 'chars': len(s),
+                'engine': engine, 'stage': stage,
+                'min': best, 'median': median, 'repeat': args.repeat,
+            })
+            print(f"{series:>6} {param:>6} {len(s):>8} {engine:>7} {stage:<22} {best * 1e3:10.3f} ms",
+                  file=sys.stderr)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the latex2python conversion stages.")
+    parser.add_argument('-o', '--output', default='-', help="JSON results file, stdout by default")
+    parser.add_argument('--sizes', type=int, nargs='*', default=[1, 10, 50, 100, 250, 500, 1000],
+                        help="number of summed terms")
+    parser.add_argument('--depths', type=int, nargs='*', default=[1, 2, 4, 8, 16, 32, 48],
+                        help="nesting depth of \\frac / \\log_ / \\left|...\\right|")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-legacy-chars', type=int, default=20000,
+                        help="skip the regex pipeline above this length")
+    args = parser.parse_args()
+
+    results = []
+    for n in args.sizes:
+        results += runCase('size', n, sizedExpression(n, args.seed), args)
+    for d in args.depths:
+        results += runCase('depth', d, nestedExpression(d), args)
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
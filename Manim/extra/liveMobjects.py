@@ -0,0 +1,376 @@
+from manim import *
+
+from axesMaps import coords_to_points
+from curves import evaluate_samples
+
+## Mobjects que se actualizan en el lugar, sin crear mobjects nuevos en cada frame
+
+
+# Bezier points of the straight segments through corners (..., k, 3), as in Line
+def polyline_points(corners):
+    a, b = corners[..., :-1, :], corners[..., 1:, :]
+    curves = np.stack([a, a + (b - a) / 3, a + 2 * (b - a) / 3, b], axis=-2)
+    return curves.reshape(*corners.shape[:-2], -1, 3)
+
+
+# A polyline that only grows. The bezier points live in a preallocated
+# buffer that doubles when it fills up, so append_point is amortized O(1)
+# and the whole trace is one path no matter how long it gets.
+class GrowingPath(VMobject):
+    def __init__(self, start_point=ORIGIN, capacity=64, min_distance=1e-6, **kwargs):
+        VMobject.__init__(self, fill_opacity=0, **kwargs)
+        self.min_distance = min_distance
+        self.buffer = np.empty((4 * capacity, 3))
+        self.size = 0
+        self.set_buffer_points(np.repeat(np.array(start_point, dtype=float)[None], 4, axis=0))
+
+    def sync_buffer(self):
+        # shift/scale/become replace self.points, bring the buffer up to date
+        if self.points.base is not self.buffer or len(self.points) != self.size:
+            self.set_buffer_points(self.points)
+
+    def set_buffer_points(self, points):
+        points = np.asarray(points, dtype=float)
+        if len(points) > len(self.buffer):
+            self.reserve(len(points))
+        self.buffer[:len(points)] = points
+        self.size = len(points)
+        self.points = self.buffer[:self.size]
+        return self
+
+    def reserve(self, n_points):
+        capacity = len(self.buffer)
+        while capacity < n_points:
+            capacity *= 2
+        if capacity > len(self.buffer):
+            buffer = np.empty((capacity, 3))
+            buffer[:self.size] = self.buffer[:self.size]
+            self.buffer = buffer
+            self.points = self.buffer[:self.size]
+        return self
+
+    def append_points(self, points):
+        # straight segments from the last point through every new point
+        self.sync_buffer()
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        corners = np.vstack([self.points[-1:], points])
+        steps = np.linalg.norm(np.diff(corners, axis=0), axis=1)
+        if not (steps > self.min_distance).all():
+            # a point is kept when it is far enough from the last kept one,
+            # so many short steps still add up to a segment
+            kept = [0]
+            for i in range(1, len(corners)):
+                if np.linalg.norm(corners[i] - corners[kept[-1]]) > self.min_distance:
+                    kept.append(i)
+            corners = corners[kept]
+        if len(corners) < 2:
+            return self
+
+        curves = polyline_points(corners)
+        self.reserve(self.size + len(curves))
+        self.buffer[self.size:self.size + len(curves)] = curves
+        self.size += len(curves)
+        self.points = self.buffer[:self.size]
+        return self
+
+    def append_point(self, point):
+        return self.append_points(point)
+
+    def get_last_point(self):
+        return self.points[-1].copy()
+
+    def clear_points(self):
+        self.sync_buffer()
+        return self.set_buffer_points(np.repeat(self.points[-1:], 4, axis=0))
+
+
+# Riemann rectangles for any dx computed as arrays. Rectangles are grouped
+# in a fixed number of color bands (times two when negative areas get the
+# inverted color), each band one VMobject, so the mobject count does not
+# depend on dx. morph() goes between two dx levels on the finer grid: each
+# fine rectangle starts at the height of the coarse one that contains it.
+class RiemannSum(VGroup):
+    def __init__(
+        self,
+        axes,
+        graph,
+        x_range=None,
+        dx=0.1,
+        input_sample_type="left",
+        color=(BLUE, GREEN),
+        fill_opacity=1,
+        stroke_width=1,
+        stroke_color=BLACK,
+        show_signed_area=True,
+        color_bands=16,
+        **kwargs,
+    ):
+        VGroup.__init__(self, **kwargs)
+        self.axes = axes
+        self.function = getattr(graph, "underlying_function", graph)
+        if x_range is None:
+            x_range = axes.x_range[:2]
+        self.x_min, self.x_max = x_range[0], x_range[1]
+        self.input_sample_type = input_sample_type
+        self.show_signed_area = show_signed_area
+
+        colors = color_gradient(color, color_bands) if isinstance(color, (list, tuple)) else [color] * color_bands
+        signs = [1, -1] if show_signed_area else [1]
+        for sign in signs:
+            for band_color in colors:
+                band_color = band_color if sign > 0 else invert_color(band_color)
+                self.add(VMobject(
+                    fill_color=band_color,
+                    fill_opacity=fill_opacity,
+                    stroke_width=stroke_width,
+                    stroke_color=stroke_color,
+                ))
+        self.color_bands = color_bands
+        self.set_dx(dx)
+
+    def get_lefts(self, dx):
+        return np.arange(self.x_min, self.x_max, dx)
+
+    def get_heights(self, lefts, dx):
+        offset = {"left": 0, "right": dx, "center": dx / 2}[self.input_sample_type]
+        return evaluate_samples(self.function, lefts + offset)
+
+    def set_rectangles(self, lefts, width, heights):
+        n = len(lefts)
+        xs = np.stack([lefts, lefts + width, lefts + width, lefts, lefts], axis=1)
+        ys = np.stack([np.zeros(n), np.zeros(n), heights, heights, np.zeros(n)], axis=1)
+        corners = coords_to_points(self.axes, np.stack([xs, ys], axis=-1))
+        curves = polyline_points(corners)
+
+        bands = np.arange(n) * self.color_bands // max(n, 1)
+        if self.show_signed_area:
+            bands = bands + self.color_bands * (heights < 0)
+        order = np.argsort(bands, kind="stable")
+        bounds = np.searchsorted(bands[order], np.arange(len(self.submobjects) + 1))
+        for k, band in enumerate(self.submobjects):
+            band.set_points(curves[order[bounds[k]:bounds[k + 1]]].reshape(-1, 3))
+        return self
+
+    def set_dx(self, dx):
+        self.dx = dx
+        lefts = self.get_lefts(dx)
+        return self.set_rectangles(lefts, dx, self.get_heights(lefts, dx))
+
+    # Both levels on the finer partition: the left ends, their width, and
+    # the heights at dx_from and at dx_to (coarse heights repeated over the
+    # fine rectangles they cover)
+    def morph_heights(self, dx_from, dx_to):
+        fine, coarse = min(dx_from, dx_to), max(dx_from, dx_to)
+        lefts = self.get_lefts(fine)
+        fine_heights = self.get_heights(lefts, fine)
+        coarse_lefts = self.get_lefts(coarse)
+        cell = np.clip(np.floor((lefts - self.x_min) / coarse + 1e-9).astype(int), 0, len(coarse_lefts) - 1)
+        coarse_heights = self.get_heights(coarse_lefts, coarse)[cell]
+        if dx_from > dx_to:
+            return lefts, fine, coarse_heights, fine_heights
+        return lefts, fine, fine_heights, coarse_heights
+
+    def morph(self, dx_from, dx_to, alpha):
+        lefts, width, start, end = self.morph_heights(dx_from, dx_to)
+        return self.set_rectangles(lefts, width, interpolate(start, end, alpha))
+
+
+# Transform between two RiemannSum levels with array math only: the
+# function is sampled once in begin, frames interpolate the heights
+class RefineRiemannSum(Animation):
+    def __init__(self, riemann_sum, dx, **kwargs):
+        self.target_dx = dx
+        super().__init__(riemann_sum, **kwargs)
+
+    def begin(self):
+        self.lefts, self.width, self.start_heights, self.end_heights = self.mobject.morph_heights(
+            self.mobject.dx, self.target_dx
+        )
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        heights = interpolate(self.start_heights, self.end_heights, self.rate_func(alpha))
+        self.mobject.set_rectangles(self.lefts, self.width, heights)
+
+    def finish(self):
+        super().finish()
+        self.mobject.set_dx(self.target_dx)
+
+
+# Plays a mobject that redraws itself from one number (a step, a time)
+# from its current value to `to`. Subclasses say where it ends by
+# default and how the number is read and set.
+class RunParameter(Animation):
+    def __init__(self, mobject, to=None, rate_func=linear, **kwargs):
+        self.target_value = self.last_value(mobject) if to is None else to
+        super().__init__(mobject, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self.start_value = self.get_value()
+        super().begin()
+
+    def create_starting_mobject(self):
+        # the mobject is rebuilt from its own data, no need to copy it
+        return Mobject()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        self.set_value(self.start_value + (self.target_value - self.start_value) * alpha)
+
+
+# Where the live primitives read their geometry from: a mobject (its
+# center), a callable, or a constant
+def point_getter(source):
+    if isinstance(source, Mobject):
+        return source.get_center
+    if callable(source):
+        return lambda: np.asarray(source(), dtype=float)
+    point = np.array(source, dtype=float)
+    return lambda: point
+
+
+def value_getter(source):
+    if isinstance(source, ValueTracker):
+        return source.get_value
+    if callable(source):
+        return source
+    return lambda: source
+
+
+# Writes into the existing point array when the shape allows it
+def write_points(mobject, points):
+    if mobject.points.shape == points.shape:
+        mobject.points[:] = points
+    else:
+        mobject.set_points(points)
+    return mobject
+
+
+# Live primitives: instead of always_redraw building a new Line/Polygon/Dot
+# every frame, one mobject is created and its updater rewrites the points.
+class LiveSegment(VMobject):
+    def __init__(self, start, end, **kwargs):
+        VMobject.__init__(self, **kwargs)
+        self.start_getter = point_getter(start)
+        self.end_getter = point_getter(end)
+        self.update_points()
+        self.add_updater(lambda m: m.update_points())
+
+    def update_points(self):
+        corners = np.array([self.start_getter(), self.end_getter()])
+        return write_points(self, polyline_points(corners))
+
+
+class LivePolygon(VMobject):
+    # one source per vertex, or a single callable returning every vertex
+    def __init__(self, *vertices, **kwargs):
+        VMobject.__init__(self, **kwargs)
+        self.vertex_getters = [point_getter(vertex) for vertex in vertices]
+        self.update_points()
+        self.add_updater(lambda m: m.update_points())
+
+    def update_points(self):
+        corners = [getter() for getter in self.vertex_getters]
+        if len(corners) == 1 and np.ndim(corners[0]) == 2:
+            corners = corners[0]
+        corners = np.asarray(corners, dtype=float)
+        return write_points(self, polyline_points(np.vstack([corners, corners[:1]])))
+
+
+class LiveDot(Dot):
+    def __init__(self, point, **kwargs):
+        self.point_getter = point_getter(point)
+        Dot.__init__(self, point=self.point_getter(), **kwargs)
+        self.add_updater(lambda m: m.move_to(m.point_getter()))
+
+
+# axes.plot whose function may change every frame (e.g. it reads a
+# ValueTracker), resampled at the same x values into the same points
+class LiveGraph(VMobject):
+    def __init__(self, axes, function, x_range=None, **kwargs):
+        VMobject.__init__(self, **kwargs)
+        self.axes = axes
+        self.underlying_function = function
+        x_range = list(x_range if x_range is not None else axes.x_range)
+        if len(x_range) == 2:
+            x_range.append((x_range[1] - x_range[0]) / 100)
+        self.xs = np.append(np.arange(*x_range), x_range[1])
+        self.update_points()
+        self.add_updater(lambda m: m.update_points())
+
+    def update_points(self):
+        ys = evaluate_samples(self.underlying_function, self.xs)
+        anchors = coords_to_points(self.axes, np.stack([self.xs, ys], axis=-1))
+        # same handles as make_smooth, written in place
+        h1, h2 = get_smooth_handle_points(anchors)
+        curves = np.stack([anchors[:-1], h1, h2, anchors[1:]], axis=1).reshape(-1, 3)
+        return write_points(self, curves)
+
+
+# Same lines as axes.get_secant_slope_group, moved every frame
+class LiveSecantSlopeGroup(VGroup):
+    def __init__(
+        self,
+        axes,
+        graph,
+        x,
+        dx=None,
+        dx_line_color=YELLOW,
+        dy_line_color=None,
+        include_secant_line=True,
+        secant_line_color=GREEN,
+        secant_line_length=10,
+        **kwargs,
+    ):
+        VGroup.__init__(self, **kwargs)
+        self.axes = axes
+        self.function = getattr(graph, "underlying_function", graph)
+        self.x_getter = value_getter(x)
+        self.dx = dx or float(axes.x_range[1] - axes.x_range[0]) / 10
+        self.secant_line_length = secant_line_length
+        if dy_line_color is None:
+            dy_line_color = graph.get_color() if isinstance(graph, Mobject) else dx_line_color
+
+        self.dx_line = VMobject(color=dx_line_color)
+        self.df_line = VMobject(color=dy_line_color)
+        self.add(self.dx_line, self.df_line)
+        self.secant_line = None
+        if include_secant_line:
+            self.secant_line = VMobject(color=secant_line_color)
+            self.add(self.secant_line)
+        self.update_points()
+        self.add_updater(lambda m: m.update_points())
+
+    def update_points(self):
+        x = self.x_getter()
+        xs = np.array([x, x + self.dx])
+        p1, p2 = coords_to_points(self.axes, np.stack([xs, evaluate_samples(self.function, xs)], axis=-1))
+        interim_point = p2[0] * RIGHT + p1[1] * UP
+        write_points(self.dx_line, polyline_points(np.array([p1, interim_point])))
+        write_points(self.df_line, polyline_points(np.array([interim_point, p2])))
+        if self.secant_line is not None:
+            direction = normalize(p2 - p1)
+            center = (p1 + p2) / 2
+            half = direction * self.secant_line_length / 2
+            write_points(self.secant_line, polyline_points(np.array([center - half, center + half])))
+        return self
+
+
+# Tangent at x from a central difference, as a live segment of fixed length
+class LiveTangentLine(VMobject):
+    def __init__(self, axes, graph, x, length=2, dx=1e-6, **kwargs):
+        VMobject.__init__(self, **kwargs)
+        self.axes = axes
+        self.function = getattr(graph, "underlying_function", graph)
+        self.x_getter = value_getter(x)
+        self.length = length
+        self.dx = dx
+        self.update_points()
+        self.add_updater(lambda m: m.update_points())
+
+    def update_points(self):
+        x = self.x_getter()
+        xs = np.array([x - self.dx, x, x + self.dx])
+        points = coords_to_points(self.axes, np.stack([xs, evaluate_samples(self.function, xs)], axis=-1))
+        half = normalize(points[2] - points[0]) * self.length / 2
+        return write_points(self, polyline_points(np.array([points[1] - half, points[1] + half])))
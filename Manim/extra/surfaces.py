@@ -0,0 +1,233 @@
+from manim import *
+import os
+import hashlib
+
+from diskCache import cache_dir, function_key, save_array
+
+## Superficies parametricas evaluadas sobre toda la grilla (u, v) de una vez
+## Surface llama a la funcion una vez por punto de cada cara (16 por cara).
+## MeshSurface la llama con arrays de meshgrid y, si la funcion no sirve
+## para arrays, cae a una llamada por punto. Las grillas evaluadas se
+## guardan por (hash de la funcion, rangos, resolucion), en memoria y en
+## media/surface_cache, asi un re-render no vuelve a muestrear. Si la
+## funcion lee algo sin clave estable (ver diskCache.function_key) se
+## evalua siempre, sin cache.
+
+grids = {}
+
+
+def per_point(func, us, vs):
+    return np.array([[np.asarray(func(u, v), dtype=float) for v in vs] for u in us])
+
+
+# func on the whole (len(us), len(vs)) grid -> (len(us), len(vs), 3). A few
+# points are checked against scalar calls, which catches functions that run
+# on arrays but mix samples (e.g. np.linalg.norm over the whole grid).
+def evaluate_grid(func, us, vs):
+    U, V = np.meshgrid(us, vs, indexing="ij")
+    try:
+        with np.errstate(all="ignore"):
+            points = np.asarray(func(U, V), dtype=float)
+        if points.shape == (3,) + U.shape:
+            points = np.moveaxis(points, 0, -1)
+        if points.shape != U.shape + (3,):
+            raise ValueError("not a grid of points")
+        rows = np.unique(np.linspace(0, len(us) - 1, 3).astype(int))
+        cols = np.unique(np.linspace(0, len(vs) - 1, 3).astype(int))
+        for i in rows:
+            for j in cols:
+                if not np.allclose(points[i, j], func(us[i], vs[j]), equal_nan=True):
+                    raise ValueError("vectorized evaluation differs")
+        return points
+    except (TypeError, ValueError, IndexError):
+        return per_point(func, us, vs)
+
+
+# evaluate_grid, cached by function_key, ranges and resolution
+def cached_grid(func, us, vs):
+    key = function_key(func)
+    if key is None:
+        return evaluate_grid(func, us, vs)
+    key = hashlib.blake2b(
+        (key + repr((us[0], us[-1], len(us), vs[0], vs[-1], len(vs)))).encode(),
+        digest_size=16,
+    ).hexdigest()
+    if key not in grids:
+        path = os.path.join(cache_dir("surface_cache"), key + ".npy")
+        if os.path.exists(path):
+            grids[key] = np.load(path)
+        else:
+            grids[key] = evaluate_grid(func, us, vs)
+            save_array(path, grids[key])
+    return grids[key]
+
+
+# uv values of every bezier point of a face as in set_points_as_corners:
+# corners plus the handles at 1/3 and 2/3, all on a lattice 3 times finer
+def thirds(values):
+    return np.append(interpolate(values[:-1, None], values[1:, None], np.array([0, 1, 2]) / 3).ravel(), values[-1])
+
+
+# (u, v) lattice offsets of the 16 points of a face, in the order of
+# (u1, v1) -> (u2, v1) -> (u2, v2) -> (u1, v2) -> (u1, v1)
+face_offsets = np.array(
+    [(k, 0) for k in range(4)]
+    + [(3, k) for k in range(4)]
+    + [(3 - k, 3) for k in range(4)]
+    + [(0, 3 - k) for k in range(4)]
+)
+
+
+class MeshSurface(Surface):
+    def __init__(self, func, *args, **kwargs):
+        self.mapped_in_setup = False
+        # super(), with --renderer=opengl the base class is OpenGLSurface
+        super().__init__(func, *args, **kwargs)
+
+    # Cairo: faces are built in uv space by Surface, then all their points
+    # are taken from one cached grid evaluation
+    def _setup_in_uv_space(self):
+        super()._setup_in_uv_space()
+        u_values, v_values = self._get_u_values_and_v_values()
+        lattice = cached_grid(self._func, thirds(u_values), thirds(v_values))
+        for face in self.submobjects:
+            index = 3 * np.array([face.u_index, face.v_index]) + face_offsets
+            face.set_points(lattice[index[:, 0], index[:, 1]])
+        self.mapped_in_setup = True
+
+    def apply_function(self, function, **kwargs):
+        # Surface.__init__ maps every point through func right after the setup
+        if self.mapped_in_setup:
+            self.mapped_in_setup = False
+            return self
+        return super().apply_function(function, **kwargs)
+
+    # OpenGL: the three grids (plain, nudged in u, nudged in v) in one call each
+    def init_points(self):
+        nu, nv = self.resolution
+        us = np.linspace(*self.u_range, nu)
+        vs = np.linspace(*self.v_range, nv)
+        func = getattr(self, "passed_uv_func", None) or self.uv_func
+        self.set_points(np.vstack([
+            cached_grid(func, us + du, vs + dv).reshape(nu * nv, 3)
+            for du, dv in [(0, 0), (self.epsilon, 0), (0, self.epsilon)]
+        ]))
+
+
+def sphere_function(radius=1):
+    def sphere(u, v):
+        return np.array([
+            radius * np.cos(u) * np.sin(v),
+            radius * np.sin(u) * np.sin(v),
+            -radius * np.cos(v),
+        ])
+    return sphere
+
+
+def torus_function(major_radius=3, minor_radius=1):
+    def torus(u, v):
+        ring = major_radius - minor_radius * np.cos(v)
+        return np.array([ring * np.cos(u), ring * np.sin(u), -minor_radius * np.sin(v)])
+    return torus
+
+
+# Same parametrization and ranges as manim's Sphere and Torus
+class MeshSphere(MeshSurface):
+    def __init__(self, center=ORIGIN, radius=1, resolution=None, u_range=(0, TAU), v_range=(0, PI), **kwargs):
+        if resolution is None:
+            resolution = (101, 51) if config.renderer == "opengl" else (24, 12)
+        MeshSurface.__init__(self, sphere_function(radius), resolution=resolution, u_range=u_range, v_range=v_range, **kwargs)
+        self.shift(center)
+
+
+class MeshTorus(MeshSurface):
+    def __init__(self, major_radius=3, minor_radius=1, u_range=(0, TAU), v_range=(0, TAU), resolution=None, **kwargs):
+        if resolution is None:
+            resolution = (101, 101) if config.renderer == "opengl" else (24, 24)
+        MeshSurface.__init__(
+            self, torus_function(major_radius, minor_radius),
+            u_range=u_range, v_range=v_range, resolution=resolution, **kwargs,
+        )
+
+
+# MeshSurface that picks its tessellation from how big it looks on screen.
+# An updater projects the surface with the current camera and, when the
+# projected size calls for another level of detail, rebuilds the faces
+# from the cached grids. Whatever affine transform the surface went
+# through (scale, shift, rotate) is fitted from the old faces and applied
+# to the new ones, and face styles are kept by checkerboard parity.
+class LODSurface(MeshSurface):
+    def __init__(
+        self,
+        func,
+        camera=None,
+        pixels_per_face=40,
+        min_resolution=4,
+        max_resolution=64,
+        resolution=24,
+        **kwargs,
+    ):
+        resolution = np.broadcast_to(resolution, 2)
+        self.aspect = resolution / resolution.max()
+        self.pixels_per_face = pixels_per_face
+        self.min_resolution = min_resolution
+        self.max_resolution = max_resolution
+        super().__init__(func, resolution=tuple(int(r) for r in resolution), **kwargs)
+        if camera is not None:
+            self.track(camera)
+
+    def track(self, camera):
+        self.add_updater(lambda m: m.update_lod(camera))
+        return self
+
+    # largest extent of the projected surface, in pixels
+    def screen_size(self, camera):
+        points = np.array([face.points[0] for face in self.submobjects])
+        if hasattr(camera, "project_points"):
+            points = camera.project_points(points)
+        extent = (points.max(axis=0) - points.min(axis=0))[:2].max()
+        return extent * config.pixel_width / camera.frame_width
+
+    # levels grow by sqrt(2), so a change is never less than ~40% more or fewer faces
+    def level(self, faces):
+        return 2 * np.log2(max(faces, 1e-9) / self.min_resolution)
+
+    def resolution_for(self, level):
+        faces = self.min_resolution * 2 ** (np.round(level) / 2)
+        return tuple(int(np.clip(np.ceil(faces * a), self.min_resolution, self.max_resolution)) for a in self.aspect)
+
+    def update_lod(self, camera):
+        if config.renderer == "opengl":
+            return self
+        target = self.level(self.screen_size(camera) / self.pixels_per_face)
+        current = self.level(max(self._get_u_values_and_v_values()[i].size - 1 for i in range(2)))
+        if abs(target - current) > 0.75:
+            resolution = self.resolution_for(target)
+            if resolution != tuple(np.broadcast_to(self.resolution, 2)):
+                self.set_resolution(resolution)
+        return self
+
+    def corner_lattice(self):
+        u_values, v_values = self._get_u_values_and_v_values()
+        return cached_grid(self._func, thirds(u_values), thirds(v_values))[::3, ::3]
+
+    def set_resolution(self, resolution):
+        old_faces = self.submobjects
+        corners = self.corner_lattice()
+        source = np.array([corners[f.u_index, f.v_index] for f in old_faces])
+        target = np.array([f.points[0] for f in old_faces])
+        affine, *_ = np.linalg.lstsq(np.hstack([source, np.ones((len(source), 1))]), target, rcond=None)
+        styles = {}
+        for face in old_faces:
+            styles.setdefault((face.u_index + face.v_index) % 2, face)
+
+        self.resolution = resolution
+        self.submobjects = []
+        self._setup_in_uv_space()
+        self.mapped_in_setup = False
+        for face in self.submobjects:
+            face.points = np.hstack([face.points, np.ones((len(face.points), 1))]) @ affine
+            face.match_style(styles.get((face.u_index + face.v_index) % 2, old_faces[0]))
+        if self.should_make_jagged:
+            self.make_jagged()
+        return self
@@ -0,0 +1,102 @@
+from manim import *
+from axesMaps import coords_to_points
+from curves import evaluate_samples
+
+## Lineas de tiempo precalculadas para ValueTrackers
+## Todos los keyframes se declaran antes de animar, los valores del tracker
+## y de lo que depende de el se calculan en una sola pasada vectorizada,
+## y cada frame solo lee de esos arrays
+##
+##   timeline = TrackerTimeline(t)
+##   timeline.bind_position(dot, lambda x: graph_points(ax, func, x))
+##   for v in [3, -3, 0]:
+##       timeline.to(v)
+##   for segment in timeline.compile():
+##       self.play(segment)
+
+
+# rate functions like smooth use min/max, so they may not take arrays
+def rate_values(rate_func, alphas):
+    try:
+        values = np.asarray(rate_func(alphas), dtype=float)
+        if values.shape == alphas.shape:
+            return values
+    except (TypeError, ValueError):
+        pass
+    return np.array([rate_func(alpha) for alpha in alphas], dtype=float)
+
+
+# axes.c2p(x, f(x)) for a whole array of x
+def graph_points(axes, function, xs):
+    xs = np.asarray(xs, dtype=float)
+    return coords_to_points(axes, np.stack([xs, evaluate_samples(function, xs)], axis=-1))
+
+
+class TrackerTimeline:
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.segments = []
+        self.bindings = []
+
+    # next keyframe, as in tracker.animate.set_value(value)
+    def to(self, value, run_time=1, rate_func=smooth):
+        self.segments.append((value, run_time, rate_func))
+        return self
+
+    # function maps an array of tracker values to one row per value,
+    # apply(mobject, row) puts a row on the mobject
+    def bind(self, mobject, function, apply):
+        self.bindings.append((mobject, function, apply))
+        return self
+
+    def bind_position(self, mobject, function):
+        return self.bind(mobject, function, lambda mob, point: mob.move_to(point))
+
+    def bind_value(self, mobject, function=lambda values: values):
+        return self.bind(mobject, function, lambda mob, value: mob.set_value(value))
+
+    def compile(self, frame_rate=None):
+        # one sample per frame of every segment, evaluated all at once
+        frame_rate = frame_rate or config.frame_rate
+        start = self.tracker.get_value()
+        values, counts = [], []
+        for value, run_time, rate_func in self.segments:
+            n = max(int(np.ceil(run_time * frame_rate)), 1) + 1
+            alphas = rate_values(rate_func, np.linspace(0, 1, n))
+            values.append(start + (value - start) * alphas)
+            counts.append(n)
+            start = value
+        values = np.concatenate(values)
+        tables = [np.asarray(function(values), dtype=float) for _, function, _ in self.bindings]
+
+        bounds = np.cumsum([0] + counts)
+        return [
+            TimelineSegment(self, values[a:b], [table[a:b] for table in tables], run_time=run_time)
+            for a, b, (_, run_time, _) in zip(bounds[:-1], bounds[1:], self.segments)
+        ]
+
+
+# One keyframe of a TrackerTimeline, frames only look up the tables. The
+# animated mobject groups the tracker with everything bound to it, so the
+# renderer redraws the bound mobjects every frame instead of leaving them
+# in the static background. Their updaters keep running (a label with
+# next_to(dot) still follows the dot).
+class TimelineSegment(Animation):
+    def __init__(self, timeline, values, tables, **kwargs):
+        self.timeline = timeline
+        self.values = values
+        self.tables = tables
+        bound = [timeline.tracker]
+        for mobject, _, _ in timeline.bindings:
+            if all(mobject is not other for other in bound):
+                bound.append(mobject)
+        kwargs.setdefault("suspend_mobject_updating", False)
+        super().__init__(Group(*bound), rate_func=linear, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = alpha * (len(self.values) - 1)
+        i = min(int(t), len(self.values) - 2)
+        w = t - i
+        self.timeline.tracker.set_value(interpolate(self.values[i], self.values[i + 1], w))
+        for (mobject, _, apply), table in zip(self.timeline.bindings, self.tables):
+            apply(mobject, interpolate(table[i], table[i + 1], w))
@@ -0,0 +1,40 @@
+import math
+
+import pytest
+
+
+class Axis:
+    def __init__(self, x_range):
+        self.x_range = x_range
+
+
+# Just what the array code reads from an Axes: c2p and the axis ranges.
+# x goes to 0.5 * x - 3, y to 2 * y - 1 (or 2 * log10(y) - 1).
+class FakeAxes:
+    def __init__(self, log_y=False):
+        self.log_y = log_y
+        self.x_range = [0, 10, 1]
+
+    def get_axes(self):
+        return [Axis([0, 10]), Axis([1, 100])]
+
+    def c2p(self, x, y):
+        # imported here so collecting the tests works without numpy, the
+        # test modules skip themselves
+        import numpy as np
+
+        if self.log_y:
+            if y <= 0:
+                raise ValueError("log(0) is undefined")
+            y = math.log10(y)
+        return np.array([0.5 * x - 3, 2 * y - 1, 0])
+
+
+@pytest.fixture
+def linear_axes():
+    return FakeAxes()
+
+
+@pytest.fixture
+def log_axes():
+    return FakeAxes(log_y=True)
@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from arcLength import ArcLengthTable, arc_length_table
+
+
+# Circle of radius r as n cubic arcs, handles at 4/3 tan(theta / 4) as in
+# manim's Arc, with the start at angle 0
+def circle_points(radius=2, n=8):
+    angles = np.linspace(0, 2 * np.pi, n + 1)
+    a, b = angles[:-1], angles[1:]
+    h = 4 / 3 * np.tan((b - a) / 4)
+
+    def at(t):
+        return np.stack([np.cos(t), np.sin(t), np.zeros_like(t)], axis=-1)
+
+    def tangent(t):
+        return np.stack([-np.sin(t), np.cos(t), np.zeros_like(t)], axis=-1)
+
+    curves = np.stack([at(a), at(a) + h[:, None] * tangent(a), at(b) - h[:, None] * tangent(b), at(b)], axis=1)
+    return radius * curves.reshape(-1, 3)
+
+
+def test_circle_length():
+    table = ArcLengthTable(circle_points(radius=2))
+    assert table.get_length() == pytest.approx(4 * np.pi, rel=1e-4)
+
+
+def test_proportions_are_even_along_the_circle():
+    table = ArcLengthTable(circle_points(radius=2))
+    alphas = np.linspace(0, 1, 41)
+    points = table.point_from_proportion(alphas)
+    assert points.shape == (41, 3)
+    angles = np.unwrap(np.arctan2(points[:, 1], points[:, 0]))
+    assert np.allclose(angles, 2 * np.pi * alphas, atol=1e-3)
+    assert np.allclose(np.linalg.norm(points, axis=1), 2, atol=1e-3)
+
+
+class Path:
+    def __init__(self, points):
+        self.points = points
+
+
+def test_table_is_rebuilt_only_when_points_change():
+    path = Path(circle_points())
+    table = arc_length_table(path)
+    assert arc_length_table(path) is table
+    path.points = path.points * 2
+    assert arc_length_table(path) is not table
+    assert arc_length_table(path).get_length() == pytest.approx(8 * np.pi, rel=1e-4)
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from barChartRace import BarChartRace
+
+nan = np.nan
+names = ["A", "B", "C", "D"]
+values = [
+    [4, 3, 2, nan],
+    [nan, 5, 1, 6],
+    [1, nan, nan, 2],
+]
+
+
+def test_missing_values_keep_the_last_known_one():
+    race = BarChartRace(names, [2000, 2001, 2002], values, top_n=2)
+    # D has no value before 2001, so it starts at 0
+    assert np.array_equal(race.values, [[4, 3, 2, 0], [4, 5, 1, 6], [1, 5, 1, 2]])
+
+
+def test_ranks_per_keyframe():
+    race = BarChartRace(names, [2000, 2001, 2002], values, top_n=2)
+    # ties keep the order of the names
+    assert np.array_equal(race.ranks, [[0, 1, 2, 3], [2, 1, 3, 0], [2, 0, 3, 1]])
+
+
+def test_slots_follow_the_ranking():
+    race = BarChartRace(names, [2000, 2001, 2002], values, top_n=2)
+    assert race.slot_names[:2] == [0, 1]
+    race.set_time(1)
+    assert race.slot_names[:2] == [3, 1]
+    # halfway between 2001 and 2002 D and B sit between ranks 0 and 1
+    race.set_time(1.5)
+    assert sorted(race.slot_names[:2]) == [1, 3]
+    assert race.slot_opacities[:2] == [1, 1]
@@ -0,0 +1,94 @@
+import math
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from axesMaps import axes_affine, axes_map
+from curves import adaptive_samples, evaluate_samples, vectorized
+
+ts = np.linspace(0, 2, 50)
+
+
+def test_vectorized_function_is_called_once():
+    calls = []
+
+    def f(t):
+        calls.append(np.ndim(t))
+        return np.array([np.cos(t), np.sin(t), 0 * t])
+
+    samples = evaluate_samples(f, ts)
+    assert samples.shape == (50, 3)
+    assert np.allclose(samples[:, 0], np.cos(ts))
+    # one call with the array, a few scalar checks, and then only the array
+    assert calls.count(1) == 1
+    calls.clear()
+    evaluate_samples(f, ts)
+    assert calls == [1]
+
+
+def test_scalar_only_function_falls_back():
+    def step(t):
+        return math.sqrt(t) if t > 1 else 0.0
+
+    assert np.allclose(evaluate_samples(step, ts), [step(t) for t in ts])
+    assert step.vectorized is False
+
+
+def test_constant_components_are_broadcast():
+    samples = evaluate_samples(lambda t: np.array([t, 1, 0]), ts)
+    assert np.allclose(samples[:, 1], 1)
+
+
+def test_function_mixing_samples_falls_back():
+    normalized = lambda t: t / np.max(np.abs(t)) if np.ndim(t) else t / 2
+    assert np.allclose(evaluate_samples(normalized, ts), ts / 2)
+
+
+def test_declared_vectorized_errors_are_raised():
+    with pytest.raises(TypeError):
+        evaluate_samples(vectorized(lambda t: math.sin(t)), ts)
+
+
+def test_linear_axes_map_in_one_product(linear_axes):
+    axes = linear_axes
+    origin, units = axes_affine(axes, 2)
+    assert np.allclose(origin, [-3, -1, 0])
+    coords = np.array([[[2, 5], [4, 50]]])
+    assert np.allclose(axes_map(axes)(coords), [[[-2, 9, 0], [-1, 99, 0]]])
+
+
+def test_log_axes_fall_back_to_c2p(log_axes):
+    axes = log_axes
+    assert axes_affine(axes, 2) is None
+    assert np.allclose(axes_map(axes)([[2, 10], [4, 100]]), [[-2, 1, 0], [-1, 3, 0]])
+
+
+def graph_of(function):
+    def evaluate(ts):
+        with np.errstate(all="ignore"):
+            return np.stack([ts, function(ts)], axis=-1)
+    return evaluate
+
+
+@pytest.mark.parametrize("pole", [0, 0.3])
+def test_adaptive_samples_cut_at_a_pole(pole):
+    # 0 is on the initial grid (1/x is inf there), 0.3 is never sampled
+    left, right = adaptive_samples(graph_of(lambda x: 1 / (x - pole)), -1, 1)
+    assert left[0, 0] == -1 and right[-1, 0] == 1
+    assert left[-1, 0] < pole < right[0, 0]
+    assert left[-1, 1] < -100 and right[0, 1] > 100
+    # dense next to the pole, the coarse grid far from it
+    assert np.diff(right[:, 0]).min() < 1e-3
+    assert np.diff(right[:, 0]).max() == pytest.approx(2 / 64)
+
+
+def test_adaptive_samples_keep_smooth_curves_whole():
+    pieces = adaptive_samples(graph_of(np.sin), -1, 1)
+    assert len(pieces) == 1
+    assert np.allclose(pieces[0][:, 1], np.sin(pieces[0][:, 0]))
@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("pandas")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from datasets import dataset
+
+CSV = """Country Name,Country Code,2020,2021
+Argentina,ARG,8500.5,10600.2
+Brasil,BRA,6800,..
+Chile,CHL,13100,16300
+,,,
+Data from database: World Development Indicators,,,
+"""
+
+
+@pytest.fixture
+def csv_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("MANIM_DATASET_CACHE", str(tmp_path / "cache"))
+    path = tmp_path / "gdp.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return str(path)
+
+
+def test_columns_and_rows(csv_path):
+    gdp = dataset(csv_path)
+    assert gdp.columns == ["Country Name", "Country Code", "2020", "2021"]
+    assert len(gdp) == 3
+    assert gdp["2020"].dtype == float
+    assert np.isnan(gdp["2021"][1])
+
+    rows = gdp.select(["Country Name", "2021"], where={"Country Name": ["Chile", "Argentina"]})
+    assert list(rows.index) == [0, 2]
+    assert list(rows["Country Name"]) == ["Argentina", "Chile"]
+    assert list(rows["2021"]) == [10600.2, 16300]
+    with pytest.raises(KeyError):
+        gdp.column("2022")
+
+
+def test_changed_file_is_parsed_again(csv_path):
+    assert dataset(csv_path)["2020"][0] == 8500.5
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write(CSV.replace("8500.5", "9000.25"))
+    assert dataset(csv_path)["2020"][0] == 9000.25
+
+
+def test_unreadable_index_is_rebuilt(csv_path):
+    dataset(csv_path)
+    index = os.path.join(os.environ["MANIM_DATASET_CACHE"], "index.json")
+    with open(index, "w", encoding="utf-8") as f:
+        f.write('{"half written')
+    assert dataset(csv_path)["2021"][2] == 16300
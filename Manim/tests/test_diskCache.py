@@ -0,0 +1,55 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from diskCache import file_hash, function_key, save_array, save_json
+
+SCALE = 2
+
+
+def scaled(u, v):
+    return np.array([SCALE * u, v, 0 * u])
+
+
+def calls_scaled(u, v):
+    return scaled(u, v) + 1
+
+
+def power(n):
+    return lambda x: x ** n
+
+
+def test_function_key_follows_globals(monkeypatch):
+    before = function_key(scaled), function_key(calls_scaled)
+    assert before == (function_key(scaled), function_key(calls_scaled))
+    monkeypatch.setitem(globals(), "SCALE", 3)
+    assert function_key(scaled) != before[0]
+    # also through a function that reads the one that changed
+    assert function_key(calls_scaled) != before[1]
+
+
+def test_function_key_follows_closures_and_defaults():
+    assert function_key(power(2)) != function_key(power(3))
+    assert function_key(power(2)) == function_key(power(2))
+    assert function_key(lambda x, a=np.arange(2000): a) != function_key(lambda x, a=np.arange(1, 2001): a)
+
+
+def test_no_key_for_values_without_a_stable_description():
+    thing = object()
+    assert function_key(lambda x: thing) is None
+    assert function_key(lambda x, t=thing: x) is None
+
+
+def test_atomic_writes(tmp_path):
+    target = str(tmp_path / "a.npy")
+    save_array(target, np.arange(3))
+    save_json(str(tmp_path / "a.json"), {"a": 1})
+    assert sorted(os.listdir(tmp_path)) == ["a.json", "a.npy"]
+    assert np.load(target).tolist() == [0, 1, 2]
+    assert file_hash(target) == file_hash(target) != file_hash(str(tmp_path / "a.json"))
@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+Image = pytest.importorskip("PIL.Image")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from imageCache import level_sizes, load_level, pick_level
+
+
+def test_level_sizes_halve_down_to_the_minimum():
+    assert level_sizes(1000, 500) == [(1000, 500), (500, 250), (250, 125), (125, 62)]
+    assert level_sizes(100, 50) == [(100, 50)]
+
+
+def test_pick_level_covers_the_target_height():
+    # heights 2000, 1000, 500, 250, 125, 62
+    assert pick_level(4000, 2000, 2160) == 0
+    assert pick_level(4000, 2000, 1080) == 0
+    assert pick_level(4000, 2000, 1000) == 1
+    assert pick_level(4000, 2000, 480) == 2
+    assert pick_level(4000, 2000, 1) == 5
+
+
+def test_load_level_writes_and_reads_the_pyramid(tmp_path, monkeypatch):
+    monkeypatch.setenv("MANIM_IMAGE_CACHE", str(tmp_path / "cache"))
+    path = tmp_path / "image.png"
+    Image.fromarray(np.random.default_rng(0).integers(0, 255, (400, 600, 3), dtype=np.uint8)).save(path)
+
+    pixels = load_level(str(path), 150)
+    assert pixels.shape == (200, 300, 4)
+    assert len(os.listdir(tmp_path / "cache")) == len(level_sizes(600, 400))
+    assert load_level(str(path), 400).shape == (400, 600, 4)
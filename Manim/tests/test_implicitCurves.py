@@ -0,0 +1,50 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from implicitCurves import implicit_contour, marching_segments, quadtree_leaves
+
+
+def circle(x, y):
+    return x ** 2 + y ** 2 - 1
+
+
+def test_leaves_cover_the_circle_only():
+    origins, sizes, corners = quadtree_leaves(circle, (-2, 2), (-2, 2), (8, 8), 1e-3, 8)
+    assert len(origins) > 0
+    # every leaf has a sign change, and its center is close to the circle
+    assert ((corners > 0).any(axis=1) & (corners <= 0).any(axis=1)).all()
+    centers = origins + sizes / 2
+    assert (np.abs(np.linalg.norm(centers, axis=1) - 1) <= np.linalg.norm(sizes, axis=1)).all()
+    segments = marching_segments(circle, origins, sizes, corners)
+    assert np.allclose(np.linalg.norm(segments, axis=2), 1, atol=1e-9)
+
+
+def test_circle_is_one_closed_polyline(tmp_path, monkeypatch):
+    monkeypatch.setattr("manim.config.media_dir", str(tmp_path))
+    curves = implicit_contour(circle, (-2, 2), (-2, 2), resolution=(8, 8), tolerance=1e-3)
+    assert len(curves) == 1
+    curve = curves[0]
+    assert np.allclose(curve[0], curve[-1])
+    assert np.allclose(np.linalg.norm(curve, axis=1), 1, atol=1e-9)
+    # straight pieces within the tolerance of the arc they replace
+    chords = np.linalg.norm(np.diff(curve, axis=0), axis=1)
+    assert (1 - np.sqrt(1 - (chords / 2) ** 2)).max() < 2e-3
+    # the whole circle, once
+    angles = np.unwrap(np.arctan2(curve[:, 1], curve[:, 0]))
+    assert abs(angles[-1] - angles[0]) == pytest.approx(2 * np.pi)
+    assert len(os.listdir(tmp_path / "implicit_cache")) == 1
+
+
+def test_no_cache_without_a_stable_key(tmp_path, monkeypatch):
+    monkeypatch.setattr("manim.config.media_dir", str(tmp_path))
+    thing = object()
+    curves = implicit_contour(lambda x, y: circle(x, y) + 0 * id(thing), (-2, 2), (-2, 2), resolution=(8, 8))
+    assert len(curves) == 1
+    assert not os.path.exists(tmp_path / "implicit_cache")
@@ -0,0 +1,40 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("networkx")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "clases", "ejemplos_aplicados"))
+
+import numpy as np
+
+from largeGraph import grid_repulsion, pairwise_repulsion
+
+
+# error of every node's force, relative to the typical force (nodes near
+# the middle of the layout feel almost nothing)
+def relative_errors(positions):
+    exact = pairwise_repulsion(positions)
+    approx = grid_repulsion(positions)
+    return np.linalg.norm(approx - exact, axis=1) / np.median(np.linalg.norm(exact, axis=1))
+
+
+def test_grid_repulsion_uniform():
+    rng = np.random.default_rng(0)
+    n = 1500
+    errors = relative_errors(rng.uniform(-0.5, 0.5, (n, 2)) * np.sqrt(n))
+    assert np.median(errors) < 0.01
+    assert errors.max() < 0.05
+
+
+def test_grid_repulsion_clustered():
+    # a few tight clusters far apart, most leaves are empty and a handful
+    # hold hundreds of nodes
+    rng = np.random.default_rng(0)
+    n = 1500
+    centers = rng.uniform(-1, 1, (5, 2)) * np.sqrt(n)
+    positions = centers[rng.integers(0, 5, n)] + rng.normal(0, 0.05, (n, 2))
+    errors = relative_errors(positions)
+    assert np.median(errors) < 0.01
+    assert errors.max() < 0.05
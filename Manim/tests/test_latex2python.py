@@ -0,0 +1,173 @@
+import os
+import sys
+import json
+from argparse import Namespace
+
+import pytest
+
+pytest.importorskip("numpy")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from latex2python import (
+    convert,
+    legacyConvert,
+    newtonStep,
+    parse,
+    runBatch,
+    tangentLines,
+    texDerivative,
+    texFunction,
+    tokenize,
+)
+
+
+# expressions the regex pipeline already converted correctly
+legacy_cases = [
+    r"x^2",
+    r"\frac{1}{x}",
+    r"\frac12",
+    r"\sin(x)+\cos(x)",
+    r"2x^{3}-5x",
+    r"\sqrt{x}",
+    r"\log_{2}(x)",
+    r"\pi x",
+    r"e^{-x^2}",
+    r"\left|x\right|",
+    r"3\cdot x",
+    r"\tan(x)\div 2",
+    r"\ln(x)",
+    r"x_1+x_{12}",
+]
+
+
+@pytest.mark.parametrize("s", legacy_cases)
+def test_convert_matches_legacy(s):
+    assert convert(s) == legacyConvert(s)
+
+
+def test_tokenize_splits_glued_commands():
+    # \pix is \pi followed by x, as the regex replacement read it
+    assert [tok[:2] for tok in tokenize(r"2\pix")] == [("num", "2"), ("cmd", r"\pi"), ("var", "x"), ("end", "")]
+
+
+def test_parse_precedence():
+    tree = parse(r"x^2+1")
+    assert tree.kind == "sum"
+    assert [child.kind for child in tree.args] == ["pow", "num"]
+
+
+def test_powers_of_functions():
+    # the regex pipeline produced np.sin**2*x here
+    assert convert(r"\sin^2(x)") == "np.sin(x)**2"
+
+
+@pytest.mark.parametrize("s", ["x+", "(x", "$x", r"\frac{1}"])
+def test_malformed_input_raises_value_error(s):
+    with pytest.raises(ValueError):
+        convert(s)
+
+
+def test_tex_function_is_vectorized():
+    f = texFunction(r"\frac{k}{x} + \sin(x)", k=25)
+    xs = np.linspace(1, 10, 100)
+    assert np.allclose(f(xs), 25 / xs + np.sin(xs))
+
+
+def test_tex_function_is_cached():
+    # the same expression written with other spacing or as a full label
+    f = texFunction(r"x^{2} + 1")
+    assert texFunction(r"x^{2}+1") is f
+    assert texFunction(r"f(x) = x^{2} + 1") is f
+    assert texFunction(r"a x", a=1) is not texFunction(r"a x", a=2)
+
+
+def test_constant_expression_keeps_the_input_shape():
+    f = texFunction(r"2\pi")
+    assert f(np.zeros((3, 4))).shape == (3, 4)
+
+
+def test_unbound_symbols_raise():
+    with pytest.raises(ValueError, match="unbound"):
+        texFunction(r"a x^2")
+    assert texFunction(r"a x^2", a=3)(2) == 12
+
+
+batch = [r"x^{%d}" % k if k % 7 else "x+" for k in range(50)] + ["", r"\sqrt{x}"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_keeps_order_and_reports_each_error(tmp_path, workers):
+    source = tmp_path / "exprs.txt"
+    source.write_text("\n".join(batch) + "\n", encoding="utf-8")
+    target = tmp_path / "out.txt"
+    runBatch(Namespace(input=str(source), output=str(target), format="auto", workers=workers, chunksize=4))
+    results = target.read_text(encoding="utf-8").splitlines()
+    assert len(results) == len(batch)
+    for expr, result in zip(batch, results):
+        if expr == "x+":
+            assert result.startswith("error: ")
+        elif expr:
+            assert result == convert(expr)
+        else:
+            assert result == ""
+
+
+def test_run_batch_jsonl(tmp_path):
+    source = tmp_path / "exprs.jsonl"
+    source.write_text('{"expr": "x^2"}\n"\\\\frac12"\nnot json\n{"expr": "(x"}\n', encoding="utf-8")
+    target = tmp_path / "out.jsonl"
+    runBatch(Namespace(input=str(source), output=str(target), format="auto", workers=1, chunksize=256))
+    results = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert results[0] == {"expr": "x^2", "result": "x**2"}
+    assert results[1] == {"expr": r"\frac12", "result": "(1/2)"}
+    assert results[2]["input"] == "not json" and "invalid input" in results[2]["error"]
+    assert results[3]["expr"] == "(x" and "bracket" in results[3]["error"]
+
+
+derivative_cases = [
+    r"x^2 + 3x^3",
+    r"\frac{1}{x}",
+    r"\sin(x)\cos(x)",
+    r"\sin^2(x)",
+    r"e^{-x^2}",
+    r"\sqrt{x}",
+    r"\ln(x)",
+    r"\log_{2}(x)",
+    r"\tan(x)",
+    r"\arctan(x)",
+    r"\frac{x}{1+x^2}",
+    r"x^x",
+]
+
+
+@pytest.mark.parametrize("s", derivative_cases)
+def test_derivative_matches_finite_differences(s):
+    f = texFunction(s)
+    df = texDerivative(s)
+    xs = np.linspace(0.2, 1.3, 25)
+    h = 1e-6
+    assert np.allclose(df(xs), (f(xs + h) - f(xs - h)) / (2 * h), rtol=1e-5, atol=1e-6)
+
+
+def test_partial_derivative():
+    df = texDerivative(r"x^2 y + \sin(y)", variables=("x", "y"), wrt="y")
+    assert np.allclose(df(2.0, np.array([0.0, 1.0])), 4 + np.cos([0.0, 1.0]))
+
+
+def test_tangent_lines():
+    x0 = np.linspace(-1, 2, 7)
+    slope, intercept = tangentLines(r"x^3 - x", x0)
+    h = 1e-6
+    f = texFunction(r"x^3 - x")
+    assert np.allclose(slope, (f(x0 + h) - f(x0 - h)) / (2 * h), atol=1e-6)
+    assert np.allclose(slope * x0 + intercept, f(x0))
+
+
+def test_newton_step_converges():
+    x = np.array([1.0, 3.0])
+    step = newtonStep(r"x^2 - 2")
+    for _ in range(8):
+        x = step(x)
+    assert np.allclose(x, np.sqrt(2))
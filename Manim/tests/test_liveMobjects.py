@@ -0,0 +1,104 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+from manim import Mobject
+
+from liveMobjects import GrowingPath, LiveGraph, RiemannSum, RunParameter
+
+
+# 100 steps of 0.03 along x: each one is under min_distance, but every
+# fourth point is 0.12 past the last kept one
+steps = np.outer(np.arange(1, 101) * 0.03, [1, 0, 0])
+
+
+def test_short_steps_add_up():
+    path = GrowingPath(min_distance=0.1)
+    path.append_points(steps)
+    assert path.get_last_point()[0] == pytest.approx(3)
+    assert len(path.points) == 4 * (1 + 25)
+
+
+def test_short_steps_across_calls():
+    path = GrowingPath(min_distance=0.1)
+    for point in steps:
+        path.append_point(point)
+    assert path.get_last_point()[0] == pytest.approx(3)
+    ends = path.points[3::4]
+    assert (np.linalg.norm(np.diff(ends, axis=0), axis=1) > 0.1).all()
+
+
+def test_live_graph_on_log_axes(log_axes):
+    graph = LiveGraph(log_axes, lambda x: 10 ** (x / 5), x_range=[0, 10, 1])
+    anchors = graph.points[::4]
+    expected = [log_axes.c2p(x, 10 ** (x / 5)) for x in range(10)]
+    assert np.allclose(anchors, expected)
+
+
+class Counter(Mobject):
+    def __init__(self):
+        super().__init__()
+        self.count = 2
+
+
+class RunCounter(RunParameter):
+    def last_value(self, counter):
+        return 10
+
+    def get_value(self):
+        return self.mobject.count
+
+    def set_value(self, count):
+        self.mobject.count = count
+
+
+def test_run_parameter_goes_from_current_value():
+    counter = Counter()
+    run = RunCounter(counter)
+    run.begin()
+    run.interpolate(0.5)
+    assert counter.count == pytest.approx(6)
+    run = RunCounter(counter, to=0)
+    run.begin()
+    run.interpolate(1)
+    assert counter.count == 0
+
+
+def riemann_tops(riemann_sum, axes):
+    # (left x, height) of every rectangle, read back from the band points
+    points = np.concatenate([band.points.reshape(-1, 16, 3) for band in riemann_sum.submobjects])
+    top_left = points[:, 12]
+    return np.stack([(top_left[:, 0] + 3) / 0.5, (top_left[:, 1] + 1) / 2], axis=1)
+
+
+@pytest.mark.parametrize("sample, offset", [("left", 0), ("right", 0.5), ("center", 0.25)])
+def test_riemann_heights(linear_axes, sample, offset):
+    riemann_sum = RiemannSum(linear_axes, lambda x: x ** 2, x_range=[0, 4], dx=0.5, input_sample_type=sample)
+    lefts, heights = riemann_tops(riemann_sum, linear_axes).T
+    order = np.argsort(lefts)
+    assert np.allclose(lefts[order], np.arange(0, 4, 0.5))
+    assert np.allclose(heights[order], (lefts[order] + offset) ** 2)
+
+
+def test_riemann_bands(linear_axes):
+    riemann_sum = RiemannSum(linear_axes, lambda x: x - 5, x_range=[0, 10], dx=0.1, color_bands=4)
+    assert len(riemann_sum.submobjects) == 8
+    counts = [len(band.points) // 16 for band in riemann_sum.submobjects]
+    # 100 rectangles, the 50 left of x = 5 negative and in the inverted bands
+    assert sum(counts) == 100
+    assert sum(counts[4:]) == 50
+    for band in riemann_sum.submobjects[:4]:
+        assert (band.points[:, 1] >= linear_axes.c2p(0, 0)[1] - 1e-9).all()
+
+
+def test_riemann_morph_repeats_coarse_heights(linear_axes):
+    riemann_sum = RiemannSum(linear_axes, lambda x: x, x_range=[0, 4], dx=1)
+    lefts, width, start, end = riemann_sum.morph_heights(1, 0.5)
+    assert width == 0.5
+    assert np.allclose(start, np.floor(lefts))
+    assert np.allclose(end, lefts)
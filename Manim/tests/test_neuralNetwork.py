@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "clases", "ejemplos_aplicados"))
+
+import numpy as np
+
+from neuralNetwork import EdgeBundle
+
+starts = np.array([[0, 0, 0], [0, 1, 0], [0, 2, 0]], dtype=float)
+ends = starts + [1, 0, 0]
+
+
+def test_styles_regroup_when_set():
+    bundle = EdgeBundle(starts, ends)
+    assert len(bundle.submobjects) == 1
+    bundle.set_edge_style([0, 2], color="#FF0000")
+    assert sorted(len(slots) for slots in bundle.edge_slots) == [1, 2]
+    assert len(bundle.submobjects) == 2
+
+
+def test_deferred_styles_leave_family_alone():
+    bundle = EdgeBundle(starts, ends)
+    bundle.set_edge_style(0, width=5, apply=False)
+    bundle.get_family()
+    assert len(bundle.submobjects) == 1
+    bundle.apply_edge_styles()
+    assert len(bundle.submobjects) == 2
+    lines, _ = bundle.get_edge_points()
+    assert np.allclose(lines[:, 0], starts)
+    assert np.allclose(lines[:, -1], ends)
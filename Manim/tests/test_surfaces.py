@@ -0,0 +1,69 @@
+import math
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+import numpy as np
+
+from surfaces import LODSurface, evaluate_grid, sphere_function
+
+us = np.linspace(0, 2 * np.pi, 7)
+vs = np.linspace(0, np.pi, 5)
+
+
+def expected(func):
+    return np.array([[np.asarray(func(u, v), dtype=float) for v in vs] for u in us])
+
+
+def test_vectorized_grid():
+    sphere = sphere_function(2)
+    points = evaluate_grid(sphere, us, vs)
+    assert points.shape == (7, 5, 3)
+    assert np.allclose(points, expected(sphere))
+    assert np.allclose(np.linalg.norm(points, axis=2), 2)
+
+
+def test_scalar_only_function_falls_back():
+    def scalar(u, v):
+        return np.array([math.cos(u), math.sin(v), u * v if u > v else 0])
+
+    assert np.allclose(evaluate_grid(scalar, us, vs), expected(scalar))
+
+
+def test_function_mixing_samples_falls_back():
+    # runs on arrays, but the norm is over the whole grid
+    def normalized(u, v):
+        p = np.array([u + 1, v + 1, 1.0 + 0 * u])
+        return p / np.linalg.norm(p)
+
+    assert np.allclose(evaluate_grid(normalized, us, vs), expected(normalized))
+
+
+# LODSurface with only the level of detail settings, no faces built
+def lod_settings(resolution=(24, 12), min_resolution=4, max_resolution=64):
+    surface = LODSurface.__new__(LODSurface)
+    resolution = np.array(resolution)
+    surface.aspect = resolution / resolution.max()
+    surface.min_resolution = min_resolution
+    surface.max_resolution = max_resolution
+    return surface
+
+
+def test_lod_levels_step_by_sqrt_2():
+    surface = lod_settings()
+    assert surface.level(4) == pytest.approx(0)
+    assert surface.level(8) == pytest.approx(2)
+    assert surface.level(4 * math.sqrt(2)) == pytest.approx(1)
+
+
+def test_lod_resolution_keeps_aspect_and_limits():
+    surface = lod_settings()
+    assert surface.resolution_for(surface.level(32)) == (32, 16)
+    # rounded to the nearest level: 30 faces is level 5.8, the level of 32
+    assert surface.resolution_for(surface.level(30)) == (32, 16)
+    assert surface.resolution_for(surface.level(1000)) == (64, 64)
+    assert surface.resolution_for(surface.level(1)) == (4, 4)
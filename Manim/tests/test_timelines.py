@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("manim")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "extra"))
+
+from manim import UP, Dot, ValueTracker
+from timelines import TrackerTimeline
+
+
+def test_bound_mobjects_are_animated():
+    t = ValueTracker(0)
+    dot = Dot()
+    label = Dot()
+    timeline = TrackerTimeline(t)
+    timeline.bind_position(dot, lambda xs: [[x, 0, 0] for x in xs])
+    timeline.bind_position(label, lambda xs: [[x, 1, 0] for x in xs])
+    timeline.bind_value(t)
+    timeline.to(2).to(-1)
+
+    for segment in timeline.compile(frame_rate=15):
+        family = segment.mobject.get_family()
+        assert any(m is t for m in family)
+        assert any(m is dot for m in family)
+        assert any(m is label for m in family)
+        segment.interpolate_mobject(1)
+
+    assert t.get_value() == pytest.approx(-1)
+    assert dot.get_center()[0] == pytest.approx(-1)
+
+
+def test_bound_mobject_updaters_keep_running():
+    t = ValueTracker(0)
+    dot = Dot()
+    label = Dot()
+    label.add_updater(lambda m: m.next_to(dot, UP))
+    timeline = TrackerTimeline(t)
+    timeline.bind_position(dot, lambda xs: [[x, 0, 0] for x in xs])
+    timeline.bind(label, lambda xs: xs, lambda mob, value: None)
+    timeline.to(2)
+
+    segment, = timeline.compile(frame_rate=15)
+    segment.begin()
+    assert not dot.updating_suspended
+    assert not label.updating_suspended
+    segment.interpolate(1)
+    # what the scene does after every frame
+    label.update(0)
+    assert label.get_center()[0] == pytest.approx(2)
+    assert label.get_center()[1] > dot.get_center()[1]